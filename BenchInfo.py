@@ -0,0 +1,246 @@
+# Example:
+# python BenchInfo.py --ReadFilePath  ./SyntheticLogs/
+#                     --EncoderName   HM VTM VVENC X265
+#                     --LogLevel      1 2
+#                     --WriteFileType .log .txt .csv .xlsx
+#                     --ResultFile    ./bench.json
+#                     --CompareFile   ./bench_before.json
+#
+# Measures Files/sec, MB/sec and Peak RSS of Each Stage of GetInfo.py ( traverse , read , sort , write ) on Logs
+# under ReadFilePath/EncoderName/, Logs are Generated by GenLogs.py first if ReadFilePath Holds none
+# Each Stage Runs in a Fresh Process, so its Peak RSS is not Inflated by Earlier Stages
+# Stages of Text Files Importing a Module only Needed for Spreadsheet or Columnar Files are Reported on stderr
+
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import GenLogs
+import GetInfo
+
+def parse_args() :
+    '''
+    Parse Args of BenchInfo.py
+    :return args : Dict < ArgName : ArgValue >
+    '''
+    parser = argparse.ArgumentParser( description='Benchmark of Each Stage of GetInfo.py' )
+    parser.add_argument('--ReadFilePath',
+                        type=str,
+                        default='./SyntheticLogs/',
+                        help='Path of Logs, One Directory per Encoder, Generated by GenLogs.py if Missing',
+                        required=False,
+                        )
+    parser.add_argument('--EncoderName',
+                        type=str,
+                        nargs='+',
+                        default=[ 'HM' , 'VTM' , 'VVENC' , 'X265' ],
+                        choices=list( GetInfo.encoderFileTypeDict ),
+                        help='Names of Encoders whose Logs are Benchmarked',
+                        required=False,
+                        )
+    parser.add_argument('--LogLevel',
+                        type=int,
+                        nargs='+',
+                        default=[ 1 , 2 ],
+                        help='Log Levels Benchmarked',
+                        required=False,
+                        )
+    parser.add_argument('--WriteFileType',
+                        type=str,
+                        nargs='+',
+                        default=[ '.log' , '.txt' , '.csv' ],
+                        choices=list( GetInfo.write_information_filetype ),
+                        help='Types of Result File Benchmarked',
+                        required=False,
+                        )
+    parser.add_argument('--CtcType',
+                        type=str,
+                        default='VVC',
+                        help='CTC Type Used to Sort and to Generate Logs',
+                        required=False,
+                        )
+    parser.add_argument('--Jobs',
+                        type=int,
+                        default=1,
+                        help='Number of Worker Processes of the Read Stage, 0 for All CPUs',
+                        required=False,
+                        )
+    parser.add_argument('--Repeat',
+                        type=int,
+                        default=3,
+                        help='Number of Runs of Each Stage, the Fastest is Kept',
+                        required=False,
+                        )
+    parser.add_argument('--FrameCount',
+                        type=int,
+                        default=65,
+                        help='Number of Frames in Each Generated Log',
+                        required=False,
+                        )
+    parser.add_argument('--Verbosity',
+                        type=int,
+                        default=1,
+                        help='Detail of Generated Logs, as GenLogs.py --Verbosity',
+                        required=False,
+                        )
+    parser.add_argument('--SubDirectoryCount',
+                        type=int,
+                        default=4,
+                        help='Number of Sub-Directories of Generated Logs of Each Encoder',
+                        required=False,
+                        )
+    parser.add_argument('--ResultFile',
+                        type=str,
+                        default='./bench.json',
+                        help='JSON File of BenchInfo.py to Write Results',
+                        required=False,
+                        )
+    parser.add_argument('--CompareFile',
+                        type=str,
+                        default='',
+                        help='JSON File of an Earlier Run to Compare Results with',
+                        required=False,
+                        )
+    return parser.parse_args()
+
+def generate_missing_logs( args ) :
+    '''
+    Generate Logs with GenLogs.py for Encoders in args.EncoderName without a Directory under args.ReadFilePath
+    '''
+    for encType in args.EncoderName :
+        if os.path.exists( os.path.join( args.ReadFilePath , encType ) ) :
+            continue
+        genArgs = argparse.Namespace( EncoderName=[ encType ] , WriteFilePath=args.ReadFilePath , CtcType=args.CtcType , QPList=[ 22 , 27 , 32 , 37 ] ,
+                                      FrameCount=args.FrameCount , Verbosity=args.Verbosity , TraceLines=8 ,
+                                      SubDirectoryCount=args.SubDirectoryCount , Seed=0 )
+        GenLogs.generate_logs( genArgs )
+
+def peak_rss() :
+    '''
+    Peak Resident Set Size of this Process in KB
+    '''
+    return resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+
+# Modules GetInfo.py Imports only for Spreadsheet and Columnar Files , Rollup and bdrate , and the Stages that must Run without them
+heavyModuleList = [ 'pandas' , 'openpyxl' , 'numpy' , 'pyarrow' ]
+lightStageList  = [ 'traverse' , 'read' , 'sort' , '.log' , '.txt' , '.csv' ]
+
+def heavy_imports( Stage ) :
+    '''
+    Heavy Modules Imported by this Process although Stage is a Light Stage
+    :return heavyModules : [ Module1 , ... ]
+    '''
+    if Stage not in lightStageList :
+        return []
+    return [ module for module in heavyModuleList if module in sys.modules ]
+
+def run_stage( Stage , EncType , LogLevel , args , ResultQueue ) :
+    '''
+    Run the Stages of GetInfo.py up to Stage on Logs of EncType, Timing Stage only, the Fastest of args.Repeat Runs
+    Put ( Seconds , Peak RSS before Stage , Peak RSS after Stage , Bytes Written , Heavy Modules Imported by a Light Stage ) into ResultQueue
+    '''
+    readFilePath = os.path.join( args.ReadFilePath , EncType )
+    readFileType = GetInfo.encoderFileTypeDict[EncType]
+    writeFilePath = tempfile.mkdtemp( prefix='BenchInfo' ) + '/'
+    stageList = [ 'traverse' , 'read' , 'sort' ]
+    lastStage = stageList.index( Stage ) if Stage in stageList else len( stageList )
+    targetFileList = GetInfo.traverse_files( readFilePath , readFileType ) if lastStage > 0 else None
+    encInfoList    = GetInfo.read_information( targetFileList , EncType , LogLevel , args.Jobs ) if lastStage > 1 else None
+    if lastStage > 2 :
+        encInfoList = GetInfo.sort_sequence( GetInfo.delete_nonsequence( encInfoList ) , args.CtcType )
+    rssBefore = peak_rss()
+    seconds   = None
+    for repeat in range( args.Repeat ) :
+        startTime = time.perf_counter()
+        if Stage == 'traverse' :
+            GetInfo.traverse_files( readFilePath , readFileType )
+        elif Stage == 'read' :
+            GetInfo.read_information( targetFileList , EncType , LogLevel , args.Jobs )
+        elif Stage == 'sort' :
+            GetInfo.sort_sequence( GetInfo.delete_nonsequence( encInfoList ) , args.CtcType )
+        else :
+            GetInfo.write_information( encInfoList , writeFilePath , Stage , 'result' , LogLevel )
+        stageTime = time.perf_counter() - startTime
+        seconds   = stageTime if seconds is None else min( seconds , stageTime )
+    writeBytes = sum( os.path.getsize( os.path.join( writeFilePath , fileName ) ) for fileName in os.listdir( writeFilePath ) )
+    shutil.rmtree( writeFilePath )
+    ResultQueue.put( ( seconds , rssBefore , peak_rss() , writeBytes , heavy_imports( Stage ) ) )
+
+def bench_stage( Stage , EncType , LogLevel , args , FileCount , ByteCount ) :
+    '''
+    Run Stage in a Fresh Process
+    :return result : Dict < Key : Value > of Stage
+    '''
+    context     = multiprocessing.get_context( 'spawn' )
+    resultQueue = context.Queue()
+    process     = context.Process( target=run_stage , args=( Stage , EncType , LogLevel , args , resultQueue ) )
+    process.start()
+    seconds , rssBefore , rssAfter , writeBytes , heavyModules = resultQueue.get()
+    process.join()
+    if heavyModules :
+        print( 'BenchInfo.py: %s Stage of %s Imported Heavy Module %s' %( Stage , EncType , ' , '.join( heavyModules ) ) , file=sys.stderr )
+    return { 'encoder'     : EncType ,
+             'loglevel'    : LogLevel ,
+             'stage'       : Stage ,
+             'files'       : FileCount ,
+             'bytes'       : ByteCount ,
+             'seconds'     : seconds ,
+             'filesPerSec' : FileCount / seconds if seconds else None ,
+             'mbPerSec'    : ByteCount / seconds / ( 1 << 20 ) if seconds else None ,
+             'peakRssKB'   : rssAfter ,
+             'stageRssKB'  : rssAfter - rssBefore ,
+             'writeBytes'  : writeBytes ,
+             'heavyModules': heavyModules }
+
+def result_key( Result ) :
+    return ( Result['encoder'] , Result['loglevel'] , Result['stage'] )
+
+def print_results( ResultList , CompareList ) :
+    '''
+    Print ResultList as a Table, with the Speedup over the Same Stage in CompareList if Given
+    '''
+    compareDict = { result_key( result ) : result for result in CompareList }
+    print( "%-7s \t%-8s \t%-9s \t%-11s \t%-9s \t%-11s \t%-11s \t%-7s " %( "Encoder" , "LogLevel" , "Stage" , "Files/sec" , "MB/sec" , "PeakRSS(KB)" , "StageRSS(KB)" , "Speedup" ) )
+    for result in ResultList :
+        compare = compareDict.get( result_key( result ) )
+        speedup = '%.2fx' %( compare['seconds'] / result['seconds'] ) if compare and result['seconds'] else ''
+        print( "%-7s \t%-8d \t%-9s \t%-11.1f \t%-9.2f \t%-11d \t%-11d \t%-7s " %( result['encoder'] , result['loglevel'] , result['stage'] , result['filesPerSec'] or 0 ,
+                                                                                 result['mbPerSec'] or 0 , result['peakRssKB'] , result['stageRssKB'] , speedup ) )
+
+def main():
+    args = parse_args()
+    generate_missing_logs( args )
+    resultList = []
+    for encType in args.EncoderName :
+        targetFileList = GetInfo.traverse_files( os.path.join( args.ReadFilePath , encType ) , GetInfo.encoderFileTypeDict[encType] )
+        byteCount      = sum( os.path.getsize( targetFile ) for targetFile in targetFileList )
+        for logLevel in args.LogLevel :
+            stageList = ( [ 'traverse' ] if logLevel == args.LogLevel[0] else [] ) + [ 'read' , 'sort' ] + args.WriteFileType
+            for stage in stageList :
+                resultList.append( bench_stage( stage , encType , logLevel , args , len( targetFileList ) , byteCount ) )
+    compareList = []
+    if args.CompareFile :
+        with open( args.CompareFile , 'r' ) as fileHandle :
+            compareList = json.load( fileHandle )['results']
+    print_results( resultList , compareList )
+    with open( args.ResultFile , 'w' ) as fileHandle :
+        json.dump( { 'python'   : sys.version ,
+                     'platform' : platform.platform() ,
+                     'time'     : time.strftime( '%Y-%m-%d %H:%M:%S' ) ,
+                     'args'     : vars( args ) ,
+                     'results'  : resultList } , fileHandle , indent=1 )
+    # a light stage pulling in a heavy module is a regression , failing the run after the results are kept
+    if any( result['heavyModules'] for result in resultList ) :
+        sys.exit( 1 )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+# Example:
+# python GenLogs.py --EncoderName  HM VTM VVENC X265
+#                   --WriteFilePath ./SyntheticLogs/
+#                   --CtcType      VVC
+#                   --QPList       22 27 32 37
+#                   --FrameCount   65
+#                   --Verbosity    2
+#
+# Writes Synthetic Encoder Logs Readable by GetInfo.py under WriteFilePath/EncoderName/,
+# One File per Sequence and QP, Named and Laid out as Real Encoder Runs are
+
+
+import argparse
+import os
+import random
+
+from GetInfo import ctcvideoDict , encoderFileTypeDict
+
+def parse_args() :
+    '''
+    Parse Args of GenLogs.py
+    :return args : Dict < ArgName : ArgValue >
+    '''
+    parser = argparse.ArgumentParser( description='Synthetic Encoder Log Generator for GetInfo.py' )
+    parser.add_argument('--EncoderName',
+                        type=str,
+                        nargs='+',
+                        default=[ 'HM' ],
+                        choices=list( encoderFileTypeDict ),
+                        help='Names of Encoders whose Logs GenLogs.py Writes',
+                        required=False,
+                        )
+    parser.add_argument('--WriteFilePath',
+                        type=str,
+                        default='./',
+                        help='Path of GenLogs.py to Write Logs, One Directory per Encoder',
+                        required=True,
+                        )
+    parser.add_argument('--CtcType',
+                        type=str,
+                        default='VVC',
+                        choices=list( ctcvideoDict ),
+                        help='CTC Type whose Video List Names the Sequences',
+                        required=False,
+                        )
+    parser.add_argument('--QPList',
+                        type=int,
+                        nargs='+',
+                        default=[ 22 , 27 , 32 , 37 ],
+                        help='QPs of Each Sequence',
+                        required=False,
+                        )
+    parser.add_argument('--FrameCount',
+                        type=int,
+                        default=33,
+                        help='Number of Frames in Each Log',
+                        required=False,
+                        )
+    parser.add_argument('--Verbosity',
+                        type=int,
+                        default=1,
+                        choices=[ 0 , 1 , 2 ],
+                        help='Detail of Logs, 0 for Summary Only, 1 for Per-Frame Lines, 2 for Per-Frame Lines with Encoder Trace Lines',
+                        required=False,
+                        )
+    parser.add_argument('--TraceLines',
+                        type=int,
+                        default=8,
+                        help='Number of Trace Lines Written after Each Frame at Verbosity 2',
+                        required=False,
+                        )
+    parser.add_argument('--SubDirectoryCount',
+                        type=int,
+                        default=1,
+                        help='Number of Sub-Directories the Logs of Each Encoder are Spread over',
+                        required=False,
+                        )
+    parser.add_argument('--Seed',
+                        type=int,
+                        default=0,
+                        help='Seed of the Random Numbers in Logs',
+                        required=False,
+                        )
+    return parser.parse_args()
+
+# Frame Line of Each Encoder, POC , Frame Type , QP , Bits , Y , U , V PSNR , Gradient
+frameLineDict = {
+    'HM'    : "POC %4d TId: 0 ( %s, nQP %d QP %d ) %10d bits [Y %.4f dB    U %.4f dB    V %.4f dB] [ET %5d ] [L0 ] [L1 ] Gradient %.4f Avg %.4f\n" ,
+    'VTM'   : "POC %4d LId:  0 TId: 0 ( %s, %s, QP %d ) %10d bits [Y %.4f dB    U %.4f dB    V %.4f dB] [ET %5d ] [L0] [L1] Gradient %.4f Avg %.4f\n" ,
+    'VVENC' : "POC %4d TId: 0 ( %s, %s, QP %d) %10d bits [Y %.4f dB    U %.4f dB    V %.4f dB] [ET %5d ] [L0] [L1]\n" ,
+}
+
+# Banner on the First Line of Each Encoder's Log , as the Real Encoder Prints it
+bannerDict = {
+    'HM'    : "HM software: Encoder Version [0.0]" ,
+    'VTM'   : "VVCSoftware: VTM Encoder Version 0.0" ,
+    'VVENC' : "VVENC software: Encoder Version [0.0]" ,
+}
+
+nalTypeDict = {
+    'I-SLICE' : 'IDR_N_LP' ,
+    'P-SLICE' : 'TRAIL'    ,
+    'B-SLICE' : 'TRAIL'    ,
+}
+
+def frame_values( Random , QP , Index ) :
+    '''
+    Random Values of One Frame, Intra First, Higher QP and Fewer Bits for Later Frames of a GOP of 8
+    :return ( frameType , qp , bits , yPsnr , uPsnr , vPsnr , gradient )
+    '''
+    if Index == 0 :
+        frameType , qp = 'I-SLICE' , QP
+    else :
+        frameType , qp = Random.choice( [ 'B-SLICE' , 'B-SLICE' , 'B-SLICE' , 'P-SLICE' ] ) , QP + 1 + ( Index % 8 ).bit_length()
+    bits  = int( Random.uniform( 0.5 , 1.5 ) * 2 ** ( ( 51 - qp ) / 6 ) * ( 4000 if Index == 0 else 600 ) )
+    yPsnr = 58 - 0.6 * qp + Random.uniform( -1 , 1 )
+    return frameType , qp , bits , yPsnr , yPsnr + Random.uniform( 1 , 4 ) , yPsnr + Random.uniform( 1 , 4 ) , Random.uniform( 0 , 20 )
+
+def write_log( TargetFile , EncType , SeqName , QP , args , Random ) :
+    '''
+    Write a Synthetic HM / VTM / VVENC Log of SeqName at QP to TargetFile
+    '''
+    lineList = [ "%s [Linux][GCC 9.4.0][64 bit] [SIMD=AVX2]\n\n" %bannerDict[EncType] ,
+                 "Input          File                    : %s.yuv\n" %SeqName ,
+                 "Bitstream      File                    : %s_%d.bin\n" %( SeqName , QP ) ,
+                 "Frame index                            : 0 - %d (%d frames)\n" %( args.FrameCount - 1 , args.FrameCount ) ,
+                 "QP                                     : %d\n\n" %QP ]
+    frameList = [ frame_values( Random , QP , index ) for index in range( args.FrameCount ) ]
+    if args.Verbosity > 0 :
+        for index , ( frameType , qp , bits , yPsnr , uPsnr , vPsnr , gradient ) in enumerate( frameList ) :
+            if EncType == 'HM' :
+                lineList.append( frameLineDict[EncType] %( index , frameType , qp , qp , bits , yPsnr , uPsnr , vPsnr , 1 , gradient , gradient / 2 ) )
+            elif EncType == 'VTM' :
+                lineList.append( frameLineDict[EncType] %( index , nalTypeDict[frameType] , frameType , qp , bits , yPsnr , uPsnr , vPsnr , 1 , gradient , gradient / 2 ) )
+            else :
+                lineList.append( frameLineDict[EncType] %( index , nalTypeDict[frameType] , frameType , qp , bits , yPsnr , uPsnr , vPsnr , 1 ) )
+            if args.Verbosity > 1 :
+                for line in range( args.TraceLines ) :
+                    lineList.append( "  [trace] ctu %5d depth %d split %d cost %12.2f dist %10d\n" %( line , line % 4 , line % 2 , Random.uniform( 0 , 1e6 ) , Random.randint( 0 , 1 << 20 ) ) )
+    for summaryTag , frameTypeList in ( ( 'a' , 'IPB' ) , ( 'i' , 'I' ) , ( 'p' , 'P' ) , ( 'b' , 'B' ) ) :
+        tagList = [ frame for frame in frameList if frame[0][0] in frameTypeList ]
+        count   = len( tagList ) or 1
+        lineList.append( "\n\nSUMMARY --------------------------------------------------------\n" )
+        lineList.append( "\tTotal Frames |   Bitrate     Y-PSNR    U-PSNR    V-PSNR    YUV-PSNR \n" )
+        yPsnr , uPsnr , vPsnr = [ sum( frame[column] for frame in tagList ) / count for column in ( 3 , 4 , 5 ) ]
+        lineList.append( "\t%9d    %s %12.4f  %8.4f  %8.4f  %8.4f  %8.4f\n" %( len( tagList ) , summaryTag , sum( frame[2] for frame in tagList ) / count * 0.03 ,
+                                                                            yPsnr , uPsnr , vPsnr , ( 6 * yPsnr + uPsnr + vPsnr ) / 8 ) )
+    lineList.append( "\n Total Time:     %9.3f sec.\n" %Random.uniform( 1 , 999 ) )
+    with open( TargetFile , 'w' ) as fileHandle :
+        fileHandle.write( ''.join( lineList ) )
+
+def write_csv( TargetFile , EncType , SeqName , QP , args , Random ) :
+    '''
+    Write a Synthetic x265 CSV Log of SeqName at QP to TargetFile
+    '''
+    lineList = [ "Encode Order, Type, POC, QP, Bits, Scenecut, RateFactor, Y PSNR, U PSNR, V PSNR, YUV PSNR, SSIM\n" ]
+    frameList = [ frame_values( Random , QP , index ) for index in range( args.FrameCount ) ]
+    if args.Verbosity > 0 :
+        for index , ( frameType , qp , bits , yPsnr , uPsnr , vPsnr , gradient ) in enumerate( frameList ) :
+            lineList.append( "%d, %s, %4d, %2.2f, %10d, %d, %.2f, %.3f, %.3f, %.3f, %.3f, %.5f\n" %( index , frameType , index , qp + Random.random() , bits , 0 , 28.0 ,
+                                                                                               yPsnr , uPsnr , vPsnr , ( 6 * yPsnr + uPsnr + vPsnr ) / 8 , Random.uniform( 0.9 , 1 ) ) )
+    yPsnr , uPsnr , vPsnr = [ sum( frame[column] for frame in frameList ) / len( frameList ) for column in ( 3 , 4 , 5 ) ]
+    lineList.append( "\nSummary\n" )
+    lineList.append( "Command, Date/Time, Elapsed Time, FPS, Bitrate, Y PSNR, U PSNR, V PSNR, Global PSNR, SSIM\n" )
+    lineList.append( "x265 --input %s.yuv --qp %d --csv-log-level 2, Mon Jan  1 00:00:00 2024, %.2f, %.2f, %.2f, %.3f, %.3f, %.3f, %.3f, %.5f\n" %(
+                     SeqName , QP , Random.uniform( 1 , 999 ) , Random.uniform( 1 , 60 ) , sum( frame[2] for frame in frameList ) / len( frameList ) * 0.03 ,
+                     yPsnr , uPsnr , vPsnr , ( 6 * yPsnr + uPsnr + vPsnr ) / 8 , Random.uniform( 0.9 , 1 ) ) )
+    with open( TargetFile , 'w' ) as fileHandle :
+        fileHandle.write( ''.join( lineList ) )
+
+write_log_enctype = {
+    'HM'    : write_log ,
+    'VTM'   : write_log ,
+    'VVENC' : write_log ,
+    'X265'  : write_csv ,
+}
+
+def generate_logs( args ) :
+    '''
+    Write Logs of Every Encoder in args.EncoderName for Every Sequence of args.CtcType and QP in args.QPList
+    :return targetFileList : [ TargetFile1 , ... , TargetFileN ]
+    '''
+    randomState = random.Random( args.Seed )
+    targetFileList = []
+    for encType in args.EncoderName :
+        for index , seqName in enumerate( ctcvideoDict.get( args.CtcType ) ) :
+            targetFilePath = os.path.join( args.WriteFilePath , encType )
+            if args.SubDirectoryCount > 1 :
+                targetFilePath = os.path.join( targetFilePath , 'Set%03d' %( index % args.SubDirectoryCount ) )
+            if not os.path.exists( targetFilePath ) :
+                os.makedirs( targetFilePath )
+            for qp in args.QPList :
+                targetFile = os.path.join( targetFilePath , '%s_%d%s' %( seqName , qp , encoderFileTypeDict[encType] ) )
+                write_log_enctype.get( encType )( targetFile , encType , seqName , qp , args , randomState )
+                targetFileList.append( targetFile )
+    return targetFileList
+
+def main():
+    args = parse_args()
+    targetFileList = generate_logs( args )
+    print( 'GenLogs.py: %d Files Written under %s' %( len( targetFileList ) , args.WriteFilePath ) )
+
+
+if __name__ == '__main__':
+    main()
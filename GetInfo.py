@@ -4,18 +4,54 @@
 #                   --ReadFileType .txt 
 #                   --WriteFilePath ./RA_AllFrame_AllClass_MCTF_ON_ANCHOR/ 
 #                   --WriteFileName result 
-#                   --WriteFileType .log
+#                   --WriteFileType .log .xlsx
 #                   --LogLevel      1
+#                   --Jobs          8
+#                   --Cache
+#
+# python GetInfo.py bdrate
+#                   --EncoderName    VTM
+#                   --AnchorFilePath ./RA_ANCHOR/logs/
+#                   --TestFilePath   ./RA_TEST/logs/
+#                   --ReadFileType   .log
+#                   --CtcType        VVC
+#
+# python GetInfo.py ... --Shard 0/4        ( one job per shard , 0/4 to 3/4 , each writing result_shard<i>of4.partial )
+# python GetInfo.py merge
+#                   --PartialFile   ./result_shard*of4.partial
+#                   --WriteFileType .log .xlsx
+#
+# python GetInfo.py --EncoderName auto
+#                   --ReadFilePath ./AllEncoders/logs/
+#                   --ReadFileType .log .txt .csv
+#                   --WriteFileType .csv
+#
+# import GetInfo
+# encInfoIter = GetInfo.iter_encinfo( [ './RA_ANCHOR/logs/' , './RA_TEST/logs/' ] , 'VTM' , 2 , Jobs=8 )
+# encInfoIter = GetInfo.filter_encinfo( encInfoIter , Sequence=[ 'Campfire*' ] , QP=[ 22 , 37 ] )
+# GetInfo.write_information( encInfoIter , './RA_TEST/' , [ '.csv' , '.xlsx' ] , 'result' , 2 )
 #
 
 
 import argparse
+import array
+import io
+import mmap
 import os
 import re
+import sys
+import pickle
+import time
+import contextlib
+import csv
 import fnmatch
-import pandas
-import openpyxl
-from openpyxl import Workbook , load_workbook
+import functools
+import importlib
+import itertools
+import tempfile
+import threading
+import queue
+import warnings
 
 vvcvideoDict =  ["Tango2"             ,
                  "FoodMarket4"        ,
@@ -69,6 +105,31 @@ hevcvideoDict =  ["Traffic"            ,
                   "SlideEditing"       ,
                   "SlideShow"]       
 
+vvcclassDict =  { "Tango2"              : "A1" , "FoodMarket4"    : "A1" , "Campfire"       : "A1" ,
+                  "CatRobot"            : "A2" , "DaylightRoad2"  : "A2" , "ParkRunning3"   : "A2" ,
+                  "MarketPlace"         : "B"  , "RitualDance"    : "B"  , "Cactus"         : "B"  , "BasketballDrive" : "B" , "BQTerrace" : "B" ,
+                  "RaceHorseC"          : "C"  , "BQMall"         : "C"  , "PartyScene"     : "C"  , "BasketballDrill" : "C" ,
+                  "RaceHorses"          : "D"  , "BQSquare"       : "D"  , "BlowingBubbles" : "D"  , "BasketballPass"  : "D" ,
+                  "FourPeople"          : "E"  , "Johnny"         : "E"  , "KristenAndSara" : "E"  ,
+                  "ArenaOfValor"        : "F"  , "BasketballDrillText" : "F" , "SlideEditing" : "F"  , "SlideShow"       : "F" }
+
+hevcclassDict = { "Traffic"             : "A"  , "PeopleOnStreet" : "A"  , "Nebuta"         : "A"  , "SteamLocomotive" : "A" ,
+                  "Kimono"              : "B"  , "ParkScene"      : "B"  , "Cactus"         : "B"  , "BasketballDrive" : "B" , "BQTerrace" : "B" ,
+                  "BasketballDrill"     : "C"  , "BQMall"         : "C"  , "PartyScene"     : "C"  , "RaceHorseC"      : "C" ,
+                  "BasketballPass"      : "D"  , "BQSquare"       : "D"  , "BlowingBubbles" : "D"  , "RaceHorses"      : "D" ,
+                  "FourPeople"          : "E"  , "Johnny"         : "E"  , "KristenAndSara" : "E"  ,
+                  "BasketballDrillText" : "F"  , "ChinaSpeed"     : "F"  , "SlideEditing"   : "F"  , "SlideShow"       : "F" }
+
+ctcvideoDict = {
+    'HEVC'  : hevcvideoDict  ,
+    'VVC'   : vvcvideoDict   ,
+}
+
+ctcclassDict = {
+    'HEVC'  : hevcclassDict  ,
+    'VVC'   : vvcclassDict   ,
+}
+
 def parse_args() :
     '''
     Parsing Command-Line Arguments
@@ -79,13 +140,14 @@ def parse_args() :
     parser.add_argument('--ReadFilePath', 
                         type=str, 
                         default='./', 
-                        help='Path of Encoder Files for GetInfo.py to Read',
+                        help='Path of Encoder Files for GetInfo.py to Read, or a .tar .tar.gz .tgz .tar.bz2 .tar.xz .zip Archive of them, Read without Extraction',
                         required=True
                         )
     parser.add_argument('--ReadFileType', 
                         type=str, 
                         default='log', 
-                        help='Type of Encoder Files for GetInfo.py to Read',
+                        nargs='+',
+                        help='Types of Encoder Files for GetInfo.py to Read, Compressed .gz .bz2 .xz Files of these Types are Read as well',
                         required=True
                         )    
     parser.add_argument('--WriteFilePath',
@@ -96,8 +158,10 @@ def parse_args() :
                         )
     parser.add_argument('--WriteFileType', 
                         type=str, 
-                        default='log', 
-                        help='Type of Encoder Files for GetInfo.py to Write',
+                        nargs='+',
+                        default=[ '.log' ], 
+                        choices=list( write_information_filetype ),
+                        help='Types of Result Files for GetInfo.py to Write, All from One Parse',
                         required=True
                         )
     parser.add_argument('--WriteFileName',
@@ -115,7 +179,7 @@ def parse_args() :
     parser.add_argument('--EncoderName',
                         type=str,
                         default='HM',
-                        help='Name of Encoder for GetInfo.py to Read',
+                        help='Name of Encoder for GetInfo.py to Read, or auto to Identify the Encoder of Each File from its First Bytes',
                         required=True,
                         )
     parser.add_argument('--CtcType',
@@ -124,44 +188,372 @@ def parse_args() :
                         help='CTC Type Used',
                         required=False,
                         )
+    parser.add_argument('--CtcFile',
+                        type=str,
+                        default='',
+                        help='File of Video List Used as CtcType, One "[Class] VideoName" per Line',
+                        required=False,
+                        )
+    parser.add_argument('--Jobs',
+                        type=int,
+                        default=1,
+                        help='Number of Worker Processes for GetInfo.py to Read Files, 0 for All CPUs',
+                        required=False,
+                        )
+    parser.add_argument('--Cache',
+                        action='store_true',
+                        help='Reuse Information of Unchanged Files from the Parse Cache of GetInfo.py',
+                        required=False,
+                        )
+    parser.add_argument('--CacheFile',
+                        type=str,
+                        default='',
+                        help='Path of Parse Cache, WriteFilePath/WriteFileName.cache by Default',
+                        required=False,
+                        )
+    parser.add_argument('--CacheClear',
+                        action='store_true',
+                        help='Invalidate All Entries of Parse Cache before Reading',
+                        required=False,
+                        )
+    parser.add_argument('--CachePrune',
+                        action='store_true',
+                        help='Delete Entries of Parse Cache for Files not Found under ReadFilePath',
+                        required=False,
+                        )
+    parser.add_argument('--Watch',
+                        action='store_true',
+                        help='Poll ReadFilePath and Keep Result File Current until Interrupted',
+                        required=False,
+                        )
+    parser.add_argument('--WatchInterval',
+                        type=float,
+                        default=10,
+                        help='Seconds between Two Polls of ReadFilePath in Watch Mode',
+                        required=False,
+                        )
+    parser.add_argument('--WatchDebounce',
+                        type=float,
+                        default=30,
+                        help='Minimum Seconds between Two Rewrites of Result File in Watch Mode',
+                        required=False,
+                        )
+    parser.add_argument('--Include',
+                        type=str,
+                        nargs='*',
+                        default=[],
+                        help='Glob Patterns of File Names to Read ( or "re:" Regex Searched in File Paths ), All Files of ReadFileType by Default',
+                        required=False,
+                        )
+    parser.add_argument('--Exclude',
+                        type=str,
+                        nargs='*',
+                        default=[],
+                        help='Glob Patterns of File Names not to Read ( or "re:" Regex Searched in File Paths )',
+                        required=False,
+                        )
+    parser.add_argument('--Prune',
+                        type=str,
+                        nargs='*',
+                        default=[],
+                        help='Glob Patterns of Directory Names not to Walk into ( or "re:" Regex Searched in Directory Paths )',
+                        required=False,
+                        )
+    parser.add_argument('--MaxDepth',
+                        type=int,
+                        default=-1,
+                        help='Maximum Depth of Directories Walked below ReadFilePath, -1 for No Limit',
+                        required=False,
+                        )
+    parser.add_argument('--TraverseJobs',
+                        type=int,
+                        default=4,
+                        help='Number of Threads Walking Top-Level Sub-Directories of ReadFilePath, 0 for Default of Python',
+                        required=False,
+                        )
+    parser.add_argument('--FileListCache',
+                        type=str,
+                        default='',
+                        help='File Keeping Directory Listing between Runs, Directories with Unchanged mtime are not Listed Again',
+                        required=False,
+                        )
+    parser.add_argument('--Rollup',
+                        action='store_true',
+                        help='Also Write Statistics of Frames Read at LogLevel 2 by Slice Type, QP Offset and GOP Window of Each Sequence and of All Sequences of Each Encoder to WriteFileName_rollup',
+                        required=False,
+                        )
+    parser.add_argument('--RollupGop',
+                        type=int,
+                        default=32,
+                        help='Number of Frames in Each GOP Window of Rollup Tables',
+                        required=False,
+                        )
+    parser.add_argument('--Pipeline',
+                        action='store_true',
+                        help='Walk, Prefetch and Parse Files Concurrently through Bounded Queues instead of One Stage after Another',
+                        required=False,
+                        )
+    parser.add_argument('--PrefetchJobs',
+                        type=int,
+                        default=8,
+                        help='Number of Threads Reading Files ahead of the Parsers in Pipeline Mode',
+                        required=False,
+                        )
+    parser.add_argument('--QueueSize',
+                        type=int,
+                        default=64,
+                        help='Number of Files Held between Two Stages in Pipeline Mode',
+                        required=False,
+                        )
+    parser.add_argument('--MaxMemory',
+                        type=float,
+                        default=0,
+                        help='MB of Per-Frame Data Held in Memory, Frames beyond are Spilled to a Temporary File under WriteFilePath and Read back while Writing, 0 for no Limit',
+                        required=False,
+                        )
+    parser.add_argument('--Shard',
+                        type=str,
+                        default='',
+                        help='Read only Shard i/N ( 0 <= i < N ) of the Files, Chosen by CRC32 of their Path, into WriteFileName_shard<i>of<N>.partial for GetInfo.py merge',
+                        required=False,
+                        )
+    parser.add_argument('--Database',
+                        type=str,
+                        default='',
+                        help='SQLite Results Database to Store Information into, Queried by GetInfo.py query',
+                        required=False,
+                        )
+    parser.add_argument('--Experiment',
+                        type=str,
+                        default='',
+                        help='Label of this Run in Database, Name of ReadFilePath by Default',
+                        required=False,
+                        )
+    parser.add_argument('--Profile',
+                        action='store_true',
+                        help='Record Time, Bytes, Lines and Frames of Each Stage and File, Written as JSON with a Summary on stderr',
+                        required=False,
+                        )
+    parser.add_argument('--ProfileFile',
+                        type=str,
+                        default='',
+                        help='JSON File of Profile Report, WriteFilePath/WriteFileName.profile.json by Default',
+                        required=False,
+                        )
+    parser.add_argument('--ProfileTop',
+                        type=int,
+                        default=10,
+                        help='Number of Slowest Files Listed in Profile Report',
+                        required=False,
+                        )
+    parser.add_argument('--ProfileDump',
+                        type=str,
+                        default='',
+                        choices=[ '' , 'cProfile' , 'tracemalloc' ],
+                        help='Dump cProfile Stats or tracemalloc Top Lines of the Read Stage next to Profile Report, Workers are not Covered with --Jobs',
+                        required=False,
+                        )
     args = parser.parse_args()
     return args
 
-def traverse_files( TargetFilePath , TargetFileType ) :
+def compile_patterns( PatternList ) :
+    '''
+    Compile Glob Patterns Matched against Entry Names , and Patterns Prefixed with "re:" Searched in Entry Paths
+    :return patternList : [ ( Regex1 , OnPath1 ) , ... , ( RegexN , OnPathN ) ]
+    '''
+    patternList = []
+    for pattern in PatternList or [] :
+        if pattern.startswith( 're:' ) :
+            patternList.append( ( re.compile( pattern[3:] ) , True ) )
+        else :
+            patternList.append( ( re.compile( fnmatch.translate( pattern ) ) , False ) )
+    return patternList
+
+def match_patterns( PatternList , Path , Name ) :
+    '''
+    Whether Any of Compiled PatternList Matches Entry Name or Path
+    '''
+    for regex , onPath in PatternList :
+        if ( regex.search( Path ) if onPath else regex.match( Name ) ) :
+            return True
+    return False
+
+listCacheSettle = 2 * 10 ** 9
+
+def list_directory( DirPath , ListCache , CachedList ) :
+    '''
+    Names of Files and of Sub-Directories to Walk in DirPath in os.scandir Order , Taken from CachedList if the mtime of DirPath is Unchanged
+    Symbolic Links to Directories are neither Walked nor Listed , as in os.walk
+    :return ( fileNameList , dirNameList )
+    '''
+    if ListCache is not None :
+        try :
+            mtime = os.stat( DirPath ).st_mtime_ns
+        except OSError :
+            return [] , []
+        if CachedList.get( DirPath , ( None , ) )[0] == mtime :
+            ListCache[DirPath] = CachedList[DirPath]
+            return CachedList[DirPath][1:]
+    fileNameList , dirNameList = [] , []
+    try :
+        with os.scandir( DirPath ) as entries :
+            for entry in entries :
+                try :
+                    isDir = entry.is_dir()
+                except OSError :
+                    isDir = False
+                if not isDir :
+                    fileNameList.append( entry.name )
+                elif not entry.is_symlink() :
+                    dirNameList.append( entry.name )
+    except OSError :
+        return [] , []
+    if ListCache is not None :
+        # a Directory Changed within the mtime Granularity of Some File Systems is Listed Again Next Time
+        ListCache[DirPath] = ( mtime if time.time_ns() - mtime > listCacheSettle else None , fileNameList , dirNameList )
+    return fileNameList , dirNameList
+
+def select_files( DirPath , FileNameList , TargetFileType , Include , Exclude ) :
+    '''
+    Paths of Files in FileNameList of DirPath with TargetFileType , One File Type or a List of them , or its Compressed Variants ,
+    Matching One of Include if Given and None of Exclude
+    :return targetFileList : [ DirPath/FileName1.TargetFileType , ... ]
+    '''
+    targetFileList     = []
+    targetFileTypeList = [ TargetFileType ] if isinstance( TargetFileType , str ) else TargetFileType
+    targetEndings      = tuple( targetFileType + compressType for targetFileType in targetFileTypeList for compressType in [ '' ] + list( compressModuleDict ) )
+    for fileName in FileNameList :
+        # splitext is only Called to Confirm Names with the Right Ending
+        if not fileName.endswith( targetEndings ) or os.path.splitext( strip_compress_type( fileName ) )[1] not in targetFileTypeList :
+            continue
+        targetFile = os.path.join( DirPath , fileName )
+        if Include and not match_patterns( Include , targetFile , fileName ) :
+            continue
+        if Exclude and match_patterns( Exclude , targetFile , fileName ) :
+            continue
+        targetFileList.append( targetFile )
+    return targetFileList
+
+def select_dirs( DirPath , DirNameList , Prune ) :
+    '''
+    Paths of Sub-Directories in DirNameList of DirPath not Matching Prune
+    :return dirPathList : [ DirPath/DirName1 , ... ]
+    '''
+    dirPathList = []
+    for dirName in DirNameList :
+        dirPath = os.path.join( DirPath , dirName )
+        if not ( Prune and match_patterns( Prune , dirPath , dirName ) ) :
+            dirPathList.append( dirPath )
+    return dirPathList
+
+def walk_files( DirPath , Depth , TargetFileType , walkOptions ) :
+    '''
+    Walk the Subtree of DirPath at Depth below the Root , in the Same Order as os.walk , Yielding Files as Each Directory is Listed
+    :return iterator of DirPath/FileName1.TargetFileType , ...
+    '''
+    include , exclude , prune , maxDepth , listCache , cachedList = walkOptions
+    stack = [ ( DirPath , Depth ) ]
+    while stack :
+        dirPath , depth = stack.pop()
+        fileNameList , dirNameList = list_directory( dirPath , listCache , cachedList )
+        yield from select_files( dirPath , fileNameList , TargetFileType , include , exclude )
+        if maxDepth < 0 or depth < maxDepth :
+            stack.extend( ( subDirPath , depth + 1 ) for subDirPath in reversed( select_dirs( dirPath , dirNameList , prune ) ) )
+
+def walk_options( Include , Exclude , Prune , MaxDepth , ListCache ) :
     '''
-    Traverse Files with TargetFileType under TargetFilePath
+    Options of walk_files , ListCache Dict being Emptied to Receive the Listing of this Traversal
+    :return walkOptions
+    '''
+    cachedList = None
+    if ListCache is not None :
+        cachedList = dict( ListCache )
+        ListCache.clear()
+    return ( compile_patterns( Include ) , compile_patterns( Exclude ) , compile_patterns( Prune ) , MaxDepth , ListCache , cachedList )
+
+def traverse_files( TargetFilePath , TargetFileType , Include = None , Exclude = None , Prune = None , MaxDepth = -1 , Jobs = 1 , ListCache = None ) :
+    '''
+    Traverse Files with TargetFileType under TargetFilePath in the Order of os.walk
+    Files must Match One of Include if Given and None of Exclude , Directories Matching Prune and below MaxDepth ( if >= 0 ) are Skipped
+    Top-Level Sub-Directories are Walked by a Pool of Jobs Threads , ListCache Dict Keeps the Listing of Directories for the Next Traversal
     :return targetFileList : [ TargetFilePath/FileName1.TargetFileType , ... , TargetFilePath/FileNameN.TargetFileType]
     ''' 
-    targetFileNameList = []
-    for root , dics , fils in os.walk( TargetFilePath ) :
-        for filename in fils :
-            name , suf = os.path.splitext( filename )
-            if suf == TargetFileType :
-                targetFileNameList.append( os.path.join( root, filename ) )
-    return targetFileNameList
+    walkOptions = walk_options( Include , Exclude , Prune , MaxDepth , ListCache )
+    if Jobs == 1 or MaxDepth == 0 :
+        return list( walk_files( TargetFilePath , 0 , TargetFileType , walkOptions ) )
+    include , exclude , prune = walkOptions[:3]
+    fileNameList , dirNameList = list_directory( TargetFilePath , ListCache , walkOptions[5] )
+    targetFileList = select_files( TargetFilePath , fileNameList , TargetFileType , include , exclude )
+    subDirPathList = select_dirs( TargetFilePath , dirNameList , prune )
+    if subDirPathList :
+        import concurrent.futures
+        # map Keeps the Order of subDirPathList , so the Result is the Same as a Serial Walk
+        with concurrent.futures.ThreadPoolExecutor( Jobs if Jobs > 0 else None ) as executor :
+            for subTargetFileList in executor.map( lambda subDirPath : list( walk_files( subDirPath , 1 , TargetFileType , walkOptions ) ) , subDirPathList ) :
+                targetFileList.extend( subTargetFileList )
+    return targetFileList
+
+def load_list_cache( ListCacheFile ) :
+    '''
+    Load Directory Listing Saved by save_list_cache , Empty if ListCacheFile is Missing or Unreadable
+    :return listCache : Dict < DirPath : ( mtime , FileNameList , DirNameList ) >
+    '''
+    try :
+        with open( ListCacheFile , 'rb' ) as fileHandle :
+            return pickle.load( fileHandle )
+    except ( OSError , pickle.UnpicklingError , EOFError ) :
+        return {}
+
+def save_list_cache( ListCacheFile , ListCache ) :
+    '''
+    Save Directory Listing of the Last Traversal to ListCacheFile
+    '''
+    with open( ListCacheFile , 'wb' ) as fileHandle :
+        pickle.dump( ListCache , fileHandle , pickle.HIGHEST_PROTOCOL )
+
+def traverse_args_files( args , ListCache = None ) :
+    '''
+    Traverse Files under args.ReadFilePath with the Filters of args
+    :return targetFileList : [ TargetFile1 , ... , TargetFileN ]
+    '''
+    return traverse_files( args.ReadFilePath , args.ReadFileType , args.Include , args.Exclude , args.Prune , args.MaxDepth , args.TraverseJobs , ListCache )
+
+# Frame Types Stored in EncInfo.FrameTypeList as Index of frameTypeDict
+frameTypeDict     = [ "I-SLICE" , "P-SLICE" , "B-SLICE" , "i-SLICE" , "p-SLICE" , "b-SLICE" ]
+frameTypeCodeDict = { frameType : code for code , frameType in enumerate( frameTypeDict ) }
 
 class EncInfo:
     '''
     Class to Store Encoder's Ouput Information Read from TargetFileList
+    Summary Values are Numbers ( None if Unread ) and Per-Frame Values are Typed array Columns,
+    Digits Keeps the Number of Decimals Printed by the Encoder for Each Field to Write them back Unchanged,
+    EncName is the Encoder whose Log was Read
     ''' 
+    __slots__ = ( 'SeqName'     , 'SeqAvgQp'    , 'AvgBitRate' , 'AvgYUVPsnr'    ,
+                  'AvgYPsnr'    , 'AvgUPsnr'    , 'AvgVPsnr'   , 'EncTime'       ,
+                  'FrameTypeList' , 'QPList'    , 'BitRateList' , 'YPsnrList'    ,
+                  'UPsnrList'   , 'VPsnrList'   , 'YUVPsnrList' , 'GradientList' ,
+                  'AvgGradient' , 'Digits'      , 'EncName' )
     def __init__(self) :
         self.SeqName       = ""
-        self.SeqAvgQp      = ""
-        self.AvgBitRate    = ""
-        self.AvgYUVPsnr    = ""
-        self.AvgYPsnr      = ""
-        self.AvgUPsnr      = ""
-        self.AvgVPsnr      = ""
-        self.EncTime       = ""
-        self.FrameTypeList = []
-        self.QPList        = []
-        self.BitRateList   = []      
-        self.YPsnrList     = []
-        self.UPsnrList     = []
-        self.VPsnrList     = []
-        self.YUVPsnrList   = []
-        self.GradientList  = []
-        self.AvgGradient   = ""
+        self.SeqAvgQp      = None
+        self.AvgBitRate    = None
+        self.AvgYUVPsnr    = None
+        self.AvgYPsnr      = None
+        self.AvgUPsnr      = None
+        self.AvgVPsnr      = None
+        self.EncTime       = None
+        self.FrameTypeList = array.array( 'b' )
+        self.QPList        = array.array( 'd' )
+        self.BitRateList   = array.array( 'd' )
+        self.YPsnrList     = array.array( 'd' )
+        self.UPsnrList     = array.array( 'd' )
+        self.VPsnrList     = array.array( 'd' )
+        self.YUVPsnrList   = array.array( 'd' )
+        self.GradientList  = array.array( 'd' )
+        self.AvgGradient   = None
+        self.Digits        = {}
+        self.EncName       = ""
     def __non_zero__(self) :
         return bool ( 
                     self.SeqName       or
@@ -181,214 +573,446 @@ class EncInfo:
                     self.GradientList  or
                     self.AvgGradient
                     )
+    def frame_types(self) :
+        '''
+        Names of Frame Types in FrameTypeList
+        :return frameTypeList : [ FrameType1 , ... , FrameTypeN ]
+        '''
+        return [ frameTypeDict[code] for code in self.FrameTypeList ]
 
-def search_result(chunk, matchSyntax, index):
+def count_digits( Word ) :
     '''
-    Find MatchSyntax in Chunk and Read matchWord by index
-    :return matchWord
-    ''' 
-    if re.search(matchSyntax, chunk):
-        splitWord = re.split(r'\s+', chunk)
-        matchWord = []
-        matchWord.append(splitWord[index])
-        return matchWord
+    Count Decimals of a Number Word
+    :return digits
+    '''
+    Word  = Word.strip()
+    index = Word.find( '.' )
+    return 0 if index < 0 else len( Word ) - index - 1
 
-def read_information_vvenc( TargetFile , LogLevel ) :
+def set_number( encInfo , Field , Word ) :
     '''
-    Collect VVENC Encoder's Output Information in TargetFile
+    Store Number Word to Summary Field of encInfo, Keeping its Decimals
+    '''
+    setattr( encInfo , Field , float( Word ) )
+    encInfo.Digits[Field] = count_digits( Word )
+
+def format_number( Value , Digits ) :
+    '''
+    Format Number Value with Digits Decimals, Empty for Unread Value
+    :return text
+    '''
+    if Value is None :
+        return ''
+    return '%.*f' %( Digits , Value )
+
+def format_field( encInfo , Field ) :
+    '''
+    Format Summary Field of encInfo as Printed by the Encoder
+    :return text
+    '''
+    return format_number( getattr( encInfo , Field ) , encInfo.Digits.get( Field , 0 ) )
+
+# Precompiled Syntax of Encoder Logs, Shared by All read_information_* Functions
+# Logs are Scanned as Bytes, Only Lines whose Fields are Extracted are Decoded
+framesPattern  = re.compile( rb'\sFrames' )
+timePattern    = re.compile( rb'\sTime' )
+csvSplitPattern = re.compile( r',\s*' )
+seqQpPattern   = re.compile( r'.*_(\d+)' )
+seqKeyPattern  = re.compile( r'(.*)_\d+' )
+
+seqNamePatternDict = {
+    'HM'    : [ re.compile( r'.*\/(.+?)\.txt' )         , re.compile( r'.*\/(.*_\d+)\.log' )   , re.compile( r'.*\/(\D+_\d+).*\.csv' ) ] ,
+    'VTM'   : [ re.compile( r'.*\/(\D+_\d+)\.txt' )     , re.compile( r'.*\/(.*_\d+)\.log' )   , re.compile( r'.*\/(\D+_\d+)\.csv' )   ] ,
+    'VVENC' : [ re.compile( r'.*\/(\D+_-?\d+).*\.txt' ) , re.compile( r'.*\/(\D+_\d+).*\.log' ) , re.compile( r'.*\/(\D+_\d+).*\.csv' ) ] ,
+    'X265'  : [ re.compile( r'.*\/(.+?)\.txt' )         , re.compile( r'.*\/(\D+_\d+).*\.log' ) , re.compile( r'.*\/(\D+_\d+).*\.csv' ) ] ,
+}
+
+# ( Keyword of Per-Frame Line , Summary Line Tag , Strip QP Word , Read Gradient ) of Each Text Log
+logSyntaxDict = {
+    'HM'    : ( b'Gradient' , 'a'  , False , True  ) ,
+    'VTM'   : ( b'Gradient' , None , False , True  ) ,
+    'VVENC' : ( b'POC'      , None , True  , False ) ,
+}
+
+# Lines which parse_information_log may Read, Other Lines are Skipped by the Regex Engine
+logLinePatternDict = { encType : re.compile( rb'(?m)^.*(?:' + frameWord + rb'|Frames|Time).*\n?' )
+                       for encType , ( frameWord , summaryTag , stripQp , readGradient ) in logSyntaxDict.items() }
+
+# Logs Larger than mmapThreshold Bytes are Memory-Mapped instead of Read,
+# Pages already Scanned are Released every mmapReleaseBlock Bytes
+mmapThreshold    = 1 << 20
+mmapReleaseBlock = 1 << 24
+
+# Stdlib Codec Module of Each Compressed File Type , All Opened as codec.open( File , 'rb' ) , Imported only when a Compressed Log is Read
+compressModuleDict = {
+    '.gz'  : 'gzip' ,
+    '.bz2' : 'bz2'  ,
+    '.xz'  : 'lzma' ,
+}
+
+def compress_type( TargetFile ) :
+    '''
+    Compressed File Type of TargetFile in compressModuleDict
+    :return compressType : '' if TargetFile is not Compressed
+    '''
+    compressType = os.path.splitext( TargetFile )[1]
+    return compressType if compressType in compressModuleDict else ''
+
+def strip_compress_type( TargetFile ) :
+    '''
+    TargetFile without its Compressed File Type , Named as the Log before Compression
+    '''
+    compressType = compress_type( TargetFile )
+    return TargetFile[:-len( compressType )] if compressType else TargetFile
+
+def count_lines_read( Lines ) :
+    '''
+    Yield Lines , Adding their Bytes and Number to readCounter
+    '''
+    for line in Lines :
+        count_read( len( line ) , 1 )
+        yield line
+
+@contextlib.contextmanager
+def open_compressed_lines( TargetFile ) :
+    '''
+    Open Compressed TargetFile , Decompressed by the Codec of its Type while its Lines are Read , so Memory Stays Flat
+    Compressed Streams can not Seek or be Memory-Mapped , so Parsers Read Every Line
+    :return lines : iterator of Bytes Lines
+    '''
+    codec = importlib.import_module( compressModuleDict[compress_type( TargetFile )] )
+    with codec.open( TargetFile , 'rb' ) as fileHandle :
+        yield fileHandle if readCounter is None else count_lines_read( fileHandle )
+
+def split_words( Chunk ) :
+    '''
+    Split Chunk by Whitespace, Same as re.split( r'\s+' , Chunk ) but without the Regex Engine
+    :return words
+    '''
+    words = Chunk.split()
+    if Chunk[:1].isspace() :
+        words.insert( 0 , '' )
+    if Chunk[-1:].isspace() :
+        words.append( '' )
+    return words
+
+def parse_sequence_name( TargetFile , encInfo , EncType ) :
+    '''
+    Read SeqName and SeqAvgQp of encInfo from the Path of TargetFile , without its Compressed File Type
+    '''
+    targetFile = strip_compress_type( TargetFile )
+    for pattern in seqNamePatternDict.get( EncType ) :
+        findResult = pattern.match( targetFile )
+        if findResult :
+            encInfo.SeqName = findResult.group(1)
+    findResult = seqQpPattern.match( encInfo.SeqName )
+    if findResult :
+        encInfo.SeqAvgQp = int( findResult.group(1) )
+
+def parse_frame_words( Chunk , encInfo , StripQp , ReadGradient ) :
+    '''
+    Collect Per-Frame Information of encInfo from One Per-Frame Line in a Single Scan of its Words
+    A Line Cut Short , or with an Unknown Slice Type or a Word not a Number , is Skipped Whole to Keep the Per-Frame Columns Aligned
+    '''
+    words      = split_words( Chunk )
+    firstFrame = not encInfo.YUVPsnrList
+    frameType  = None
+    valueList  = []
+    try :
+        for index , word in enumerate( words ) :
+            field = frameWordDict.get( word )
+            if field is None :
+                if 'SLICE' in word :
+                    frameType = frameTypeCodeDict.get( word[:-1] , -1 )
+                continue
+            if field == 'QPList' :
+                value = words[index + 1][:-1] if StripQp else words[index + 1]
+            elif field == 'BitRateList' :
+                value = words[index - 1]
+            elif field == 'GradientList' or field == 'AvgGradient' :
+                if not ReadGradient :
+                    continue
+                if field == 'AvgGradient' :
+                    set_number( encInfo , field , words[index + 1] )
+                    continue
+                value = words[index + 1]
+            else :
+                value = words[index + 1]
+            valueList.append( ( field , value , float( value ) ) )
+    except ( IndexError , ValueError ) :
+        return
+    psnrDict = { field : number for field , value , number in valueList if field in framePsnrFieldList }
+    if frameType == -1 or len( psnrDict ) < len( framePsnrFieldList ) :
+        return
+    if frameType is not None :
+        encInfo.FrameTypeList.append( frameType )
+    for field , value , number in valueList :
+        getattr( encInfo , field ).append( number )
+        if firstFrame :
+            encInfo.Digits[field] = count_digits( value )
+    encInfo.YUVPsnrList.append( ( 6 * psnrDict['YPsnrList'] + psnrDict['UPsnrList'] + psnrDict['VPsnrList'] ) / 8 )
+
+# Field of EncInfo Read from the Word Next to Each Keyword of Per-Frame Lines ( Previous Word for "bits" )
+frameWordDict = {
+    'QP'       : 'QPList'       ,
+    'bits'     : 'BitRateList'  ,
+    '[Y'       : 'YPsnrList'    ,
+    'U'        : 'UPsnrList'    ,
+    'V'        : 'VPsnrList'    ,
+    'Gradient' : 'GradientList' ,
+    'Avg'      : 'AvgGradient'  ,
+}
+# Fields of frameWordDict without which a Per-Frame Line is Skipped
+framePsnrFieldList = [ 'YPsnrList' , 'UPsnrList' , 'VPsnrList' ]
+
+def parse_information_log( FileHandle , encInfo , LogLevel , EncType ) :
+    '''
+    Collect HM / VTM / VVENC Encoder's Output Information of encInfo from Bytes Lines of FileHandle in One Pass
+    '''
+    frameWord , summaryTag , stripQp , readGradient = logSyntaxDict.get( EncType )
+    readSummary = LogLevel > 0
+    readFrame   = LogLevel > 1
+    for chunk in FileHandle :
+        if readSummary :
+            if b'Frames' in chunk and framesPattern.search( chunk ) :
+                # summary values are in the line following the header line
+                chunk  = next( FileHandle , b'' )
+                result = split_words( chunk.decode( 'latin-1' ) )
+                if summaryTag is None or result[2] == summaryTag :
+                    set_number( encInfo , 'AvgBitRate' , result[3] )
+                    set_number( encInfo , 'AvgYPsnr'   , result[4] )
+                    set_number( encInfo , 'AvgUPsnr'   , result[5] )
+                    set_number( encInfo , 'AvgVPsnr'   , result[6] )
+                    set_number( encInfo , 'AvgYUVPsnr' , result[7] )
+            if b'Time' in chunk and timePattern.search( chunk ) :
+                set_number( encInfo , 'EncTime' , split_words( chunk.decode( 'latin-1' ) )[3] )
+        if readFrame and frameWord in chunk :
+            parse_frame_words( chunk.decode( 'latin-1' ) , encInfo , stripQp , readGradient )
+
+def filter_log_lines( Buffer , EncType ) :
+    '''
+    Yield the Lines of Bytes Buffer that parse_information_log Reads, Skipping the Others with the Regex Engine
+    The Line Following a "Frames" Line is Always Yielded as it Holds the Summary Values
+    '''
+    pattern  = logLinePatternDict.get( EncType )
+    position = 0
+    released = 0
+    while 1 :
+        findResult = pattern.search( Buffer , position )
+        if not findResult :
+            return
+        chunk    = findResult.group()
+        position = findResult.end()
+        yield chunk
+        if b'Frames' in chunk and position < len( Buffer ) :
+            end = Buffer.find( b'\n' , position )
+            end = len( Buffer ) if end < 0 else end + 1
+            yield Buffer[position:end]
+            position = end
+        if position - released > mmapReleaseBlock :
+            released = release_buffer( Buffer , released , position )
+
+def parse_information_csv( FileHandle , encInfo , LogLevel ) :
+    '''
+    Collect X265 Encoder's Output Information of encInfo from Bytes Lines of FileHandle in One Pass
+    '''
+    readSummary = LogLevel > 0
+    readFrame   = LogLevel > 1
+    frameTypeList , qpList , bitRateList = encInfo.FrameTypeList , encInfo.QPList , encInfo.BitRateList
+    yPsnrList , uPsnrList , vPsnrList , yuvPsnrList = encInfo.YPsnrList , encInfo.UPsnrList , encInfo.VPsnrList , encInfo.YUVPsnrList
+    chunk = next( FileHandle , None )
+    while chunk is not None :
+        nextChunk = next( FileHandle , None )
+        if chunk == b'\n' or chunk == b'\r\n' :
+            chunk = nextChunk
+            continue
+        if readSummary and nextChunk is None :
+            # summary values are in the last line
+            result = csvSplitPattern.split( chunk.decode( 'latin-1' ) )
+            set_number( encInfo , 'AvgBitRate' , result[4] )
+            set_number( encInfo , 'AvgYPsnr'   , result[5] )
+            set_number( encInfo , 'AvgUPsnr'   , result[6] )
+            set_number( encInfo , 'AvgVPsnr'   , result[7] )
+            set_number( encInfo , 'AvgYUVPsnr' , result[8] )
+            set_number( encInfo , 'EncTime'    , result[2] )
+        elif readFrame :
+            chunk = chunk.decode( 'latin-1' )
+            if 'Encode' in chunk or 'Summary' in chunk or 'Command' in chunk :
+                chunk = nextChunk
+                continue
+            # same words as csvSplitPattern.split once the leading whitespace is stripped
+            result = chunk.split( ',' )
+            # a row cut short , or with an unknown slice type or a field not a number , is skipped whole
+            try :
+                frameType = frameTypeCodeDict.get( result[1].lstrip() )
+                qp , bitRate , yPsnr , uPsnr , vPsnr = float( result[3] ) , float( result[4] ) , float( result[7] ) , float( result[8] ) , float( result[9] )
+            except ( IndexError , ValueError ) :
+                frameType = None
+            if frameType is None :
+                chunk = nextChunk
+                continue
+            if not encInfo.YUVPsnrList :
+                for column , index in ( ( 'QPList' , 3 ) , ( 'BitRateList' , 4 ) , ( 'YPsnrList' , 7 ) , ( 'UPsnrList' , 8 ) , ( 'VPsnrList' , 9 ) ) :
+                    encInfo.Digits[column] = count_digits( result[index] )
+            frameTypeList.append( frameType )
+            qpList.append( qp )
+            bitRateList.append( bitRate )
+            yPsnrList.append( yPsnr )
+            uPsnrList.append( uPsnr )
+            vPsnrList.append( vPsnr )
+            yuvPsnrList.append( ( 6 * yPsnr + uPsnr + vPsnr ) / 8 ) 
+        chunk = nextChunk
+
+# Summary Fields Found at the End of Encoder Logs, Enough for LogLevel 1
+summaryFieldList = [ 'AvgBitRate' , 'AvgYUVPsnr' , 'AvgYPsnr' , 'AvgUPsnr' , 'AvgVPsnr' , 'EncTime' ]
+
+# Tail of Log Read First at LogLevel 1, Doubled until tailSeekLimit before a Full Scan
+tailSeekBlock = 1 << 13
+tailSeekLimit = 1 << 20
+
+def read_tail_lines( FileHandle , BlockSize ) :
+    '''
+    Read Complete Lines in the Last BlockSize Bytes of Binary FileHandle
+    :return ( lines , whole ) : whole is True if lines Cover the Whole File
+    '''
+    size  = FileHandle.seek( 0 , os.SEEK_END )
+    start = max( 0 , size - BlockSize )
+    FileHandle.seek( start )
+    data = FileHandle.read()
+    if start > 0 :
+        # drop the line cut by the start of the block
+        data = data[data.find( b'\n' ) + 1:] if b'\n' in data else b''
+    lines = data.splitlines( keepends=True )
+    if readCounter is not None :
+        count_read( size - start , len( lines ) )
+    return lines , start == 0
+
+@contextlib.contextmanager
+def open_log_buffer( TargetFile ) :
+    '''
+    Open TargetFile as a Bytes Buffer, Memory-Mapped if Larger than mmapThreshold so Memory Stays Flat
+    :return buffer : bytes or mmap
+    '''
+    with open( TargetFile , 'rb' ) as fileHandle :
+        if os.fstat( fileHandle.fileno() ).st_size < mmapThreshold :
+            buffer = fileHandle.read()
+            if readCounter is not None :
+                count_read( len( buffer ) , count_lines( buffer ) )
+            yield buffer
+            return
+        buffer = mmap.mmap( fileHandle.fileno() , 0 , access=mmap.ACCESS_READ )
+        try :
+            if readCounter is not None :
+                count_read( len( buffer ) , count_lines( buffer ) )
+            if hasattr( buffer , 'madvise' ) :
+                buffer.madvise( mmap.MADV_SEQUENTIAL )
+            yield buffer
+        finally :
+            buffer.close()
+
+def release_buffer( Buffer , Start , End ) :
+    '''
+    Release Pages of Memory-Mapped Buffer between Start and End that were already Scanned
+    :return released : Offset up to which Pages are Released
+    '''
+    if not isinstance( Buffer , mmap.mmap ) or not hasattr( Buffer , 'madvise' ) :
+        return End
+    length = ( End - Start ) // mmap.PAGESIZE * mmap.PAGESIZE
+    if length > 0 :
+        Buffer.madvise( mmap.MADV_DONTNEED , Start , length )
+    return Start + length
+
+def buffer_lines( Buffer ) :
+    '''
+    Yield Bytes Lines of Buffer Opened by open_log_buffer
+    '''
+    if isinstance( Buffer , bytes ) :
+        yield from iter( io.BytesIO( Buffer ).readline , b'' )
+        return
+    released = 0
+    readline = Buffer.readline
+    while 1 :
+        # check the scanned size every few thousand lines only
+        for index in range( 4096 ) :
+            chunk = readline()
+            if not chunk :
+                return
+            yield chunk
+        if Buffer.tell() - released > mmapReleaseBlock :
+            released = release_buffer( Buffer , released , Buffer.tell() )
+
+def tail_information_log( TargetFile , encInfo , EncType ) :
+    '''
+    Collect Summary Fields of encInfo from the Tail of TargetFile, Seeking Backwards in Growing Blocks
+    :return found : False if Summary or Time Line is not in the Last tailSeekLimit Bytes
+    '''
+    with open( TargetFile , 'rb' ) as fileHandle :
+        blockSize = tailSeekBlock
+        while blockSize <= tailSeekLimit :
+            lines , whole = read_tail_lines( fileHandle , blockSize )
+            tailInfo = EncInfo()
+            parse_information_log( iter( lines ) , tailInfo , 1 , EncType )
+            if whole or ( tailInfo.AvgBitRate is not None and tailInfo.EncTime is not None ) :
+                for field in summaryFieldList :
+                    setattr( encInfo , field , getattr( tailInfo , field ) )
+                encInfo.Digits.update( tailInfo.Digits )
+                return True
+            blockSize *= 2
+    return False
+
+def tail_information_csv( TargetFile , encInfo ) :
+    '''
+    Collect Summary Fields of encInfo from the Last Line of TargetFile, Seeking Backwards in Growing Blocks
+    '''
+    with open( TargetFile , 'rb' ) as fileHandle :
+        blockSize = tailSeekBlock
+        while 1 :
+            lines , whole = read_tail_lines( fileHandle , blockSize )
+            if lines or whole :
+                parse_information_csv( iter( lines[-1:] ) , encInfo , 1 )
+                return
+            blockSize *= 2
+
+def read_information_log( TargetFile , LogLevel , EncType ) :
+    '''
+    Collect Output Information in TargetFile of EncType Encoder with Text Log
     :return encInfo
     ''' 
     encInfo = EncInfo()
+    encInfo.EncName = EncType
     if os.path.isfile( TargetFile ):
-        findResult = re.match( r'.*\/(\D+_-?\d+).*\.txt', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(\D+_\d+).*\.log', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(\D+_\d+).*\.csv', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*_(\d+)',encInfo.SeqName)
-        if findResult :
-            encInfo.SeqAvgQp = findResult.group(1)
-        fileHandle = open( TargetFile , 'r' )
-        while 1:
-            chunk = fileHandle.readline()
-            if chunk == '' :  break
-            if LogLevel > 0 :
-                matchWord  = '\sFrames'
-                findResult = search_result(chunk, matchWord, 0)
-                if findResult:
-                    chunk  = fileHandle.readline()
-                    result = re.split(r'\s+', chunk)
-                    encInfo.AvgBitRate = result[3]
-                    encInfo.AvgYPsnr   = result[4]
-                    encInfo.AvgUPsnr   = result[5]
-                    encInfo.AvgVPsnr   = result[6]
-                    encInfo.AvgYUVPsnr = result[7]
-                matchWord  = '\sTime'
-                findResult = search_result(chunk, matchWord, 3)
-                if findResult:
-                    encInfo.EncTime = findResult[0]
-            if LogLevel > 1 :
-                matchWord  = 'POC'
-                findResult = search_result(chunk, matchWord, 0)
-                if findResult :
-                    result = re.split(r'\s+',chunk)
-                    for index in range( len( result ) ) :
-                        if re.match( r'.*SLICE', result[index] ) :
-                            encInfo.FrameTypeList.append( result[index][:-1] )
-                        elif result[index] == 'QP' :
-                            encInfo.QPList.append( result[index + 1][:-1] )
-                        elif result[index] == 'bits' :
-                            encInfo.BitRateList.append( result[index - 1] )
-                        elif result[index] == '[Y' :
-                            encInfo.YPsnrList.append( result[index + 1] )
-                        elif result[index] == 'U' :
-                            encInfo.UPsnrList.append( result[index + 1] )
-                        elif result[index] == 'V' :
-                            encInfo.VPsnrList.append( result[index + 1] )
-                    encInfo.YUVPsnrList.append( ( 6 * float(encInfo.YPsnrList[-1]) + float(encInfo.UPsnrList[-1]) + float(encInfo.VPsnrList[-1]) ) / 8 )
-                    #if encInfo.FrameTypeList[-1] == 'I-SLICE' :
-                    #    del(encInfo.FrameTypeList[-1])
-                    #    del(encInfo.QPList[-1]) 
-                    #    del(encInfo.BitRateList[-1]) 
-                    #    del(encInfo.YPsnrList[-1]) 
-                    #    del(encInfo.UPsnrList[-1]) 
-                    #    del(encInfo.VPsnrList[-1]) 
-                    #    del(encInfo.YUVPsnrList[-1])
+        parse_sequence_name( TargetFile , encInfo , EncType )
+        if compress_type( TargetFile ) :
+            with open_compressed_lines( TargetFile ) as lines :
+                parse_information_log( lines , encInfo , LogLevel , EncType )
+            return encInfo
+        if LogLevel == 1 and tail_information_log( TargetFile , encInfo , EncType ) :
+            return encInfo
+        with open_log_buffer( TargetFile ) as buffer :
+            parse_information_log( filter_log_lines( buffer , EncType ) , encInfo , LogLevel , EncType )
     assert encInfo , 'Empty encInfo T T'
     return encInfo
 
+def read_information_vvenc( TargetFile , LogLevel ) :
+    '''
+    Collect VVENC Encoder's Output Information in TargetFile
+    :return encInfo
+    ''' 
+    return read_information_log( TargetFile , LogLevel , 'VVENC' )
+
 def read_information_vtm( TargetFile , LogLevel ) :
     '''
     Collect VTM Encoder's Output Information in TargetFile
     :return encInfo
     ''' 
-    encInfo = EncInfo()
-    if os.path.isfile( TargetFile ):
-        findResult = re.match( r'.*\/(\D+_\d+)\.txt', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(.*_\d+)\.log', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(\D+_\d+)\.csv', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*_(\d+)',encInfo.SeqName)
-        if findResult :
-            encInfo.SeqAvgQp = findResult.group(1)
-        fileHandle = open( TargetFile , 'r' )
-        while 1:
-            chunk = fileHandle.readline()
-            if chunk == '' :  break
-            if LogLevel > 0 :
-                matchWord  = '\sFrames'
-                findResult = search_result(chunk, matchWord, 0)
-                if findResult:
-                    chunk  = fileHandle.readline()
-                    result = re.split(r'\s+', chunk)
-                    encInfo.AvgBitRate = result[3]
-                    encInfo.AvgYPsnr   = result[4]
-                    encInfo.AvgUPsnr   = result[5]
-                    encInfo.AvgVPsnr   = result[6]
-                    encInfo.AvgYUVPsnr = result[7]
-                matchWord  = '\sTime'
-                findResult = search_result(chunk, matchWord, 3)
-                if findResult:
-                    encInfo.EncTime = findResult[0]
-            if LogLevel > 1 :
-                matchWord  = 'Gradient'
-                findResult = search_result(chunk, matchWord, 0)
-                if findResult :
-                    result = re.split(r'\s+',chunk)
-                    for index in range( len( result ) ) :
-                        if re.match( r'.*SLICE', result[index] ) :
-                            encInfo.FrameTypeList.append( result[index][:-1] )
-                        elif result[index] == 'QP' :
-                            encInfo.QPList.append( result[index + 1])
-                        elif result[index] == 'bits' :
-                            encInfo.BitRateList.append( result[index - 1] )
-                        elif result[index] == '[Y' :
-                            encInfo.YPsnrList.append( result[index + 1] )
-                        elif result[index] == 'U' :
-                            encInfo.UPsnrList.append( result[index + 1] )
-                        elif result[index] == 'V' :   
-                            encInfo.VPsnrList.append( result[index + 1] )
-                        elif result[index] == 'Gradient' :
-                            encInfo.GradientList.append( result[index + 1] )
-                        elif result[index] == 'Avg' :
-                            encInfo.AvgGradient = result[index + 1]
-                    encInfo.YUVPsnrList.append( ( 6 * float(encInfo.YPsnrList[-1]) + float(encInfo.UPsnrList[-1]) + float(encInfo.VPsnrList[-1]) ) / 8 )  
-    assert encInfo , 'Empty encInfo T T'
-    return encInfo
+    return read_information_log( TargetFile , LogLevel , 'VTM' )
 
 def read_information_hm( TargetFile , LogLevel ) :
     '''
     Collect HM Encoder's Output Information in TargetFile
     :return encInfo
     ''' 
-    encInfo = EncInfo()
-    if os.path.isfile( TargetFile ):
-        findResult = re.match( r'.*\/(.+?)\.txt', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(.*_\d+)\.log', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(\D+_\d+).*\.csv', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*_(\d+)',encInfo.SeqName)
-        if findResult :
-            encInfo.SeqAvgQp = findResult.group(1)
-        fileHandle = open( TargetFile , 'r' )
-        while 1:
-            chunk = fileHandle.readline()
-            if chunk == '' :  break
-            if LogLevel > 0 :
-                matchWord  = '\sFrames'
-                findResult = search_result(chunk, matchWord, 0)
-                if findResult:
-                    chunk  = fileHandle.readline()
-                    result = re.split(r'\s+', chunk)
-                    if result[2] == 'a' :
-                        encInfo.AvgBitRate = result[3]
-                        encInfo.AvgYPsnr   = result[4]
-                        encInfo.AvgUPsnr   = result[5]
-                        encInfo.AvgVPsnr   = result[6]
-                        encInfo.AvgYUVPsnr = result[7]
-                matchWord  = '\sTime'
-                findResult = search_result(chunk, matchWord, 3)
-                if findResult:
-                    encInfo.EncTime = findResult[0]
-            if LogLevel > 1 :
-                matchWord  = 'Gradient'
-                findResult = search_result(chunk, matchWord, 0)
-                if findResult :
-                    result = re.split(r'\s+',chunk)
-                    for index in range( len( result ) ) :
-                        if re.match( r'.*SLICE', result[index] ) :
-                            encInfo.FrameTypeList.append( result[index][:-1] )
-                        elif result[index] == 'QP' :
-                            encInfo.QPList.append( result[index + 1])
-                        elif result[index] == 'bits' :
-                            encInfo.BitRateList.append( result[index - 1] )
-                        elif result[index] == '[Y' :
-                            encInfo.YPsnrList.append( result[index + 1] )
-                        elif result[index] == 'U' :
-                            encInfo.UPsnrList.append( result[index + 1] )
-                        elif result[index] == 'V' :
-                            encInfo.VPsnrList.append( result[index + 1] )
-                        elif result[index] == 'Gradient' :
-                            encInfo.GradientList.append( result[index + 1] )
-                        elif result[index] == 'Avg' :
-                            encInfo.AvgGradient = result[index + 1]
-                    encInfo.YUVPsnrList.append( ( 6 * float(encInfo.YPsnrList[-1]) + float(encInfo.UPsnrList[-1]) + float(encInfo.VPsnrList[-1]) ) / 8 ) 
-    assert encInfo , 'Empty encInfo T T'
-    return encInfo
+    return read_information_log( TargetFile , LogLevel , 'HM' )
 
 def read_information_x265( TargetFile , LogLevel ) :
     '''
@@ -396,126 +1020,730 @@ def read_information_x265( TargetFile , LogLevel ) :
     :return encInfo
     ''' 
     encInfo = EncInfo()
+    encInfo.EncName = 'X265'
     if os.path.isfile( TargetFile ):
-        findResult = re.match( r'.*\/(.+?)\.txt', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(\D+_\d+).*\.log', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*\/(\D+_\d+).*\.csv', TargetFile )
-        if findResult :
-            encInfo.SeqName = findResult.group(1)
-        findResult = re.match( r'.*_(\d+)',encInfo.SeqName)
-        if findResult :
-            encInfo.SeqAvgQp = findResult.group(1)
-        fileHandle = open( TargetFile , 'r' )
-        chunks = fileHandle.readlines()
-        for index in range( len(chunks) ) :
-            if chunks[index] == '\n' :
-                continue
-            if LogLevel > 0 :
-                if index == len(chunks) - 1 :
-                    result = re.split(r',\s*', chunks[index])
-                    encInfo.AvgBitRate = result[4]
-                    encInfo.AvgYPsnr   = result[5]
-                    encInfo.AvgUPsnr   = result[6]
-                    encInfo.AvgVPsnr   = result[7]
-                    encInfo.AvgYUVPsnr = result[8]
-                    encInfo.EncTime    = result[2]
-                    continue
-            if LogLevel > 1 :
-                matchWord  = 'Encode'
-                findResult = search_result(chunks[index], matchWord, 0)
-                if findResult :
-                    continue
-                matchWord = 'Summary'
-                findResult = search_result(chunks[index], matchWord, 0)
-                if findResult :
-                    continue
-                matchWord = 'Command'
-                findResult = search_result(chunks[index], matchWord, 0)
-                if findResult :
-                    continue
-                result = re.split(r',\s*',chunks[index])
-                encInfo.FrameTypeList.append( result[1] )
-                encInfo.QPList.append( result[3])
-                encInfo.BitRateList.append( result[4] )
-                encInfo.YPsnrList.append( result[7] )
-                encInfo.UPsnrList.append( result[8] )
-                encInfo.VPsnrList.append( result[9] )
-                encInfo.YUVPsnrList.append( ( 6 * float(encInfo.YPsnrList[-1]) + float(encInfo.UPsnrList[-1]) + float(encInfo.VPsnrList[-1]) ) / 8 ) 
+        parse_sequence_name( TargetFile , encInfo , 'X265' )
+        if compress_type( TargetFile ) :
+            with open_compressed_lines( TargetFile ) as lines :
+                parse_information_csv( lines , encInfo , LogLevel )
+            return encInfo
+        if LogLevel == 1 :
+            tail_information_csv( TargetFile , encInfo )
+            return encInfo
+        with open_log_buffer( TargetFile ) as buffer :
+            parse_information_csv( buffer_lines( buffer ) , encInfo , LogLevel )
     assert encInfo , 'Empty encInfo T T'
     return encInfo
 
-read_information_enctype = {
-    'HM'    : read_information_hm    ,
-    'VTM'   : read_information_vtm   ,
+# Bytes at the Start of a Log Read to Identify its Encoder , Enough to Reach the First Per-Frame Lines after the Configuration Dump
+sniffBytes = 1 << 14
+
+# ( Encoder , Pattern ) Tried in Order on the Start of a Log , the Banner on its First Line , then the Syntax of its Per-Frame Lines
+encoderSniffList = [
+    ( 'X265'  , re.compile( rb'\A\s*(?:Encode Order\s*,|Command\s*,\s*Date/Time)' ) ) ,
+    ( 'HM'    , re.compile( rb'\A\s*HM software' ) ) ,
+    ( 'VTM'   , re.compile( rb'\A\s*VVCSoftware: VTM' ) ) ,
+    ( 'VVENC' , re.compile( rb'(?i)\A\s*vvenc' ) ) ,
+    ( 'HM'    , re.compile( rb'(?m)^POC\s+\d+ TId: \d+ \( [IPBipb]-SLICE, nQP' ) ) ,
+    ( 'VTM'   , re.compile( rb'(?m)^POC\s+\d+ LId:' ) ) ,
+    ( 'VVENC' , re.compile( rb'(?m)^POC\s+\d+ TId: \d+ \( \w+, [IPBipb]-SLICE, QP' ) ) ,
+]
+
+def sniff_encoder( Data ) :
+    '''
+    Identify the Encoder which Wrote a Log from Bytes Data at its Start
+    :return encType : None if no Encoder in encoderSniffList Matches
+    '''
+    for encType , pattern in encoderSniffList :
+        if pattern.search( Data ) :
+            return encType
+    return None
+
+def read_sniff_data( TargetFile ) :
+    '''
+    First sniffBytes Bytes of TargetFile , Decompressed if Compressed
+    '''
+    compressType = compress_type( TargetFile )
+    fileOpen     = importlib.import_module( compressModuleDict[compressType] ).open if compressType else open
+    with fileOpen( TargetFile , 'rb' ) as fileHandle :
+        return fileHandle.read( sniffBytes )
+
+def read_information_auto( TargetFile , LogLevel ) :
+    '''
+    Collect Output Information in TargetFile of the Encoder Identified from its First sniffBytes Bytes
+    A File of no Known Encoder Gives an Empty encInfo , Dropped by delete_nonsequence
+    :return encInfo
+    '''
+    encType = sniff_encoder( read_sniff_data( TargetFile ) ) if os.path.isfile( TargetFile ) else None
+    if encType is None :
+        print( 'GetInfo.py: Encoder of %s not Identified, Skipped' %TargetFile , file=sys.stderr )
+        return EncInfo()
+    return read_information_enctype.get( encType )( TargetFile , LogLevel )
+
+read_information_enctype = {
+    'HM'    : read_information_hm    ,
+    'VTM'   : read_information_vtm   ,
     'VVENC' : read_information_vvenc ,
     'X265'  : read_information_x265  ,
+    'auto'  : read_information_auto  ,
 }
 
-def read_information( TargetFileList , EncType , LogLevel ) :
+# Report of the Run Filled by profile_stage and profile_file when --Profile is On , None Keeps Every Stage Free of Profiling Cost
+profileReport = None
+# Bytes and Lines Read from the File profile_file is Reading , None Otherwise
+readCounter   = None
+
+def count_read( Bytes , Lines ) :
+    '''
+    Add Bytes and Lines Read from the Profiled File to readCounter
+    '''
+    readCounter['bytes'] += Bytes
+    readCounter['lines'] += Lines
+
+def count_lines( Buffer ) :
+    '''
+    Number of Lines in Bytes or mmap Buffer, Counted in Blocks for mmap
+    '''
+    if isinstance( Buffer , bytes ) :
+        return Buffer.count( b'\n' )
+    return sum( Buffer[start:start + mmapReleaseBlock].count( b'\n' ) for start in range( 0 , len( Buffer ) , mmapReleaseBlock ) )
+
+def profile_file( TargetFile , EncType , LogLevel , Member = None ) :
+    '''
+    Read Information from TargetFile, or from Member ( TargetFile , Data ) of an Archive or Prefetched , Recording Wall and CPU Time, Bytes and Lines Read and Frames Extracted
+    :return ( encInfo , fileStats )
     '''
-    Read Information from Files in TargetFileList
+    global readCounter
+    readCounter = { 'bytes' : 0 , 'lines' : 0 }
+    wallTime , cpuTime = time.perf_counter() , time.process_time()
+    try :
+        if Member is not None :
+            encInfo = read_information_member( Member , EncType , LogLevel )
+        else :
+            encInfo = read_information_enctype.get( EncType )( TargetFile , LogLevel )
+    finally :
+        counter , readCounter = readCounter , None
+    fileStats = { 'file'   : TargetFile ,
+                  'wall'   : time.perf_counter() - wallTime ,
+                  'cpu'    : time.process_time() - cpuTime ,
+                  'bytes'  : counter['bytes'] ,
+                  'lines'  : counter['lines'] ,
+                  'frames' : frame_count( encInfo ) }
+    return encInfo , fileStats
+
+def read_information_file( TargetFile , EncType , LogLevel , Profile = False ) :
+    '''
+    Read Information from TargetFile in a Worker Process, Catching Failure of the Parser
+    :return ( encInfo , errorMessage , fileStats ) : errorMessage is None if TargetFile is Parsed , fileStats is None unless Profile
+    '''
+    try :
+        if Profile :
+            encInfo , fileStats = profile_file( TargetFile , EncType , LogLevel )
+            return encInfo , None , fileStats
+        return read_information_enctype.get( EncType )( TargetFile , LogLevel ) , None , None
+    except Exception as error :
+        return None , '%s: %s' %( type( error ).__name__ , error ) , None
+
+def read_information_pairs( TargetFileList , EncType , LogLevel , Jobs = 1 ) :
+    '''
+    Read Information from Files in TargetFileList, with a Pool of Jobs Worker Processes if Jobs != 1
+    :return ( targetFile , encInfo ) of Each Read File in the Order of TargetFileList
+    '''
+    profile = profileReport is not None
+    if Jobs == 1 or len( TargetFileList ) < 2 :
+        for targetFile in TargetFileList :
+            if profile :
+                encInfo , fileStats = profile_file( targetFile , EncType , LogLevel )
+                profileReport['files'].append( fileStats )
+                yield targetFile , encInfo
+                continue
+            yield targetFile , read_information_enctype.get( EncType )( targetFile , LogLevel )
+        return
+    if Jobs < 1 :
+        Jobs = os.cpu_count() or 1
+    import multiprocessing
+    chunkSize = max( 1 , len( TargetFileList ) // ( Jobs * 4 ) )
+    worker = functools.partial( read_information_file , EncType=EncType , LogLevel=LogLevel , Profile=profile )
+    with multiprocessing.Pool( Jobs ) as pool :
+        # imap keeps the order of TargetFileList
+        for targetFile , ( encInfo , errorMessage , fileStats ) in zip( TargetFileList , pool.imap( worker , TargetFileList , chunkSize ) ) :
+            if errorMessage is not None :
+                print( 'GetInfo.py: Failed to Read %s ( %s )' %( targetFile , errorMessage ) , file=sys.stderr )
+                continue
+            if fileStats is not None :
+                profileReport['files'].append( fileStats )
+            yield targetFile , encInfo
+
+def read_information( TargetFileList , EncType , LogLevel , Jobs = 1 ) :
+    '''
+    Read Information from Files in TargetFileList, with a Pool of Jobs Worker Processes if Jobs != 1
     :return encInfoList : [ EncInfo1 , ... , EncInfoN ]
     ''' 
-    encInfoList = []
-    for targetFile in TargetFileList :
-        encInfo = read_information_enctype.get( EncType )( targetFile , LogLevel )
-        encInfoList.append( encInfo )
-    return encInfoList
+    return [ encInfo for targetFile , encInfo in read_information_pairs( TargetFileList , EncType , LogLevel , Jobs ) ]
+
+# Archive Types Accepted in Place of a Directory , Read in One Sequential Pass without Extraction
+archiveTypeList = [ '.tar' , '.tar.gz' , '.tgz' , '.tar.bz2' , '.tbz2' , '.tar.xz' , '.txz' , '.zip' ]
+# Bytes of Archive Members Handed to the Pool of Worker Processes at a Time
+archiveBatchBytes = 1 << 25
+
+def is_archive( TargetPath ) :
+    '''
+    Whether TargetPath is an Archive File of archiveTypeList
+    '''
+    return TargetPath.endswith( tuple( archiveTypeList ) ) and os.path.isfile( TargetPath )
+
+def select_member( ArchiveFile , MemberName , TargetFileType , walkOptions ) :
+    '''
+    Select an Archive Member as traverse_files Selects Files , Directories in MemberName being Sub-Directories of ArchiveFile
+    :return targetFile : ArchiveFile/MemberName , None if the Member is not Selected
+    '''
+    include , exclude , prune , maxDepth = walkOptions
+    dirNameList = [ name for name in MemberName.split( '/' ) if name not in ( '' , '.' ) ]
+    fileName    = dirNameList.pop() if dirNameList else ''
+    if maxDepth >= 0 and len( dirNameList ) > maxDepth :
+        return None
+    dirPath = ArchiveFile
+    for dirName in dirNameList :
+        dirPathList = select_dirs( dirPath , [ dirName ] , prune )
+        if not dirPathList :
+            return None
+        dirPath = dirPathList[0]
+    targetFileList = select_files( dirPath , [ fileName ] , TargetFileType , include , exclude )
+    return targetFileList[0] if targetFileList else None
+
+def iter_archive_members( ArchiveFile , Select ) :
+    '''
+    Read Members of ArchiveFile from Start to End , Reading the Data only of Members Selected by Select( MemberName )
+    :return ( targetFile , data ) of Each Selected Member in Archive Order , targetFile being the Path Returned by Select
+    '''
+    if ArchiveFile.endswith( '.zip' ) :
+        import zipfile
+        with zipfile.ZipFile( ArchiveFile ) as archive :
+            for member in sorted( archive.infolist() , key=lambda member : member.header_offset ) :
+                targetFile = None if member.is_dir() else Select( member.filename )
+                if targetFile is not None :
+                    yield targetFile , archive.read( member )
+        return
+    import tarfile
+    # stream mode reads the archive and any compression of it once , without seeking back
+    with tarfile.open( ArchiveFile , 'r|*' ) as archive :
+        for member in archive :
+            targetFile = Select( member.name ) if member.isfile() else None
+            if targetFile is not None :
+                yield targetFile , archive.extractfile( member ).read()
+
+def iter_member_batches( MemberIter ) :
+    '''
+    Group ( targetFile , data ) of MemberIter into Lists of about archiveBatchBytes Bytes
+    '''
+    batch , batchBytes = [] , 0
+    for member in MemberIter :
+        batch.append( member )
+        batchBytes += len( member[1] )
+        if batchBytes >= archiveBatchBytes :
+            yield batch
+            batch , batchBytes = [] , 0
+    if batch :
+        yield batch
+
+def read_information_member( Member , EncType , LogLevel ) :
+    '''
+    Collect Output Information of EncType Encoder from the Data of an Archive Member or a Prefetched File , Named by its Path as Files are
+    The File at the Path is Read if Data is None , the Encoder is Identified from the Data if EncType is auto
+    :return encInfo
+    '''
+    targetFile , data = Member
+    if data is None :
+        return read_information_enctype.get( EncType )( targetFile , LogLevel )
+    if compress_type( targetFile ) :
+        data = importlib.import_module( compressModuleDict[compress_type( targetFile )] ).decompress( data )
+    if readCounter is not None :
+        count_read( len( data ) , count_lines( data ) )
+    if EncType == 'auto' :
+        EncType = sniff_encoder( data[:sniffBytes] )
+        if EncType is None :
+            print( 'GetInfo.py: Encoder of %s not Identified, Skipped' %targetFile , file=sys.stderr )
+            return EncInfo()
+    encInfo = EncInfo()
+    encInfo.EncName = EncType
+    parse_sequence_name( targetFile , encInfo , EncType )
+    if EncType in logSyntaxDict :
+        parse_information_log( filter_log_lines( data , EncType ) , encInfo , LogLevel , EncType )
+    else :
+        parse_information_csv( buffer_lines( data ) , encInfo , LogLevel )
+    return encInfo
+
+def read_information_member_file( Member , EncType , LogLevel , Profile = False ) :
+    '''
+    Read Information from an Archive Member or a Prefetched File in a Worker Process, Catching Failure of the Parser
+    :return ( targetFile , encInfo , errorMessage , fileStats ) : errorMessage is None if the Member is Parsed , fileStats is None unless Profile
+    '''
+    try :
+        if Profile :
+            encInfo , fileStats = profile_file( Member[0] , EncType , LogLevel , Member )
+            return Member[0] , encInfo , None , fileStats
+        return Member[0] , read_information_member( Member , EncType , LogLevel ) , None , None
+    except Exception as error :
+        return Member[0] , None , '%s: %s' %( type( error ).__name__ , error ) , None
+
+def read_member_pairs( MemberIter , EncType , LogLevel ) :
+    '''
+    Read Information from Archive Members or Prefetched Files of MemberIter in this Process , Profiled if --Profile is On
+    :return ( targetFile , encInfo ) of Each Member in the Order of MemberIter
+    '''
+    for member in MemberIter :
+        if profileReport is not None :
+            encInfo , fileStats = profile_file( member[0] , EncType , LogLevel , member )
+            profileReport['files'].append( fileStats )
+            yield member[0] , encInfo
+            continue
+        yield member[0] , read_information_member( member , EncType , LogLevel )
+
+def collect_member_results( ResultIter ) :
+    '''
+    Yield ( targetFile , encInfo ) of Members Parsed by read_information_member_file , Reporting Failures and Keeping Profiled fileStats
+    '''
+    for targetFile , encInfo , errorMessage , fileStats in ResultIter :
+        if errorMessage is not None :
+            print( 'GetInfo.py: Failed to Read %s ( %s )' %( targetFile , errorMessage ) , file=sys.stderr )
+            continue
+        if fileStats is not None :
+            profileReport['files'].append( fileStats )
+        yield targetFile , encInfo
+
+def read_archive_pairs( ArchiveFile , TargetFileType , EncType , LogLevel , Include = None , Exclude = None , Prune = None , MaxDepth = -1 , Jobs = 1 ) :
+    '''
+    Read Information from Members of ArchiveFile with TargetFileType in One Sequential Pass , Filtered as traverse_files Filters Files
+    Members are Parsed by a Pool of Jobs Worker Processes if Jobs != 1 , while the Next Batch of Members is Read
+    :return ( targetFile , encInfo ) of Each Read Member in Archive Order , targetFile being ArchiveFile/MemberName
+    '''
+    walkOptions = ( compile_patterns( Include ) , compile_patterns( Exclude ) , compile_patterns( Prune ) , MaxDepth )
+    memberIter  = iter_archive_members( ArchiveFile , lambda memberName : select_member( ArchiveFile , memberName , TargetFileType , walkOptions ) )
+    if Jobs == 1 :
+        yield from read_member_pairs( memberIter , EncType , LogLevel )
+        return
+    if Jobs < 1 :
+        Jobs = os.cpu_count() or 1
+    import multiprocessing
+    worker = functools.partial( read_information_member_file , EncType=EncType , LogLevel=LogLevel , Profile=profileReport is not None )
+    with multiprocessing.Pool( Jobs ) as pool :
+        pending = None
+        for batch in itertools.chain( iter_member_batches( memberIter ) , [ None ] ) :
+            # the batch just read is handed to the pool before the results of the previous one are collected
+            submitted = pool.imap( worker , batch , max( 1 , len( batch ) // ( Jobs * 4 ) ) ) if batch is not None else None
+            if pending is None :
+                pending = submitted
+                continue
+            resultIter = pending
+            pending    = submitted
+            yield from collect_member_results( resultIter )
+
+# Files not Larger than prefetchFileLimit Bytes are Read Whole by Prefetch Threads in Pipeline Mode , Larger Files by their Parsers
+prefetchFileLimit = mmapThreshold
+
+def discover_files( TargetFilePath , TargetFileType , walkOptions , FileQueue ) :
+    '''
+    Put Files Walked under TargetFilePath into FileQueue in the Order of os.walk , then writeQueueEnd
+    '''
+    try :
+        for targetFile in walk_files( TargetFilePath , 0 , TargetFileType , walkOptions ) :
+            FileQueue.put( targetFile )
+    finally :
+        FileQueue.put( writeQueueEnd )
+
+def prefetch_file( TargetFile ) :
+    '''
+    Read TargetFile into Memory if not Larger than prefetchFileLimit , so its Parser does not Wait for Storage
+    :return ( targetFile , data ) : data is None if TargetFile is Larger or Unreadable , then Read by its Parser
+    '''
+    try :
+        with open( TargetFile , 'rb' ) as fileHandle :
+            if os.fstat( fileHandle.fileno() ).st_size <= prefetchFileLimit :
+                return TargetFile , fileHandle.read()
+    except OSError :
+        pass
+    return TargetFile , None
+
+def prefetch_files( TargetFileIter , Jobs , QueueSize ) :
+    '''
+    Prefetch Files of TargetFileIter with a Pool of Jobs Threads , at most QueueSize Files ahead of the Caller
+    :return ( targetFile , data ) of Each File in the Order of TargetFileIter
+    '''
+    import collections
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor( max( 1 , Jobs ) ) as executor :
+        pending = collections.deque()
+        for targetFile in TargetFileIter :
+            pending.append( executor.submit( prefetch_file , targetFile ) )
+            if len( pending ) >= QueueSize :
+                yield pending.popleft().result()
+        while pending :
+            yield pending.popleft().result()
+
+def bounded_iter( Iterable , Semaphore , StopEvent ) :
+    '''
+    Yield Items of Iterable , Each after Acquiring Semaphore , until StopEvent is Set
+    '''
+    for item in Iterable :
+        Semaphore.acquire()
+        if StopEvent.is_set() :
+            return
+        yield item
+
+def read_pipeline_pairs( TargetFilePath , TargetFileType , EncType , LogLevel , Include = None , Exclude = None , Prune = None , MaxDepth = -1 ,
+                         Jobs = 1 , PrefetchJobs = 8 , QueueSize = 64 , ListCache = None ) :
+    '''
+    Read Information from Files under TargetFilePath with Walking , Prefetching and Parsing Running Concurrently
+    A Walker Thread Feeds PrefetchJobs Reader Threads , which Feed the Parsers , a Pool of Jobs Worker Processes if Jobs != 1 ,
+    Each Stage Holding at most QueueSize Files , so a Slow Stage Holds back the Others and Memory Stays Bounded
+    At LogLevel 1 Files are not Prefetched , as their Parsers Seek to the Summary at the End of Each File
+    The Pool is Forked before Any Thread Starts , so no Worker Inherits a Lock Held by a Thread
+    :return ( targetFile , encInfo ) of Each Read File in the Order of traverse_files
+    '''
+    if Jobs < 1 :
+        Jobs = os.cpu_count() or 1
+    with contextlib.ExitStack() as stack :
+        if Jobs != 1 :
+            import multiprocessing
+            pool = stack.enter_context( multiprocessing.Pool( Jobs ) )
+        fileQueue = queue.Queue( QueueSize )
+        walker    = threading.Thread( target=discover_files , args=( TargetFilePath , TargetFileType , walk_options( Include , Exclude , Prune , MaxDepth , ListCache ) , fileQueue ) , daemon=True )
+        walker.start()
+        if LogLevel == 1 :
+            memberIter = ( ( targetFile , None ) for targetFile in iter_queue( fileQueue ) )
+        else :
+            memberIter = prefetch_files( iter_queue( fileQueue ) , PrefetchJobs , QueueSize )
+        if Jobs == 1 :
+            yield from read_member_pairs( memberIter , EncType , LogLevel )
+            return
+        worker    = functools.partial( read_information_member_file , EncType=EncType , LogLevel=LogLevel , Profile=profileReport is not None )
+        semaphore = threading.Semaphore( QueueSize )
+        stopEvent = threading.Event()
+        try :
+            # the pool is handed a File only when one of the QueueSize Files in Flight is Collected
+            for result in pool.imap( worker , bounded_iter( memberIter , semaphore , stopEvent ) , max( 1 , QueueSize // ( Jobs * 4 ) ) ) :
+                semaphore.release()
+                yield from collect_member_results( [ result ] )
+        finally :
+            # let the task handler of the pool leave bounded_iter before the pool is terminated
+            stopEvent.set()
+            semaphore.release()
+
+# File Type of Logs Written by Each Encoder, Read under Directories Passed to iter_encinfo without ReadFileType , All of them for auto
+# Its Order is the Order of Encoders in a Result of Several Encoders
+encoderFileTypeDict = {
+    'HM'    : '.log' ,
+    'VTM'   : '.log' ,
+    'VVENC' : '.txt' ,
+    'X265'  : '.csv' ,
+}
+
+def iter_encinfo( TargetPath , EncType , LogLevel , ReadFileType = None , Jobs = 1 ) :
+    '''
+    Read Information from a File , Directory or Archive TargetPath , or a List of them , Yielding Each encInfo as Soon as its File is Parsed
+    Directories and Archives are Searched for Files of ReadFileType , by Default the File Type of EncType in encoderFileTypeDict ,
+    EncType auto Identifies the Encoder of Each File
+    Only the encInfo being Yielded is Held, so a Caller Consuming encInfo as they Come Runs in Constant Memory
+    :return iterator of encInfo in the Order of Traversed Files
+    '''
+    targetPathList = [ TargetPath ] if isinstance( TargetPath , str ) else list( TargetPath )
+    readFileType   = ReadFileType or ( sorted( set( encoderFileTypeDict.values() ) ) if EncType == 'auto' else encoderFileTypeDict[EncType] )
+    for archive , targetPathGroup in itertools.groupby( targetPathList , key=is_archive ) :
+        if archive :
+            for archiveFile in targetPathGroup :
+                for targetFile , encInfo in read_archive_pairs( archiveFile , readFileType , EncType , LogLevel , Jobs=Jobs ) :
+                    yield encInfo
+            continue
+        targetFileList = []
+        for targetPath in targetPathGroup :
+            if os.path.isdir( targetPath ) :
+                targetFileList.extend( traverse_files( targetPath , readFileType ) )
+            else :
+                targetFileList.append( targetPath )
+        for targetFile , encInfo in read_information_pairs( targetFileList , EncType , LogLevel , Jobs ) :
+            yield encInfo
+
+# Bump cacheVersion whenever EncInfo or the Parsers Change, so Stale Entries are Dropped
+cacheVersion = 2
+
+def pack_encinfo( encInfo ) :
+    '''
+    Serialize encInfo to Bytes, Independent of the Module Name of EncInfo
+    :return data
+    '''
+    return pickle.dumps( tuple( getattr( encInfo , name ) for name in EncInfo.__slots__ ) , pickle.HIGHEST_PROTOCOL )
+
+def unpack_encinfo( Data ) :
+    '''
+    Deserialize Bytes Written by pack_encinfo
+    :return encInfo
+    '''
+    encInfo = EncInfo()
+    for name , value in zip( EncInfo.__slots__ , pickle.loads( Data ) ) :
+        setattr( encInfo , name , value )
+    return encInfo
+
+def open_cache( CacheFile , CacheClear ) :
+    '''
+    Open Parse Cache in SQLite Database CacheFile, Dropping its Entries if CacheClear or Written by Another cacheVersion
+    :return connection
+    '''
+    import sqlite3
+    connection = sqlite3.connect( CacheFile )
+    version    = connection.execute( 'PRAGMA user_version' ).fetchone()[0]
+    if CacheClear or version != cacheVersion :
+        connection.execute( 'DROP TABLE IF EXISTS encinfo' )
+        connection.execute( 'PRAGMA user_version = %d' %cacheVersion )
+    connection.execute( 'CREATE TABLE IF NOT EXISTS encinfo ( path TEXT , encoder TEXT , loglevel INTEGER , size INTEGER , mtime INTEGER , data BLOB , PRIMARY KEY ( path , encoder , loglevel ) )' )
+    connection.commit()
+    return connection
+
+def file_signature( TargetFile ) :
+    '''
+    Size and Modification Time of TargetFile Checked against Parse Cache
+    :return ( size , mtime ) : None if TargetFile is not Accessible
+    '''
+    try :
+        fileStat = os.stat( TargetFile )
+    except OSError :
+        return None
+    return fileStat.st_size , fileStat.st_mtime_ns
+
+# Rows of Newly Parsed Files Inserted into the Parse Cache at Once
+cacheInsertRows = 256
+
+def read_information_cached_pairs( TargetFileList , EncType , LogLevel , Jobs , CacheFile , CacheClear = False , CachePrune = False ) :
+    '''
+    Read Information from Files in TargetFileList, Parsing only Files Changed since Stored in Parse Cache CacheFile
+    Cached encInfo are Unpacked and Changed Files Parsed as they are Yielded , so only the encInfo being Yielded is Held
+    :return ( targetFile , encInfo ) of Each Read File in the Order of TargetFileList
+    '''
+    connection = open_cache( CacheFile , CacheClear )
+    try :
+        entryDict = { path : ( size , mtime ) for path , size , mtime in
+                      connection.execute( 'SELECT path , size , mtime FROM encinfo WHERE encoder = ? AND loglevel = ?' , ( EncType , LogLevel ) ) }
+        signatureDict = {}
+        missFileList  = []
+        for targetFile in TargetFileList :
+            signature = file_signature( targetFile )
+            if signature is None or entryDict.get( targetFile ) != signature :
+                signatureDict[targetFile] = signature
+                missFileList.append( targetFile )
+        # changed files are parsed in order , Failed Files are Left out by read_information_pairs
+        missIter = read_information_pairs( missFileList , EncType , LogLevel , Jobs )
+        missPair = next( missIter , None )
+        rowList  = []
+        for targetFile in TargetFileList :
+            if targetFile not in signatureDict :
+                data , = connection.execute( 'SELECT data FROM encinfo WHERE path = ? AND encoder = ? AND loglevel = ?' , ( targetFile , EncType , LogLevel ) ).fetchone()
+                yield targetFile , unpack_encinfo( data )
+                continue
+            if missPair is None or missPair[0] != targetFile :
+                continue
+            encInfo = missPair[1]
+            signature = signatureDict[targetFile]
+            if signature is not None :
+                rowList.append( ( targetFile , EncType , LogLevel ) + signature + ( pack_encinfo( encInfo ) , ) )
+            if len( rowList ) >= cacheInsertRows :
+                connection.executemany( 'INSERT OR REPLACE INTO encinfo VALUES ( ? , ? , ? , ? , ? , ? )' , rowList )
+                rowList = []
+            yield targetFile , encInfo
+            missPair = next( missIter , None )
+        connection.executemany( 'INSERT OR REPLACE INTO encinfo VALUES ( ? , ? , ? , ? , ? , ? )' , rowList )
+        if CachePrune :
+            targetFileSet = set( TargetFileList )
+            connection.executemany( 'DELETE FROM encinfo WHERE path = ?' , [ ( path , ) for path , in connection.execute( 'SELECT DISTINCT path FROM encinfo' ) if path not in targetFileSet ] )
+        connection.commit()
+    finally :
+        connection.close()
+
+def read_information_cached( TargetFileList , EncType , LogLevel , Jobs , CacheFile , CacheClear = False , CachePrune = False ) :
+    '''
+    Read Information from Files in TargetFileList, Parsing only Files Changed since Stored in Parse Cache CacheFile
+    :return encInfoList : [ EncInfo1 , ... , EncInfoN ]
+    '''
+    return [ encInfo for targetFile , encInfo in read_information_cached_pairs( TargetFileList , EncType , LogLevel , Jobs , CacheFile , CacheClear , CachePrune ) ]
+
+def parse_shard( Shard ) :
+    '''
+    Index and Count of Shards in Shard Written as "i/N" , 0 <= i < N
+    :return ( shardIndex , shardCount )
+    '''
+    shardIndex , slash , shardCount = Shard.partition( '/' )
+    assert slash and shardIndex.isdigit() and shardCount.isdigit() and int( shardIndex ) < int( shardCount ) , 'Shard must be i/N with 0 <= i < N T T'
+    return int( shardIndex ) , int( shardCount )
+
+def shard_files( TargetFileList , RootPath , ShardIndex , ShardCount ) :
+    '''
+    Files of TargetFileList in Shard ShardIndex of ShardCount , by CRC32 of their Path Relative to RootPath , so Nodes Mounting RootPath Elsewhere Agree
+    :return traverseIndexDict : Dict < TargetFile : Index in TargetFileList > of the Files of the Shard , in the Order of TargetFileList
+    '''
+    import zlib
+    return { targetFile : traverseIndex for traverseIndex , targetFile in enumerate( TargetFileList )
+             if zlib.crc32( os.path.relpath( targetFile , RootPath ).replace( os.sep , '/' ).encode() ) % ShardCount == ShardIndex }
+
+def write_partial( TargetPairIter , TraverseIndexDict , PartialFile , Header ) :
+    '''
+    Write encInfo Read by a Shard to PartialFile as a Stream of Pickles as they Come , Header Dict First ,
+    then ( traverseIndex , pack_encinfo( encInfo ) ) per File , Renamed into Place once Complete
+    :return count : Number of encInfo Written
+    '''
+    count = 0
+    with open( PartialFile + '.tmp' , 'wb' ) as fileHandle :
+        pickle.dump( Header , fileHandle , pickle.HIGHEST_PROTOCOL )
+        for targetFile , encInfo in TargetPairIter :
+            pickle.dump( ( TraverseIndexDict[targetFile] , pack_encinfo( encInfo ) ) , fileHandle , pickle.HIGHEST_PROTOCOL )
+            count += 1
+    os.replace( PartialFile + '.tmp' , PartialFile )
+    return count
+
+def read_partial_header( PartialFile ) :
+    '''
+    Header Dict of PartialFile Written by write_partial
+    '''
+    with open( PartialFile , 'rb' ) as fileHandle :
+        return pickle.load( fileHandle )
+
+def iter_partial( PartialFile ) :
+    '''
+    Yield ( traverseIndex , encInfo ) Stored in PartialFile , Unpacked One at a Time
+    '''
+    with open( PartialFile , 'rb' ) as fileHandle :
+        pickle.load( fileHandle )
+        while True :
+            try :
+                traverseIndex , data = pickle.load( fileHandle )
+            except EOFError :
+                return
+            yield traverseIndex , unpack_encinfo( data )
+
+def merge_partials( PartialFileList ) :
+    '''
+    Merge encInfo of PartialFileList , One per Shard of a Run , Back into the Traverse Order of a Single-Process Run
+    Each Partial is in Traverse Order , so they are Merged in One Streaming Pass
+    :return ( header , iterator of encInfo )
+    '''
+    import heapq
+    headerList = [ read_partial_header( partialFile ) for partialFile in PartialFileList ]
+    header     = headerList[0]
+    for partialFile , partialHeader in zip( PartialFileList , headerList ) :
+        assert partialHeader['Version'] == cacheVersion , 'Partial %s Written by Another cacheVersion T T' %partialFile
+        assert all( partialHeader[key] == header[key] for key in ( 'ShardCount' , 'EncoderName' , 'LogLevel' ) ) , 'Partial %s of Another Run T T' %partialFile
+    assert sorted( partialHeader['Shard'] for partialHeader in headerList ) == list( range( header['ShardCount'] ) ) , 'Partials must be Every Shard of a Run Once T T'
+    pairIter = heapq.merge( *[ iter_partial( partialFile ) for partialFile in PartialFileList ] , key=lambda pair : pair[0] )
+    return header , ( encInfo for traverseIndex , encInfo in pairIter )
 
 def delete_nonsequence( EncInfoList ) :
     '''
     Delete encInfo with empty SeqName in EncInfoList
     :return encInfoList : [ EncInfo1 , ... , EncInfoN ]
     ''' 
-    encInfoList = []
+    return list( filter_encinfo( EncInfoList ) )
+
+def filter_encinfo( EncInfoList , Sequence = None , QP = None , Predicate = None ) :
+    '''
+    Keep encInfo with SeqName in EncInfoList , Any Iterable , Lazily
+    Sequence : Glob Patterns of SeqName , QP : QPs of SeqAvgQp , Predicate : Function of encInfo , Each Skipped if None
+    :return iterator of encInfo
+    '''
+    seqPatternList = compile_patterns( [ Sequence ] if isinstance( Sequence , str ) else Sequence )
+    qpSet          = set( QP ) if QP is not None else None
     for encInfo in EncInfoList :
-        if encInfo.SeqName != '' :
-            encInfoList.append( encInfo )
-    return encInfoList
+        if encInfo.SeqName == '' :
+            continue
+        if seqPatternList and not match_patterns( seqPatternList , encInfo.SeqName , encInfo.SeqName ) :
+            continue
+        if qpSet is not None and encInfo.SeqAvgQp not in qpSet :
+            continue
+        if Predicate is not None and not Predicate( encInfo ) :
+            continue
+        yield encInfo
 
-def sort_sequence_vvc ( EncInfoList ) :
+def sequence_key( encInfo ) :
     '''
-    Sort encInfo with SeqName in EncInfoList due to VVC SDR CTC
-    :return encInfoList : [ EncInfo1 , ... , EncInfoN ]
-    ''' 
-    encInfoList = []
-    for videoName in vvcvideoDict : 
-        regex = re.compile(r'(%s)' %videoName)
-        flag  = 1
-        for encInfo in EncInfoList : 
-            if regex.match( encInfo.SeqName ) :
-                encInfoList.append( encInfo )
-                flag = 0
-        if flag :
-            uncodedEncInfo = EncInfo()
-            uncodedEncInfo.SeqName = videoName
-            encInfoList.append( uncodedEncInfo )
-    return encInfoList
+    Name of the Sequence of encInfo without its QP, Shared by All QPs of a Rate-Distortion Curve
+    :return seqKey
+    '''
+    findResult = seqKeyPattern.match( encInfo.SeqName )
+    return findResult.group(1) if findResult else encInfo.SeqName
+
+def video_name( SeqName ) :
+    '''
+    Name of the CTC Video in SeqName, the First Word before "_"
+    :return videoName
+    '''
+    return SeqName.split( '_' )[0]
 
-def sort_sequence_hevc ( EncInfoList ) :
+def load_ctc_file( CtcFile , CtcType ) :
     '''
-    Sort encInfo with SeqName in EncInfoList due to HEVC SDR CTC
+    Load the Video List and Classes of CtcType from CtcFile, One "[Class] VideoName" per Line, "#" for Comments
+    '''
+    videoList , classDict = [] , {}
+    with open( CtcFile , 'r' ) as fileHandle :
+        for line in fileHandle :
+            words = line.split( '#' )[0].split()
+            if not words :
+                continue
+            videoList.append( words[-1] )
+            if len( words ) > 1 :
+                classDict[words[-1]] = words[0]
+    ctcvideoDict[CtcType] = videoList
+    ctcclassDict[CtcType] = classDict
+
+def ctc_video_order( CtcType ) :
+    '''
+    Video Names of CtcType Ordered by Class , then by their Place in the Video List
+    :return videoList : [ VideoName1 , ... , VideoNameN ]
+    '''
+    videoList = ctcvideoDict.get( CtcType )
+    classDict = ctcclassDict.get( CtcType )
+    classRankDict = {}
+    for videoName in videoList :
+        classRankDict.setdefault( classDict.get( videoName , '' ) , len( classRankDict ) )
+    return sorted( videoList , key=lambda videoName : classRankDict[classDict.get( videoName , '' )] )
+
+def sequence_order( encInfo ) :
+    '''
+    Order of encInfo among Files of the Same Video , by Sequence , then by QP
+    '''
+    return ( sequence_key( encInfo ) , encInfo.SeqAvgQp is None , encInfo.SeqAvgQp or 0 )
+
+def sort_sequence( EncInfoList , CtcType ) :
+    '''
+    Sort encInfo with SeqName in EncInfoList due to CtcType CTC, by Encoder in the Order of encoderFileTypeDict , Class , Sequence , then QP
+    Videos of the CTC without Any encInfo of an Encoder Get an Uncoded encInfo if ctcplaceholderDict Says so
     :return encInfoList : [ EncInfo1 , ... , EncInfoN ]
-    ''' 
+    '''
+    encoderDict = {}
+    for encInfo in EncInfoList :
+        encoderDict.setdefault( encInfo.EncName , {} ).setdefault( video_name( encInfo.SeqName ) , [] ).append( encInfo )
+    encoderRankDict = { encType : rank for rank , encType in enumerate( encoderFileTypeDict ) }
+    placeholder = ctcplaceholderDict.get( CtcType , True )
     encInfoList = []
-    for encInfo in EncInfoList : 
-        for videoName in hevcvideoDict : 
-            regex = re.compile(r'(%s)' %videoName)
-            if regex.match( encInfo.SeqName ) :
-                encInfoList.append( encInfo )
+    # an Empty EncInfoList still Gets the Placeholders of One Unnamed Encoder
+    for encName in sorted( encoderDict or { '' : {} } , key=lambda encName : ( encoderRankDict.get( encName , len( encoderRankDict ) ) , encName ) ) :
+        videoDict = encoderDict.get( encName , {} )
+        for videoName in ctc_video_order( CtcType ) :
+            if videoName in videoDict :
+                encInfoList.extend( sorted( videoDict.pop( videoName ) , key=sequence_order ) )
+            elif placeholder :
+                uncodedEncInfo = EncInfo()
+                uncodedEncInfo.SeqName = videoName
+                uncodedEncInfo.EncName = encName
+                encInfoList.append( uncodedEncInfo )
     return encInfoList
 
-sort_sequence_ctc = {
-    'HEVC'  : sort_sequence_hevc  ,
-    'VVC'   : sort_sequence_vvc   ,
+ctcplaceholderDict = {
+    'HEVC'  : False ,
+    'VVC'   : True  ,
 }
 
-def create_file_log( WriteFilePath , WriteFileName ) :
-    fullFilePath = WriteFilePath + WriteFileName + '.log'
+def create_file( WriteFilePath , WriteFileName , WriteFileType ) :
+    '''
+    Create an Empty Result File WriteFileName of WriteFileType under WriteFilePath , Replacing an Old One and Creating WriteFilePath if Missing
+    '''
+    assert WriteFileType in write_information_filetype , "Unknown Write File Type %s T T" %WriteFileType
+    fullFilePath = WriteFilePath + WriteFileName + WriteFileType
     if os.path.exists( fullFilePath ) :
         os.remove( fullFilePath )
         os.mknod( fullFilePath )
@@ -524,165 +1752,1266 @@ def create_file_log( WriteFilePath , WriteFileName ) :
     else :
         os.mkdir( WriteFilePath )
         os.mknod( fullFilePath )
+    assert os.path.exists( fullFilePath ) , "Target Write File UnCreated T T"
 
-def create_file_txt( WriteFilePath , WriteFileName ) :
-    fullFilePath = WriteFilePath + WriteFileName + '.txt'
-    if os.path.exists( fullFilePath ) :
-        os.remove( fullFilePath )
-        os.mknod( fullFilePath )
-    elif os.path.exists( WriteFilePath ) :
-        os.mknod( fullFilePath )
-    else :
-        os.mkdir( WriteFilePath )
-        os.mknod( fullFilePath )
+# Rows Rendered before Each Buffered Write of Text Result Files
+textChunkRows = 4096
+# Bytes of Per-Frame Text Held in Memory before it is Spooled to a Temporary File
+textSpoolSize = 1 << 22
 
-def create_file_csv( WriteFilePath , WriteFileName ) :
-    None
+def render_summary_text( encInfo , ShowEncoder = False ) :
+    row = "%-7s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \t%-13s \t%-13s " %( format_field( encInfo , 'SeqAvgQp' ) , format_field( encInfo , 'AvgBitRate' ) , format_field( encInfo , 'AvgYUVPsnr' ) , \
+                                                                           format_field( encInfo , 'AvgYPsnr' ) , format_field( encInfo , 'AvgUPsnr' ) , format_field( encInfo , 'AvgVPsnr' ) , \
+                                                                           format_field( encInfo , 'EncTime' ) , encInfo.SeqName )
+    return row + ( "\t%-7s \n" %encInfo.EncName if ShowEncoder else "\n" )
 
-def create_file_xlsx( WriteFilePath , WriteFileName ) :
-    fullFilePath = WriteFilePath + WriteFileName + '.xlsx'
-    if os.path.exists( fullFilePath ) :
-        os.remove( fullFilePath )
-        dataFrame = pandas.DataFrame()
-        dataFrame.to_excel( fullFilePath )
-    elif os.path.exists( WriteFilePath ) :
-        dataFrame = pandas.DataFrame()
-        dataFrame.to_excel( fullFilePath )
-    else :
-        os.mkdir( WriteFilePath )
-        dataFrame = pandas.DataFrame()
-        dataFrame.to_excel( fullFilePath )
+def render_frame_text( encInfo , ShowEncoder = False ) :
+    # write Header Information
+    rowList = [ "%-13s \t%-13s \n" %( "Sequence" , encInfo.SeqName ) ] + ( [ "%-13s \t%-13s \n" %( "Encoder" , encInfo.EncName ) ] if ShowEncoder else [] ) + [
+                "%-13s \t%-5s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \n" %( "SliceType" , "QP" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr" ) ]
+    qpDigits , bitRateDigits , yDigits , uDigits , vDigits = [ encInfo.Digits.get( column , 0 ) for column in ( 'QPList' , 'BitRateList' , 'YPsnrList' , 'UPsnrList' , 'VPsnrList' ) ]
+    rowList.extend( "%-13s \t%-5.*f \t%-13.*f \t%-.4f \t%-7.*f \t%-7.*f \t%-7.*f \n" %( frameTypeDict[frameType] , qpDigits , qp , bitRateDigits , bitRate , yuvPsnr ,
+                                                                                     yDigits , yPsnr , uDigits , uPsnr , vDigits , vPsnr )
+                    for frameType , qp , bitRate , yuvPsnr , yPsnr , uPsnr , vPsnr in zip( encInfo.FrameTypeList , encInfo.QPList , encInfo.BitRateList , encInfo.YUVPsnrList ,
+                                                                                           encInfo.YPsnrList , encInfo.UPsnrList , encInfo.VPsnrList ) )
+    return ''.join( rowList )
 
+def write_information_text( EncInfoList , FullFilePathList , LogLevel , ShowEncoder = False ) :
+    '''
+    Render Text of EncInfoList Once and Append it to Every File in FullFilePathList, in a Single Pass over EncInfoList
+    Per-Frame Sections Follow All Summary Rows, so they are Spooled until EncInfoList Ends
+    ShowEncoder Adds an Encoder Column to Summary Rows and an Encoder Line to Per-Frame Sections , for Results of Several Encoders
+    '''
+    with contextlib.ExitStack() as stack :
+        fileHandleList = [ stack.enter_context( open( fullFilePath , 'a' ) ) for fullFilePath in FullFilePathList ]
+        frameHandle    = stack.enter_context( tempfile.SpooledTemporaryFile( textSpoolSize , mode='w+' ) ) if LogLevel > 1 else None
+        rowList = []
+        if LogLevel > 0 :
+            # write Header Information
+            rowList.append( "%-7s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \t%-13s \t%-13s " %( "Qp" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr", "EncTime", "Sequence" ) +
+                            ( "\t%-7s \n" %"Encoder" if ShowEncoder else "\n" ) )
+        for encInfo in EncInfoList :
+            if LogLevel > 0 :
+                rowList.append( render_summary_text( encInfo , ShowEncoder ) )
+            if frameHandle is not None :
+                frameHandle.write( render_frame_text( encInfo , ShowEncoder ) )
+            if len( rowList ) >= textChunkRows :
+                chunk = ''.join( rowList )
+                for fileHandle in fileHandleList :
+                    fileHandle.write( chunk )
+                rowList = []
+        chunk = ''.join( rowList )
+        for fileHandle in fileHandleList :
+            fileHandle.write( chunk )
+        if frameHandle is not None :
+            frameHandle.seek( 0 )
+            for chunk in iter( functools.partial( frameHandle.read , textSpoolSize ) , '' ) :
+                for fileHandle in fileHandleList :
+                    fileHandle.write( chunk )
 
-create_file_filetype = {
-    '.log'  : create_file_log  ,
-    '.txt'  : create_file_txt  ,
-    '.csv'  : create_file_csv  ,
-    '.xlsx' : create_file_xlsx ,
-}
+def write_information_log( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
+    write_information_text( EncInfoList , [ WriteFilePath + WriteFileName + '.log' ] , LogLevel )
 
-def create_file( WriteFilePath , WriteFileName , WriteFileType ) :
-    fullFilePath = WriteFilePath + WriteFileName + WriteFileType
-    create_file_filetype.get(WriteFileType)( WriteFilePath , WriteFileName )
-    assert os.path.exists( fullFilePath ) , "Target Write File UnCreated T T"
+def write_information_txt( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
+    write_information_text( EncInfoList , [ WriteFilePath + WriteFileName + '.txt' ] , LogLevel )
 
-def write_information_log( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
-   fullFilePath = WriteFilePath + WriteFileName + '.log'
-   fileHandle = open( fullFilePath , 'a' )
-       
-   if LogLevel > 0 :
-        # write Header Information
-        fileHandle.write( "%-7s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \t%-13s \t%-13s \n" %( "Qp" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr", "EncTime", "Sequence" ) )
-        for encInfo in EncInfoList :
-            fileHandle.write( "%-7s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \t%-13s \t%-13s \n" %( encInfo.SeqAvgQp , encInfo.AvgBitRate , encInfo.AvgYUVPsnr , encInfo.AvgYPsnr , encInfo.AvgUPsnr , encInfo.AvgVPsnr , encInfo.EncTime , encInfo.SeqName ) )
-   if LogLevel > 1 :
+# Columns of Tabular Result Files and the EncInfo Field of Each
+summaryColumnList = [ ( 'Qp' , 'SeqAvgQp' ) , ( 'BitRate' , 'AvgBitRate' ) , ( 'AvgPsnr' , 'AvgYUVPsnr' ) , ( 'YPsnr' , 'AvgYPsnr' ) , ( 'UPsnr' , 'AvgUPsnr' ) ,
+                      ( 'VPsnr' , 'AvgVPsnr' ) , ( 'EncTime' , 'EncTime' ) , ( 'Sequence' , 'SeqName' ) , ( 'AvgGradient' , 'AvgGradient' ) , ( 'Encoder' , 'EncName' ) ]
+# Summary Fields Written as Text , not as Numbers
+summaryTextFieldList = [ 'SeqName' , 'EncName' ]
+frameColumnList   = [ ( 'QP' , 'QPList' ) , ( 'BitRate' , 'BitRateList' ) , ( 'AvgPsnr' , 'YUVPsnrList' ) , ( 'YPsnr' , 'YPsnrList' ) ,
+                      ( 'UPsnr' , 'UPsnrList' ) , ( 'VPsnr' , 'VPsnrList' ) , ( 'Gradient' , 'GradientList' ) ]
+# Per-Frame array Columns of EncInfo
+frameFieldList    = [ 'FrameTypeList' ] + [ field for column , field in frameColumnList ]
+
+def frame_count( encInfo ) :
+    '''
+    Number of Frames Read into encInfo, the Longest of its Per-Frame Lists
+    '''
+    return max( len( getattr( encInfo , field ) ) for field in frameFieldList )
+
+class FrameSpill:
+    '''
+    Class to Bound the Memory Held by Per-Frame Columns of encInfo , Spilling them to a Temporary File under SpillPath once MaxBytes are Held
+    A Spilled encInfo Keeps its Summary and Empty Columns , OffsetDict Keeps ( encInfo , Offset , Column Lengths ) by its id ,
+    the Reference Keeping the id from being Reused
+    '''
+    __slots__ = ( 'MaxBytes' , 'HeldBytes' , 'OffsetDict' , 'FileHandle' )
+    def __init__(self , MaxBytes , SpillPath = None) :
+        self.MaxBytes   = MaxBytes
+        self.HeldBytes  = 0
+        self.OffsetDict = {}
+        self.FileHandle = tempfile.TemporaryFile( prefix='GetInfo' , suffix='.spill' , dir=SpillPath or None )
+    def spill(self , EncInfoList) :
+        '''
+        Yield encInfo in EncInfoList as they Come , those beyond MaxBytes with their Columns Appended to the Spill File
+        '''
         for encInfo in EncInfoList :
-            # write Header Information
-            fileHandle.write( "%-13s \t%-13s \n" %( "Sequence" , encInfo.SeqName ) )
-            fileHandle.write( "%-13s \t%-5s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \n" %( "SliceType" , "QP" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr" ) )
-            for index in range( len( encInfo.QPList ) ) :    
-                fileHandle.write( "%-13s \t%-5s \t%-13s \t%-.4f \t%-7s \t%-7s \t%-7s \n" %( encInfo.FrameTypeList[index] , encInfo.QPList[index] , encInfo.BitRateList[index] , \
-                                                                                        encInfo.YUVPsnrList[index] , \
-                                                                                        encInfo.YPsnrList[index] , encInfo.UPsnrList[index] , encInfo.VPsnrList[index] ) )
-   fileHandle.close()
-    
-def write_information_txt( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
-   fullFilePath = WriteFilePath + WriteFileName + '.txt'
-   fileHandle = open( fullFilePath , 'a' )
-       
-   if LogLevel > 0 :
-        # write Header Information
-        fileHandle.write( "%-7s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \t%-13s \t%-13s \n" %( "Qp" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr", "EncTime", "Sequence" ) )
+            frameBytes = sum( len( getattr( encInfo , field ) ) * getattr( encInfo , field ).itemsize for field in frameFieldList )
+            if frameBytes and self.HeldBytes + frameBytes > self.MaxBytes :
+                offset = self.FileHandle.seek( 0 , os.SEEK_END )
+                lengthList = []
+                for field in frameFieldList :
+                    column = getattr( encInfo , field )
+                    column.tofile( self.FileHandle )
+                    lengthList.append( len( column ) )
+                    setattr( encInfo , field , array.array( column.typecode ) )
+                self.OffsetDict[id( encInfo )] = ( encInfo , offset , lengthList )
+            else :
+                self.HeldBytes += frameBytes
+            yield encInfo
+    def load(self , encInfo) :
+        '''
+        encInfo with its Per-Frame Columns , a Copy Read back from the Spill File if Spilled , so the Spilled encInfo Stays Small
+        '''
+        spilled = self.OffsetDict.get( id( encInfo ) )
+        if spilled is None or spilled[0] is not encInfo :
+            return encInfo
+        loadedEncInfo = EncInfo()
+        for name in EncInfo.__slots__ :
+            setattr( loadedEncInfo , name , getattr( encInfo , name ) )
+        self.FileHandle.seek( spilled[1] )
+        for field , length in zip( frameFieldList , spilled[2] ) :
+            column = array.array( getattr( encInfo , field ).typecode )
+            column.fromfile( self.FileHandle , length )
+            setattr( loadedEncInfo , field , column )
+        return loadedEncInfo
+    def close(self) :
+        self.FileHandle.close()
+
+def iter_frame_data( EncInfoList , Spill = None ) :
+    '''
+    Yield encInfo in EncInfoList with their Per-Frame Columns , Read back One at a Time from FrameSpill Spill if Spilled
+    :return iterator of encInfo
+    '''
+    for encInfo in EncInfoList :
+        yield Spill.load( encInfo ) if Spill is not None else encInfo
+
+def write_information_csv( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
+    '''
+    Write One Summary Row per encInfo as it Comes, and at LogLevel 2 One Row per Frame to WriteFileName_frames.csv
+    Numbers Keep the Decimals Printed by the Encoder
+    '''
+    fullFilePath = WriteFilePath + WriteFileName + '.csv'
+    with contextlib.ExitStack() as stack :
+        summaryWriter = csv.writer( stack.enter_context( open( fullFilePath , 'w' , newline='' ) ) )
+        summaryWriter.writerow( [ column for column , field in summaryColumnList ] )
+        if LogLevel > 1 :
+            frameWriter = csv.writer( stack.enter_context( open( WriteFilePath + WriteFileName + '_frames.csv' , 'w' , newline='' ) ) )
+            frameWriter.writerow( [ 'Sequence' , 'Qp' , 'Frame' , 'SliceType' ] + [ column for column , field in frameColumnList ] )
         for encInfo in EncInfoList :
-            fileHandle.write( "%-7s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \t%-13s \t%-13s \n" %( encInfo.SeqAvgQp , encInfo.AvgBitRate , encInfo.AvgYUVPsnr , encInfo.AvgYPsnr , encInfo.AvgUPsnr , encInfo.AvgVPsnr , encInfo.EncTime , encInfo.SeqName ) )
-   if LogLevel > 1 :
+            summaryWriter.writerow( [ getattr( encInfo , field ) if field in summaryTextFieldList else format_field( encInfo , field ) for column , field in summaryColumnList ] )
+            if LogLevel > 1 :
+                seqAvgQp   = format_field( encInfo , 'SeqAvgQp' )
+                columnList = [ [ format_number( value , encInfo.Digits.get( field , 4 ) ) for value in getattr( encInfo , field ) ] for column , field in frameColumnList ]
+                frameRowList = itertools.zip_longest( encInfo.frame_types() , *columnList , fillvalue='' )
+                frameWriter.writerows( [ encInfo.SeqName , seqAvgQp , index ] + list( frameRow ) for index , frameRow in enumerate( frameRowList ) )
+
+def frame_array( Values , Count , Type ) :
+    '''
+    Arrow Array Sharing the Buffer of array.array Values, Padded with Nulls up to Count
+    '''
+    import pyarrow
+    valueArray = pyarrow.Array.from_buffers( Type , len( Values ) , [ None , pyarrow.py_buffer( Values ) ] )
+    if len( Values ) < Count :
+        valueArray = pyarrow.concat_arrays( [ valueArray , pyarrow.nulls( Count - len( Values ) , Type ) ] )
+    return valueArray
+
+def write_information_table( EncInfoList , WriteFilePath , WriteFileName , LogLevel , WriteFileType ) :
+    '''
+    Write a Typed Summary Table, and at LogLevel 2 a Long-Format Per-Frame Table Keyed by Sequence and Qp to WriteFileName_frames
+    One Record Batch per encInfo is Streamed to the Per-Frame Table
+    '''
+    import pyarrow
+    import pyarrow.parquet
+    import pyarrow.feather
+    import pyarrow.ipc
+    summaryTypeDict = { 'SeqAvgQp' : pyarrow.int32() , 'SeqName' : pyarrow.string() , 'EncName' : pyarrow.string() }
+    summarySchema = pyarrow.schema( [ ( column , summaryTypeDict.get( field , pyarrow.float64() ) ) for column , field in summaryColumnList ] )
+    frameSchema   = pyarrow.schema( [ ( 'Sequence' , pyarrow.string() ) , ( 'Qp' , pyarrow.int32() ) , ( 'Frame' , pyarrow.int32() ) ,
+                                      ( 'SliceType' , pyarrow.dictionary( pyarrow.int8() , pyarrow.string() ) ) ] +
+                                    [ ( column , pyarrow.float64() ) for column , field in frameColumnList ] )
+    sliceTypeArray = pyarrow.array( frameTypeDict )
+    frameFilePath  = WriteFilePath + WriteFileName + '_frames' + WriteFileType
+    with contextlib.ExitStack() as stack :
+        if LogLevel > 1 and WriteFileType == '.parquet' :
+            frameWriter = stack.enter_context( pyarrow.parquet.ParquetWriter( frameFilePath , frameSchema ) )
+        elif LogLevel > 1 :
+            frameWriter = stack.enter_context( pyarrow.ipc.new_file( frameFilePath , frameSchema ) )
+        summaryDict = { column : [] for column , field in summaryColumnList }
         for encInfo in EncInfoList :
-            # write Header Information
-            fileHandle.write( "%-13s \t%-13s \n" %( "Sequence" , encInfo.SeqName ) )
-            fileHandle.write( "%-13s \t%-5s \t%-13s \t%-7s \t%-7s \t%-7s \t%-7s \n" %( "SliceType" , "QP" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr" ) )
-            for index in range( len( encInfo.QPList ) ) :    
-                fileHandle.write( "%-13s \t%-5s \t%-13s \t%-.4f \t%-7s \t%-7s \t%-7s \n" %( encInfo.FrameTypeList[index] , encInfo.QPList[index] , encInfo.BitRateList[index] , \
-                                                                                        encInfo.YUVPsnrList[index] , \
-                                                                                        encInfo.YPsnrList[index] , encInfo.UPsnrList[index] , encInfo.VPsnrList[index] ) )
-   fileHandle.close()
+            for column , field in summaryColumnList :
+                summaryDict[column].append( getattr( encInfo , field ) )
+            count = frame_count( encInfo ) if LogLevel > 1 else 0
+            if count :
+                frameArrayList = [ pyarrow.repeat( pyarrow.scalar( encInfo.SeqName , pyarrow.string() ) , count ) ,
+                                   pyarrow.repeat( pyarrow.scalar( encInfo.SeqAvgQp , pyarrow.int32() ) , count ) ,
+                                   pyarrow.array( range( count ) , pyarrow.int32() ) ,
+                                   pyarrow.DictionaryArray.from_arrays( frame_array( encInfo.FrameTypeList , count , pyarrow.int8() ) , sliceTypeArray ) ]
+                frameArrayList += [ frame_array( getattr( encInfo , field ) , count , pyarrow.float64() ) for column , field in frameColumnList ]
+                frameWriter.write_batch( pyarrow.record_batch( frameArrayList , schema=frameSchema ) )
+    summaryTable = pyarrow.table( summaryDict , schema=summarySchema )
+    if WriteFileType == '.parquet' :
+        pyarrow.parquet.write_table( summaryTable , WriteFilePath + WriteFileName + WriteFileType )
+    else :
+        pyarrow.feather.write_feather( summaryTable , WriteFilePath + WriteFileName + WriteFileType )
 
-def write_information_csv( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
-    None
+def write_information_parquet( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
+    write_information_table( EncInfoList , WriteFilePath , WriteFileName , LogLevel , '.parquet' )
+
+def write_information_feather( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
+    write_information_table( EncInfoList , WriteFilePath , WriteFileName , LogLevel , '.feather' )
     
-def write_information_xlsx( EncInfoList , WriteFilePath , WriteFileName , LogLevel ) :
+# Longest Sheet Title Excel Accepts
+sheetTitleLimit = 31
+
+def write_information_xlsx( EncInfoList , WriteFilePath , WriteFileName , LogLevel , ShowEncoder = False ) :
+    '''
+    Write Summary Sheet and One Sheet per Sequence in a Single Pass over EncInfoList through a Write-Only Workbook
+    Each Sequence Sheet is Closed once Written, Summary Sheet Stays First
+    ShowEncoder Prefixes Sequence Sheets with the Encoder , so Sheets of a Sequence from Several Encoders Keep Distinct Titles
+    '''
+    from openpyxl import Workbook
     fullFilePath = WriteFilePath + WriteFileName + '.xlsx'
+    workBook = Workbook( write_only=True )
     if LogLevel > 0 :
         # write Header Information
-        fileHandle = open( fullFilePath , "a" )
-        colHeaderList = [ "Qp" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr", "EncTime", "Sequence" , "AvgGradient" ]
-        avgBitRateList = []
-        avgYUVPsnrList = []
-        avgYPsnrList   = []
-        avgUPsnrList   = []
-        avgVPsnrList   = []
-        avgEncTimeList = []
-        SeqNameList = []
-        SeqAvgQpList = []
-        avgGradientList = []
-        for encInfo in EncInfoList :
-            avgBitRateList.append(encInfo.AvgBitRate) 
-            avgYUVPsnrList.append(encInfo.AvgYUVPsnr)
-            avgYPsnrList.append(encInfo.AvgYPsnr)  
-            avgUPsnrList.append(encInfo.AvgUPsnr)
-            avgVPsnrList.append(encInfo.AvgVPsnr)
-            avgEncTimeList.append(encInfo.EncTime)
-            SeqNameList.append(encInfo.SeqName)
-            SeqAvgQpList.append(encInfo.SeqAvgQp)
-            avgGradientList.append(encInfo.AvgGradient)
-        dataFrame = pandas.DataFrame({ colHeaderList[0] : SeqAvgQpList   ,
-                                       colHeaderList[1] : avgBitRateList ,
-                                       colHeaderList[2] : avgYUVPsnrList ,
-                                       colHeaderList[3] : avgYPsnrList   ,
-                                       colHeaderList[4] : avgUPsnrList   ,
-                                       colHeaderList[5] : avgVPsnrList   ,
-                                       colHeaderList[6] : avgEncTimeList ,
-                                       colHeaderList[7] : SeqNameList    ,
-                                       colHeaderList[8] : avgGradientList})
-        dataFrame.to_excel(fullFilePath , sheet_name="Summary")
-        fileHandle.close()
-    if LogLevel > 1 :
-        fileHandle = pandas.ExcelWriter(fullFilePath,mode='a',engine='openpyxl',if_sheet_exists='new')
-        # write Header Informatio
-        colHeaderList = [ "SliceType" , "QP" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr" , "Gradient" ]
-        for encInfo in EncInfoList :
-            dataFrame = pandas.DataFrame({ colHeaderList[0] : encInfo.FrameTypeList ,
-                                           colHeaderList[1] : encInfo.QPList        ,
-                                           colHeaderList[2] : encInfo.BitRateList   ,
-                                           colHeaderList[3] : encInfo.YUVPsnrList   ,
-                                           colHeaderList[4] : encInfo.YPsnrList     ,
-                                           colHeaderList[5] : encInfo.UPsnrList     ,
-                                           colHeaderList[6] : encInfo.VPsnrList     ,
-                                           colHeaderList[7] : encInfo.GradientList  })
-            dataFrame.to_excel(fileHandle , sheet_name=encInfo.SeqName)
-        fileHandle.save()
-        fileHandle.close()
+        summarySheet = workBook.create_sheet( "Summary" )
+        summarySheet.append( [ None , "Qp" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr", "EncTime", "Sequence" , "AvgGradient" , "Encoder" ] )
+    for index , encInfo in enumerate( EncInfoList ) :
+        if LogLevel > 0 :
+            summarySheet.append( [ index                , encInfo.SeqAvgQp   , encInfo.AvgBitRate , encInfo.AvgYUVPsnr ,
+                                   encInfo.AvgYPsnr     , encInfo.AvgUPsnr   , encInfo.AvgVPsnr   , encInfo.EncTime    ,
+                                   encInfo.SeqName      , encInfo.AvgGradient , encInfo.EncName ] )
+        if LogLevel > 1 :
+            # write Header Information
+            workSheet = workBook.create_sheet( ( '%s_%s' %( encInfo.EncName , encInfo.SeqName ) )[:sheetTitleLimit] if ShowEncoder else encInfo.SeqName )
+            workSheet.append( [ None , "SliceType" , "QP" , "BitRate" , "AvgPsnr" , "YPsnr" , "UPsnr" , "VPsnr" , "Gradient" ] )
+            frameRowList = itertools.zip_longest( encInfo.frame_types() , encInfo.QPList    , encInfo.BitRateList ,
+                                                  encInfo.YUVPsnrList   , encInfo.YPsnrList , encInfo.UPsnrList   ,
+                                                  encInfo.VPsnrList     , encInfo.GradientList )
+            for frameIndex , frameRow in enumerate( frameRowList ) :
+                workSheet.append( ( frameIndex , ) + frameRow )
+            workSheet.close()
+    workBook.save( fullFilePath )
 
 write_information_filetype = {
-    '.log'  : write_information_log  ,
-    '.txt'  : write_information_txt  ,
-    '.csv'  : write_information_csv  ,
-    '.xlsx' : write_information_xlsx ,
+    '.log'     : write_information_log     ,
+    '.txt'     : write_information_txt     ,
+    '.csv'     : write_information_csv     ,
+    '.xlsx'    : write_information_xlsx    ,
+    '.parquet' : write_information_parquet ,
+    '.feather' : write_information_feather ,
 }
 
-def write_information( EncInfoList , WriteFilePath , WriteFileType , WriteFileName , LogLevel ) :
+# File Types Sharing the Text Rendered by write_information_text
+textFileTypeList = [ '.log' , '.txt' ]
+
+# encInfo Queued for Each Writer when One Iterator Feeds Several Writers
+writeQueueSize = 64
+writeQueueEnd  = None
+
+def iter_queue( Queue ) :
     '''
-    Write Information from EncInfoList to WriteFileName under WriteFilePath in accroding to WriteFileType
+    Items Put into Queue until writeQueueEnd
+    '''
+    for item in iter( Queue.get , writeQueueEnd ) :
+        yield item
+
+def write_information_queue( Writer , Queue , ErrorList ) :
+    '''
+    Run Writer on encInfo from Queue in a Writer Thread, Draining Queue after Writer Fails so the Feeding Thread Never Blocks
+    '''
+    encInfoIter = iter_queue( Queue )
+    try :
+        Writer( encInfoIter )
+    except BaseException as error :
+        ErrorList.append( error )
+    for encInfo in encInfoIter :
+        pass
+
+def write_information( EncInfoList , WriteFilePath , WriteFileType , WriteFileName , LogLevel , ShowEncoder = False ) :
+    '''
+    Write Information from EncInfoList to WriteFileName under WriteFilePath in accroding to WriteFileType , One Type or a List of Types
+    Text is Rendered Once for All Text File Types , ShowEncoder Tells the Encoder of Each Sequence in Text and .xlsx , whose Layout has no Encoder Column
+    EncInfoList may be Any Iterable, Read Once: Several Writers of an Iterator Run in Threads Fed through Bounded Queues
+    '''
+    writeFileTypeList = [ WriteFileType ] if isinstance( WriteFileType , str ) else list( WriteFileType )
+    for writeFileType in writeFileTypeList :
+        create_file( WriteFilePath , WriteFileName , writeFileType )
+    writerList = []
+    textFilePathList = [ WriteFilePath + WriteFileName + writeFileType for writeFileType in writeFileTypeList if writeFileType in textFileTypeList ]
+    if textFilePathList :
+        writerList.append( functools.partial( write_information_text , FullFilePathList=textFilePathList , LogLevel=LogLevel , ShowEncoder=ShowEncoder ) )
+    for writeFileType in writeFileTypeList :
+        if writeFileType not in textFileTypeList :
+            # other tabular types always have an Encoder column
+            keywordDict = { 'ShowEncoder' : ShowEncoder } if writeFileType == '.xlsx' else {}
+            writerList.append( functools.partial( write_information_filetype.get( writeFileType ) , WriteFilePath=WriteFilePath , WriteFileName=WriteFileName , LogLevel=LogLevel , **keywordDict ) )
+    if len( writerList ) < 2 or isinstance( EncInfoList , ( list , tuple ) ) :
+        for writer in writerList :
+            writer( EncInfoList )
+        return
+    queueList  = [ queue.Queue( writeQueueSize ) for writer in writerList ]
+    errorList  = []
+    threadList = [ threading.Thread( target=write_information_queue , args=( writer , writeQueue , errorList ) ) for writer , writeQueue in zip( writerList , queueList ) ]
+    for thread in threadList :
+        thread.start()
+    try :
+        for encInfo in EncInfoList :
+            for writeQueue in queueList :
+                writeQueue.put( encInfo )
+    finally :
+        for writeQueue in queueList :
+            writeQueue.put( writeQueueEnd )
+        for thread in threadList :
+            thread.join()
+    if errorList :
+        raise errorList[0]
+
+# Groupings of Frames in Rollup Tables , and Columns of Rollup Tables
+rollupGroupList  = [ 'SliceType' , 'QpOffset' , 'Gop' ]
+rollupColumnList = [ 'Encoder' , 'Sequence' , 'GroupBy' , 'Group' , 'Frames' , 'BitShare' , 'Bits' , 'AvgPsnr' , 'MinPsnr' , 'MaxPsnr' , 'Gradient' , 'MinGradient' , 'MaxGradient' ]
+# Sequence Name of Rollup Rows over All Sequences of an Encoder
+rollupAllName    = 'All'
+
+def rollup_label( GroupBy , Key , Gop ) :
+    '''
+    Label of Group Key of GroupBy in Rollup Tables
+    '''
+    if GroupBy == 'SliceType' :
+        return 'IPB'[Key]
+    if GroupBy == 'QpOffset' :
+        return '%+d' %Key
+    return '%d-%d' %( Key * Gop , Key * Gop + Gop - 1 )
+
+def rollup_information( EncInfoList , Gop ) :
+    '''
+    Statistics of the Frames of Each Sequence in EncInfoList , and of All Sequences of Each Encoder , Grouped by Slice Type ( I / P / B ) ,
+    by QP Offset from SeqAvgQp and by Window of Gop Frames in Coding Order , Rows of an Encoder before those of the Next
+    Per-Frame Columns of All Sequences are Concatenated into One Array Each , so Each Statistic is a Single NumPy Reduction over the Whole Set
+    Bits is the Average Bits per Frame , BitShare the Percentage of the Bits of the Sequence , Gradient is None for Encoders without it
+    :return rollupRowList : [ [ Encoder , Sequence , GroupBy , Group , Frames , BitShare , Bits , AvgPsnr , MinPsnr , MaxPsnr , Gradient , MinGradient , MaxGradient ] , ... ]
+    '''
+    import numpy
+    seqNameList , countList , baseQpList = [] , [] , []
+    # encoders in the order they come , and the index of the encoder of each sequence
+    encNameList , seqEncoderList = [] , []
+    frameArrayDict = { 'SliceType' : array.array( 'b' ) , 'QP' : array.array( 'd' ) , 'Bits' : array.array( 'd' ) , 'Psnr' : array.array( 'd' ) , 'Gradient' : array.array( 'd' ) }
+    for encInfo in EncInfoList :
+        count = min( len( encInfo.FrameTypeList ) , len( encInfo.QPList ) , len( encInfo.BitRateList ) , len( encInfo.YUVPsnrList ) )
+        if count == 0 :
+            continue
+        frameArrayDict['SliceType'].extend( encInfo.FrameTypeList[:count] )
+        frameArrayDict['QP'].extend( encInfo.QPList[:count] )
+        frameArrayDict['Bits'].extend( encInfo.BitRateList[:count] )
+        frameArrayDict['Psnr'].extend( encInfo.YUVPsnrList[:count] )
+        frameArrayDict['Gradient'].extend( encInfo.GradientList[:count] if len( encInfo.GradientList ) >= count else array.array( 'd' , [ float( 'nan' ) ] ) * count )
+        if encInfo.EncName not in encNameList :
+            encNameList.append( encInfo.EncName )
+        seqNameList.append( encInfo.SeqName )
+        seqEncoderList.append( encNameList.index( encInfo.EncName ) )
+        countList.append( count )
+        baseQpList.append( encInfo.QPList[0] if encInfo.SeqAvgQp is None else encInfo.SeqAvgQp )
+    if not seqNameList :
+        return []
+    count      = numpy.array( countList )
+    sequence   = numpy.repeat( numpy.arange( len( countList ) ) , count )
+    columnDict = { 'Sequence'  : sequence ,
+                   'SliceType' : numpy.frombuffer( frameArrayDict['SliceType'] , numpy.int8 ) % 3 ,
+                   'QpOffset'  : numpy.rint( numpy.frombuffer( frameArrayDict['QP'] , numpy.float64 ) - numpy.repeat( numpy.array( baseQpList , numpy.float64 ) , count ) ).astype( numpy.int64 ) ,
+                   'Gop'       : ( numpy.arange( len( sequence ) ) - numpy.repeat( numpy.cumsum( count ) - count , count ) ) // Gop ,
+                   'Bits'      : numpy.frombuffer( frameArrayDict['Bits'] , numpy.float64 ) ,
+                   'Psnr'      : numpy.frombuffer( frameArrayDict['Psnr'] , numpy.float64 ) ,
+                   'Gradient'  : numpy.frombuffer( frameArrayDict['Gradient'] , numpy.float64 ) }
+    gradientFound = numpy.isfinite( columnDict['Gradient'] )
+    gradient      = numpy.where( gradientFound , columnDict['Gradient'] , 0 )
+    rowList = []
+    # rows of each sequence , then rows of all sequences of each encoder under the indices after the last sequence
+    allSequence = len( seqNameList ) + numpy.repeat( numpy.array( seqEncoderList ) , count )
+    for sequence in [ columnDict['Sequence'] , allSequence ] :
+        seqBits = numpy.bincount( sequence , weights=columnDict['Bits'] )
+        for groupIndex , groupBy in enumerate( rollupGroupList ) :
+            key   = columnDict[groupBy]
+            order = numpy.lexsort( ( key , sequence ) )
+            sortedSequence , sortedKey = sequence[order] , key[order]
+            start = numpy.flatnonzero( numpy.r_[ True , ( sortedSequence[1:] != sortedSequence[:-1] ) | ( sortedKey[1:] != sortedKey[:-1] ) ] )
+            frames        = numpy.diff( numpy.r_[ start , len( order ) ] )
+            bits          = numpy.add.reduceat( columnDict['Bits'][order] , start )
+            psnr          = columnDict['Psnr'][order]
+            gradientCount = numpy.add.reduceat( gradientFound[order] , start )
+            with numpy.errstate( invalid='ignore' , divide='ignore' ) :
+                statList = [ frames , 100 * bits / seqBits[sortedSequence[start]] , bits / frames ,
+                             numpy.add.reduceat( psnr , start ) / frames , numpy.minimum.reduceat( psnr , start ) , numpy.maximum.reduceat( psnr , start ) ,
+                             numpy.add.reduceat( gradient[order] , start ) / gradientCount ,
+                             numpy.fmin.reduceat( columnDict['Gradient'][order] , start ) , numpy.fmax.reduceat( columnDict['Gradient'][order] , start ) ]
+            for seqIndex , groupKey , *valueList in zip( sortedSequence[start].tolist() , sortedKey[start].tolist() , *[ stat.tolist() for stat in statList ] ) :
+                encIndex = seqEncoderList[seqIndex] if seqIndex < len( seqNameList ) else seqIndex - len( seqNameList )
+                # NaN is the only value unequal to itself
+                rowList.append( ( ( encIndex , seqIndex , groupIndex , groupKey ) ,
+                                  [ encNameList[encIndex] , seqNameList[seqIndex] if seqIndex < len( seqNameList ) else rollupAllName , groupBy , rollup_label( groupBy , groupKey , Gop ) ] +
+                                  [ value if value == value else None for value in valueList ] ) )
+    rowList.sort( key=lambda row : row[0] )
+    return [ row for order , row in rowList ]
+
+def write_rollup_text( RollupRowList , FullFilePath ) :
+    with open( FullFilePath , 'w' ) as fileHandle :
+        fileHandle.write( ''.join( '%-13s \t' %column for column in rollupColumnList ) + '\n' )
+        for row in RollupRowList :
+            fileHandle.write( ''.join( '%-13s \t' %( '' if value is None else '%.4f' %value if isinstance( value , float ) else value ) for value in row ) + '\n' )
+
+def write_rollup_csv( RollupRowList , FullFilePath ) :
+    with open( FullFilePath , 'w' , newline='' ) as fileHandle :
+        writer = csv.writer( fileHandle )
+        writer.writerow( rollupColumnList )
+        writer.writerows( RollupRowList )
+
+def write_rollup_xlsx( RollupRowList , FullFilePath ) :
+    from openpyxl import Workbook
+    workBook  = Workbook( write_only=True )
+    workSheet = workBook.create_sheet( "Rollup" )
+    workSheet.append( rollupColumnList )
+    for row in RollupRowList :
+        workSheet.append( row )
+    workBook.save( FullFilePath )
+
+def write_rollup_table( RollupRowList , FullFilePath ) :
+    import pyarrow
+    import pyarrow.parquet
+    import pyarrow.feather
+    typeDict = { 'Encoder' : pyarrow.string() , 'Sequence' : pyarrow.string() , 'GroupBy' : pyarrow.string() , 'Group' : pyarrow.string() , 'Frames' : pyarrow.int32() }
+    schema   = pyarrow.schema( [ ( column , typeDict.get( column , pyarrow.float64() ) ) for column in rollupColumnList ] )
+    table    = pyarrow.table( { column : [ row[index] for row in RollupRowList ] for index , column in enumerate( rollupColumnList ) } , schema=schema )
+    if FullFilePath.endswith( '.parquet' ) :
+        pyarrow.parquet.write_table( table , FullFilePath )
+    else :
+        pyarrow.feather.write_feather( table , FullFilePath )
+
+write_rollup_filetype = {
+    '.log'     : write_rollup_text  ,
+    '.txt'     : write_rollup_text  ,
+    '.csv'     : write_rollup_csv   ,
+    '.xlsx'    : write_rollup_xlsx  ,
+    '.parquet' : write_rollup_table ,
+    '.feather' : write_rollup_table ,
+}
+
+def write_rollup( RollupRowList , WriteFilePath , WriteFileName , WriteFileType ) :
+    '''
+    Write RollupRowList to WriteFileName_rollup under WriteFilePath in Each of WriteFileType , One Type or a List of Types
+    '''
+    writeFileTypeList = [ WriteFileType ] if isinstance( WriteFileType , str ) else list( WriteFileType )
+    for writeFileType in writeFileTypeList :
+        write_rollup_filetype.get( writeFileType )( RollupRowList , WriteFilePath + WriteFileName + '_rollup' + writeFileType )
+
+def watch_information( args ) :
+    '''
+    Poll Files under ReadFilePath and Rewrite Result File when they Change, until Interrupted
+    Only New or Changed Files are Parsed Again, Result File is Rewritten at most Once per WatchDebounce Seconds
+    '''
+    signatureDict = {}
+    encInfoDict   = {}
+    writeTime     = None
+    changed       = False
+    targetFileList = []
+    # Unchanged Directories are not Listed Again at Each Poll
+    listCache      = load_list_cache( args.FileListCache ) if args.FileListCache else {}
+    try :
+        while 1 :
+            targetFileList = traverse_args_files( args , listCache )
+            if args.FileListCache :
+                save_list_cache( args.FileListCache , listCache )
+            changedFileList = []
+            # signatures before this poll , put back with the last result for files failing to parse so they are read again at the next poll
+            previousDict    = {}
+            for targetFile in targetFileList :
+                signature = file_signature( targetFile )
+                if signature is not None and signatureDict.get( targetFile ) != signature :
+                    previousDict[targetFile]  = signatureDict.get( targetFile )
+                    signatureDict[targetFile] = signature
+                    changedFileList.append( targetFile )
+            targetFileSet = set( targetFileList )
+            for targetFile in [ targetFile for targetFile in signatureDict if targetFile not in targetFileSet ] :
+                del signatureDict[targetFile]
+                encInfoDict.pop( targetFile , None )
+                changed = True
+            if args.Jobs == 1 or len( changedFileList ) < 2 :
+                # a file being written may be cut in the middle of a line , which must not end the watch
+                for targetFile in changedFileList :
+                    encInfo , errorMessage , fileStats = read_information_file( targetFile , args.EncoderName , args.LogLevel )
+                    if errorMessage is not None :
+                        print( 'GetInfo.py: Failed to Read %s ( %s )' %( targetFile , errorMessage ) , file=sys.stderr )
+                        continue
+                    encInfoDict[targetFile] = encInfo
+                    previousDict.pop( targetFile )
+            else :
+                for targetFile , encInfo in read_information_pairs( changedFileList , args.EncoderName , args.LogLevel , args.Jobs ) :
+                    encInfoDict[targetFile] = encInfo
+                    previousDict.pop( targetFile )
+            for targetFile , signature in previousDict.items() :
+                if signature is None :
+                    del signatureDict[targetFile]
+                else :
+                    signatureDict[targetFile] = signature
+            changed = changed or len( changedFileList ) > len( previousDict )
+            if changed and ( writeTime is None or time.time() - writeTime >= args.WatchDebounce ) :
+                write_watched_information( args , targetFileList , encInfoDict )
+                writeTime = time.time()
+                changed   = False
+            time.sleep( args.WatchInterval )
+    except KeyboardInterrupt :
+        if changed :
+            write_watched_information( args , targetFileList , encInfoDict )
+
+def write_watched_information( args , TargetFileList , EncInfoDict ) :
+    '''
+    Write Information of Files in TargetFileList Kept in EncInfoDict as a One-Shot Run Would
+    '''
+    encInfoList = [ EncInfoDict[targetFile] for targetFile in TargetFileList if targetFile in EncInfoDict ]
+    encInfoList = delete_nonsequence( encInfoList )
+    encInfoList = sort_sequence( encInfoList , args.CtcType )
+    write_information( encInfoList , args.WriteFilePath , args.WriteFileType , args.WriteFileName , args.LogLevel , args.EncoderName == 'auto' )
+    if args.Rollup :
+        write_rollup( rollup_information( encInfoList , args.RollupGop ) , args.WriteFilePath , args.WriteFileName , args.WriteFileType )
+    print( 'GetInfo.py: %s Updated with %d Files' %( ' , '.join( args.WriteFilePath + args.WriteFileName + writeFileType for writeFileType in args.WriteFileType ) , len( encInfoList ) ) , file=sys.stderr )
+
+def group_sequence( EncInfoList ) :
+    '''
+    Group encInfo with Summary Information in EncInfoList by Sequence across QPs
+    :return seqDict : Dict < SeqKey : [ EncInfo1 , ... , EncInfoN ] >
+    '''
+    seqDict = {}
+    for encInfo in EncInfoList :
+        if encInfo.AvgBitRate is None or encInfo.AvgYPsnr is None :
+            continue
+        seqDict.setdefault( sequence_key( encInfo ) , [] ).append( encInfo )
+    return seqDict
+
+def bd_cubic_integral( X , Y , Low , High ) :
+    '''
+    Integrate the Least-Squares Cubic Polynomial through Points ( X , Y ) from Low to High, for All Rows at Once
+    :return integral : Array of Shape ( Rows , )
+    '''
+    import numpy
+    # fit in centered and scaled coordinate t = ( x - center ) / scale to keep the Vandermonde matrix well-conditioned
+    center = X.mean( axis=-1 , keepdims=True )
+    scale  = numpy.maximum( X.std( axis=-1 , keepdims=True ) , numpy.finfo( float ).tiny )
+    power  = numpy.arange( 3 , -1 , -1 )
+    vander = ( ( X - center ) / scale )[..., None] ** power
+    coef   = ( numpy.linalg.pinv( vander ) @ Y[..., None] )[..., 0]
+    def antiderivative( Point ) :
+        point = ( Point[:, None] - center ) / scale
+        return numpy.sum( coef / ( power + 1 ) * point ** ( power + 1 ) , axis=-1 )
+    return scale[:, 0] * ( antiderivative( High ) - antiderivative( Low ) )
+
+def bd_pchip_slopes( H , Delta ) :
+    '''
+    Slopes of the Piecewise Cubic Hermite Interpolation ( Fritsch-Carlson ) at Each Point, for All Rows at Once
+    :return slopes : Array of Shape ( Rows , Points )
+    '''
+    import numpy
+    rows , intervals = Delta.shape
+    slopes = numpy.zeros( ( rows , intervals + 1 ) )
+    if intervals == 1 :
+        slopes[:, 0] = slopes[:, 1] = Delta[:, 0]
+        return slopes
+    # interior points : weighted harmonic mean of the secants, zero at extrema
+    w1 = 2 * H[:, 1:] + H[:, :-1]
+    w2 = H[:, 1:] + 2 * H[:, :-1]
+    sameSign = Delta[:, :-1] * Delta[:, 1:] > 0
+    with numpy.errstate( divide='ignore' , invalid='ignore' ) :
+        interior = ( w1 + w2 ) / ( w1 / Delta[:, :-1] + w2 / Delta[:, 1:] )
+    slopes[:, 1:-1] = numpy.where( sameSign , interior , 0 )
+    # end points : three-point shape-preserving formula
+    for end , h0 , h1 , d0 , d1 in ( ( 0  , H[:, 0]  , H[:, 1]  , Delta[:, 0]  , Delta[:, 1]  ) ,
+                                     ( -1 , H[:, -1] , H[:, -2] , Delta[:, -1] , Delta[:, -2] ) ) :
+        slope = ( ( 2 * h0 + h1 ) * d0 - h0 * d1 ) / ( h0 + h1 )
+        slope = numpy.where( numpy.sign( slope ) != numpy.sign( d0 ) , 0 , slope )
+        slope = numpy.where( ( numpy.sign( d0 ) != numpy.sign( d1 ) ) & ( numpy.abs( slope ) > numpy.abs( 3 * d0 ) ) , 3 * d0 , slope )
+        slopes[:, end] = slope
+    return slopes
+
+def bd_pchip_integral( X , Y , Low , High ) :
+    '''
+    Integrate the Piecewise Cubic Hermite Interpolation through Points ( X , Y ) from Low to High, for All Rows at Once
+    :return integral : Array of Shape ( Rows , )
+    '''
+    import numpy
+    H      = numpy.diff( X , axis=-1 )
+    Delta  = numpy.diff( Y , axis=-1 ) / H
+    slopes = bd_pchip_slopes( H , Delta )
+    # cubic of each interval in local coordinate t = x - X[k] : Y[k] + s0 t + c2 t^2 + c3 t^3
+    s0 , s1 = slopes[:, :-1] , slopes[:, 1:]
+    c2 = ( 3 * Delta - 2 * s0 - s1 ) / H
+    c3 = ( s0 + s1 - 2 * Delta ) / H ** 2
+    def antiderivative( T ) :
+        return Y[:, :-1] * T + s0 * T ** 2 / 2 + c2 * T ** 3 / 3 + c3 * T ** 4 / 4
+    start = numpy.clip( Low[:, None] - X[:, :-1] , 0 , H )
+    end   = numpy.clip( High[:, None] - X[:, :-1] , 0 , H )
+    return numpy.sum( antiderivative( end ) - antiderivative( start ) , axis=-1 )
+
+bd_integral_method = {
+    'pchip' : bd_pchip_integral ,
+    'cubic' : bd_cubic_integral ,
+}
+
+def bd_average_difference( AnchorX , AnchorY , TestX , TestY , Method ) :
+    '''
+    Average Vertical Distance from Anchor Curve to Test Curve over their Common Horizontal Interval, for All Rows at Once
+    :return difference : Array of Shape ( Rows , ), NaN if the Curves do not Overlap
+    '''
+    import numpy
+    anchorOrder = numpy.argsort( AnchorX , axis=-1 )
+    testOrder   = numpy.argsort( TestX , axis=-1 )
+    AnchorX , AnchorY = numpy.take_along_axis( AnchorX , anchorOrder , -1 ) , numpy.take_along_axis( AnchorY , anchorOrder , -1 )
+    TestX   , TestY   = numpy.take_along_axis( TestX , testOrder , -1 )     , numpy.take_along_axis( TestY , testOrder , -1 )
+    low  = numpy.maximum( AnchorX[:, 0] , TestX[:, 0] )
+    high = numpy.minimum( AnchorX[:, -1] , TestX[:, -1] )
+    integral = bd_integral_method.get( Method )
+    with numpy.errstate( divide='ignore' , invalid='ignore' ) :
+        difference = ( integral( TestX , TestY , low , high ) - integral( AnchorX , AnchorY , low , high ) ) / ( high - low )
+    return numpy.where( high > low , difference , numpy.nan )
+
+# Components of BD-Rate and BD-PSNR with the Summary Field of their PSNR
+bdComponentList = [ ( 'Y' , 'AvgYPsnr' ) , ( 'U' , 'AvgUPsnr' ) , ( 'V' , 'AvgVPsnr' ) , ( 'YUV' , 'AvgYUVPsnr' ) ]
+
+def compute_bdrate( AnchorList , TestList , Method ) :
+    '''
+    Compute BD-Rate ( % ) and BD-PSNR ( dB ) of Each Sequence in both AnchorList and TestList, Batched over Sequences
+    :return bdDict : Dict < SeqKey : [ YBDRate , UBDRate , VBDRate , YUVBDRate , YBDPsnr , UBDPsnr , VBDPsnr , YUVBDPsnr ] >
+    '''
+    import numpy
+    anchorDict = group_sequence( AnchorList )
+    testDict   = group_sequence( TestList )
+    minPoints  = 4 if Method == 'cubic' else 2
+    # sequences with the same numbers of points are computed in one batch
+    batchDict  = {}
+    for seqKey , anchorInfoList in anchorDict.items() :
+        testInfoList = testDict.get( seqKey )
+        if testInfoList and min( len( anchorInfoList ) , len( testInfoList ) ) >= minPoints :
+            # the logarithm of a non-positive bitrate is not finite , and would spoil the averages of its class
+            if any( encInfo.AvgBitRate <= 0 for encInfo in anchorInfoList + testInfoList ) :
+                print( 'GetInfo.py: BD-Rate of %s Skipped for a Non-Positive BitRate' %seqKey , file=sys.stderr )
+                continue
+            batchDict.setdefault( ( len( anchorInfoList ) , len( testInfoList ) ) , [] ).append( seqKey )
+    bdDict = {}
+    for seqKeyList in batchDict.values() :
+        def columns( InfoDict , Field ) :
+            return numpy.array( [ [ getattr( encInfo , Field ) for encInfo in InfoDict[seqKey] ] for seqKey in seqKeyList ] , dtype=float )
+        anchorRate = numpy.log10( columns( anchorDict , 'AvgBitRate' ) )
+        testRate   = numpy.log10( columns( testDict , 'AvgBitRate' ) )
+        bdRateList , bdPsnrList = [] , []
+        for component , field in bdComponentList :
+            anchorPsnr = columns( anchorDict , field )
+            testPsnr   = columns( testDict , field )
+            with numpy.errstate( over='ignore' ) :
+                bdRateList.append( ( 10 ** bd_average_difference( anchorPsnr , anchorRate , testPsnr , testRate , Method ) - 1 ) * 100 )
+            bdPsnrList.append( bd_average_difference( anchorRate , anchorPsnr , testRate , testPsnr , Method ) )
+        for index , seqKey in enumerate( seqKeyList ) :
+            bdDict[seqKey] = [ float( values[index] ) for values in bdRateList + bdPsnrList ]
+    return bdDict
+
+def order_bdrate( BdDict , CtcType ) :
+    '''
+    Order Sequences of BdDict by CTC Video List, with Averages of Each Class and of All CTC Sequences
+    :return rowList : [ ( Name , Class , [ YBDRate , ... , YUVBDPsnr ] ) , ... ]
+    '''
+    import numpy
+    classDict = ctcclassDict.get( CtcType )
+    videoDict = {}
+    for seqKey in sorted( BdDict ) :
+        videoDict.setdefault( video_name( seqKey ) , [] ).append( seqKey )
+    seqRowList , classRowDict , otherRowList = [] , {} , []
+    for videoName in ctc_video_order( CtcType ) :
+        for seqKey in videoDict.pop( videoName , [] ) :
+            seqRowList.append( ( seqKey , classDict.get( videoName , '' ) , BdDict[seqKey] ) )
+            classRowDict.setdefault( classDict.get( videoName , '' ) , [] ).append( BdDict[seqKey] )
+    for seqKeyList in videoDict.values() :
+        for seqKey in seqKeyList :
+            otherRowList.append( ( seqKey , '' , BdDict[seqKey] ) )
+    averageRowList = []
+    with numpy.errstate( invalid='ignore' ) , warnings.catch_warnings() :
+        warnings.simplefilter( 'ignore' , RuntimeWarning )
+        for className , valueList in classRowDict.items() :
+            averageRowList.append( ( 'Class' + className , className , numpy.nanmean( valueList , axis=0 ).tolist() ) )
+        if seqRowList :
+            averageRowList.append( ( 'Overall' , '' , numpy.nanmean( [ row[2] for row in seqRowList ] , axis=0 ).tolist() ) )
+    return seqRowList + otherRowList + averageRowList
+
+def write_bdrate( RowDict , WriteFilePath , WriteFileName , WriteFileType ) :
+    '''
+    Write BD-Rate Rows of Each Test in RowDict to WriteFileName under WriteFilePath
     '''
     create_file( WriteFilePath , WriteFileName , WriteFileType )
-    write_information_filetype.get(WriteFileType)( EncInfoList , WriteFilePath , WriteFileName , LogLevel )
+    fullFilePath = WriteFilePath + WriteFileName + WriteFileType
+    with open( fullFilePath , 'a' ) as fileHandle :
+        for testFilePath , rowList in RowDict.items() :
+            fileHandle.write( "%-13s \t%-13s \n" %( "Test" , testFilePath ) )
+            fileHandle.write( "%-24s \t%-5s \t%-9s \t%-9s \t%-9s \t%-9s \t%-9s \t%-9s \t%-9s \t%-9s \n" %( "Sequence" , "Class" , "Y-BDRate" , "U-BDRate" , "V-BDRate" , "YUV-BDRate" ,
+                                                                                                    "Y-BDPSNR" , "U-BDPSNR" , "V-BDPSNR" , "YUV-BDPSNR" ) )
+            for name , className , valueList in rowList :
+                fileHandle.write( "%-24s \t%-5s \t%-9.2f \t%-9.2f \t%-9.2f \t%-9.2f \t%-9.4f \t%-9.4f \t%-9.4f \t%-9.4f \n" %( ( name , className ) + tuple( valueList ) ) )
+
+# Tables of the Results Database , One Row per Run of an Experiment , per Sequence and per Frame
+databaseSchemaList = [
+    'CREATE TABLE IF NOT EXISTS experiment ( id INTEGER PRIMARY KEY , Experiment TEXT , Encoder TEXT , CtcType TEXT , LogLevel INTEGER , ReadFilePath TEXT , Time TEXT , UNIQUE ( Experiment , Encoder , CtcType ) )' ,
+    'CREATE TABLE IF NOT EXISTS sequence ( id INTEGER PRIMARY KEY , experiment INTEGER REFERENCES experiment ( id ) , Sequence TEXT , Video TEXT , Qp INTEGER , '
+    'BitRate REAL , AvgPsnr REAL , YPsnr REAL , UPsnr REAL , VPsnr REAL , EncTime REAL , AvgGradient REAL )' ,
+    'CREATE TABLE IF NOT EXISTS frame ( sequence INTEGER REFERENCES sequence ( id ) , Frame INTEGER , SliceType TEXT , '
+    'QP REAL , BitRate REAL , AvgPsnr REAL , YPsnr REAL , UPsnr REAL , VPsnr REAL , Gradient REAL , PRIMARY KEY ( sequence , Frame ) ) WITHOUT ROWID' ,
+    'CREATE INDEX IF NOT EXISTS sequence_sequence ON sequence ( Sequence , Qp )' ,
+    'CREATE INDEX IF NOT EXISTS sequence_video ON sequence ( Video , Qp )' ,
+    'CREATE INDEX IF NOT EXISTS sequence_experiment ON sequence ( experiment , Qp )' ,
+    'CREATE INDEX IF NOT EXISTS experiment_encoder ON experiment ( Encoder , CtcType )' ,
+]
+
+def open_database( Database ) :
+    '''
+    Open Results Database in SQLite File Database , Creating its Tables if Missing
+    :return connection
+    '''
+    import sqlite3
+    connection = sqlite3.connect( Database )
+    for schema in databaseSchemaList :
+        connection.execute( schema )
+    return connection
+
+def store_information( EncInfoList , Database , Experiment , EncType , CtcType , LogLevel , ReadFilePath ) :
+    '''
+    Store Summary and Per-Frame Information of EncInfoList in Database under Experiment , Replacing an Earlier Run of the Same Experiment , EncType and CtcType
+    Uncoded Placeholders of sort_sequence are not Stored
+    '''
+    connection = open_database( Database )
+    with connection :
+        for experimentId , in connection.execute( 'SELECT id FROM experiment WHERE Experiment = ? AND Encoder = ? AND CtcType = ?' , ( Experiment , EncType , CtcType ) ).fetchall() :
+            connection.execute( 'DELETE FROM frame WHERE sequence IN ( SELECT id FROM sequence WHERE experiment = ? )' , ( experimentId , ) )
+            connection.execute( 'DELETE FROM sequence WHERE experiment = ?' , ( experimentId , ) )
+            connection.execute( 'DELETE FROM experiment WHERE id = ?' , ( experimentId , ) )
+        experimentId = connection.execute( 'INSERT INTO experiment ( Experiment , Encoder , CtcType , LogLevel , ReadFilePath , Time ) VALUES ( ? , ? , ? , ? , ? , ? )' ,
+                                           ( Experiment , EncType , CtcType , LogLevel , ReadFilePath , time.strftime( '%Y-%m-%d %H:%M:%S' ) ) ).lastrowid
+        for encInfo in EncInfoList :
+            if encInfo.AvgBitRate is None and not encInfo.YUVPsnrList :
+                continue
+            sequenceId = connection.execute( 'INSERT INTO sequence ( experiment , Sequence , Video , Qp , BitRate , AvgPsnr , YPsnr , UPsnr , VPsnr , EncTime , AvgGradient ) '
+                                             'VALUES ( ? , ? , ? , ? , ? , ? , ? , ? , ? , ? , ? )' ,
+                                             ( experimentId , encInfo.SeqName , video_name( encInfo.SeqName ) , encInfo.SeqAvgQp , encInfo.AvgBitRate , encInfo.AvgYUVPsnr ,
+                                               encInfo.AvgYPsnr , encInfo.AvgUPsnr , encInfo.AvgVPsnr , encInfo.EncTime , encInfo.AvgGradient ) ).lastrowid
+            if encInfo.YUVPsnrList :
+                connection.executemany( 'INSERT INTO frame VALUES ( ? , ? , ? , ? , ? , ? , ? , ? , ? , ? )' ,
+                                        ( ( sequenceId , index ) + frameRow for index , frameRow in enumerate(
+                                          itertools.zip_longest( encInfo.frame_types() , encInfo.QPList , encInfo.BitRateList , encInfo.YUVPsnrList ,
+                                                                 encInfo.YPsnrList , encInfo.UPsnrList , encInfo.VPsnrList , encInfo.GradientList ) ) ) )
+    connection.close()
+
+def parse_args_bdrate( Argv ) :
+    '''
+    Parsing Command-Line Arguments of bdrate Command
+    :return args : Dict < ArgName : ArgValue >
+    '''
+    parser = argparse.ArgumentParser( prog='GetInfo.py bdrate' )
+    parser.add_argument('--AnchorFilePath',
+                        type=str,
+                        help='Path of Anchor Encoder Files for GetInfo.py to Read, or an Archive of them',
+                        required=True
+                        )
+    parser.add_argument('--TestFilePath',
+                        type=str,
+                        nargs='+',
+                        help='Paths of Test Encoder Files for GetInfo.py to Read, or Archives of them, One BD-Rate Table per Path',
+                        required=True
+                        )
+    parser.add_argument('--ReadFileType',
+                        type=str,
+                        default='log',
+                        nargs='+',
+                        help='Types of Encoder Files for GetInfo.py to Read, Compressed .gz .bz2 .xz Files of these Types are Read as well',
+                        required=True
+                        )
+    parser.add_argument('--EncoderName',
+                        type=str,
+                        default='HM',
+                        help='Name of Encoder for GetInfo.py to Read, or auto to Identify the Encoder of Each File from its First Bytes',
+                        required=True,
+                        )
+    parser.add_argument('--TestEncoderName',
+                        type=str,
+                        default='',
+                        help='Name of Encoder of Test Files, EncoderName by Default',
+                        required=False,
+                        )
+    parser.add_argument('--CtcType',
+                        type=str,
+                        default='HEVC',
+                        help='CTC Type Used',
+                        required=False,
+                        )
+    parser.add_argument('--CtcFile',
+                        type=str,
+                        default='',
+                        help='File of Video List Used as CtcType, One "[Class] VideoName" per Line',
+                        required=False,
+                        )
+    parser.add_argument('--BDMethod',
+                        type=str,
+                        default='pchip',
+                        choices=list( bd_integral_method ),
+                        help='Curve Fitting of BD-Rate, Piecewise Cubic ( pchip ) or Cubic Polynomial ( cubic )',
+                        required=False,
+                        )
+    parser.add_argument('--WriteFilePath',
+                        type=str,
+                        default='./',
+                        help='Path of GetInfo.py to Write Result File',
+                        required=False
+                        )
+    parser.add_argument('--WriteFileName',
+                        type=str,
+                        default='bdrate',
+                        help='Name of Result File of GetInfo.py',
+                        required=False,
+                        )
+    parser.add_argument('--WriteFileType',
+                        type=str,
+                        default='.log',
+                        choices=[ '.log' , '.txt' ],
+                        help='Type of Result File of GetInfo.py',
+                        required=False,
+                        )
+    parser.add_argument('--Jobs',
+                        type=int,
+                        default=1,
+                        help='Number of Worker Processes for GetInfo.py to Read Files, 0 for All CPUs',
+                        required=False,
+                        )
+    return parser.parse_args( Argv )
+
+def main_bdrate( Argv ) :
+    args = parse_args_bdrate( Argv )
+    if args.CtcFile :
+        load_ctc_file( args.CtcFile , args.CtcType )
+    anchorList = list( iter_encinfo( args.AnchorFilePath , args.EncoderName , 1 , args.ReadFileType , args.Jobs ) )
+    rowDict = {}
+    for testFilePath in args.TestFilePath :
+        testList = list( iter_encinfo( testFilePath , args.TestEncoderName or args.EncoderName , 1 , args.ReadFileType , args.Jobs ) )
+        rowDict[testFilePath] = order_bdrate( compute_bdrate( anchorList , testList , args.BDMethod ) , args.CtcType )
+    write_bdrate( rowDict , args.WriteFilePath , args.WriteFileName , args.WriteFileType )
+
+def parse_args_query( Argv ) :
+    '''
+    Parsing Command-Line Arguments of query Command
+    :return args : Dict < ArgName : ArgValue >
+    '''
+    parser = argparse.ArgumentParser( prog='GetInfo.py query' )
+    parser.add_argument('--Database',
+                        type=str,
+                        help='SQLite Results Database Written by GetInfo.py --Database',
+                        required=True
+                        )
+    parser.add_argument('--Experiment',
+                        type=str,
+                        nargs='+',
+                        default=[],
+                        help='Glob Patterns of Experiments to Export, All by Default',
+                        required=False,
+                        )
+    parser.add_argument('--EncoderName',
+                        type=str,
+                        nargs='+',
+                        default=[],
+                        help='Encoders to Export, All by Default',
+                        required=False,
+                        )
+    parser.add_argument('--CtcType',
+                        type=str,
+                        nargs='+',
+                        default=[],
+                        help='CTC Types to Export, All by Default',
+                        required=False,
+                        )
+    parser.add_argument('--Sequence',
+                        type=str,
+                        nargs='+',
+                        default=[],
+                        help='Glob Patterns of Sequences or Videos to Export, All by Default',
+                        required=False,
+                        )
+    parser.add_argument('--QP',
+                        type=int,
+                        nargs='+',
+                        default=[],
+                        help='QPs to Export, All by Default',
+                        required=False,
+                        )
+    parser.add_argument('--Frames',
+                        action='store_true',
+                        help='Export Per-Frame Rows instead of Summary Rows',
+                        required=False,
+                        )
+    parser.add_argument('--Pivot',
+                        type=str,
+                        default='',
+                        choices=[ '' ] + queryValueList + [ column for column in queryFrameValueList if column not in queryValueList ] ,
+                        help='Export One Row per Sequence ( and Frame with --Frames ) with the Value of this Column in Each Experiment, QP and Gradient only with --Frames',
+                        required=False,
+                        )
+    parser.add_argument('--WriteFile',
+                        type=str,
+                        default='',
+                        help='File to Write, .csv or Tab-Separated Text by its Type, stdout by Default',
+                        required=False,
+                        )
+    args = parser.parse_args( Argv )
+    if args.Frames and args.Pivot and args.Pivot not in queryFrameValueList :
+        parser.error( '--Pivot %s is not a Column of Per-Frame Rows, Choose from %s' %( args.Pivot , ' , '.join( queryFrameValueList ) ) )
+    if not args.Frames and args.Pivot and args.Pivot not in queryValueList :
+        parser.error( '--Pivot %s is a Column of Per-Frame Rows only, Add --Frames or Choose from %s' %( args.Pivot , ' , '.join( queryValueList ) ) )
+    return args
+
+# Summary Columns of the Results Database that query can Export or Pivot
+queryValueList = [ 'BitRate' , 'AvgPsnr' , 'YPsnr' , 'UPsnr' , 'VPsnr' , 'EncTime' , 'AvgGradient' ]
+# Per-Frame Columns of the Results Database that query --Frames Exports
+queryFrameValueList = [ 'QP' , 'BitRate' , 'AvgPsnr' , 'YPsnr' , 'UPsnr' , 'VPsnr' , 'Gradient' ]
+
+def query_condition( args ) :
+    '''
+    WHERE Clause and Parameters of the Filters in args
+    :return ( condition , parameters )
+    '''
+    conditionList , parameters = [ '1' ] , []
+    for patternList , clause in ( ( args.Experiment , 'e.Experiment GLOB ?' ) , ( args.Sequence , '( s.Sequence GLOB ? OR s.Video GLOB ? )' ) ) :
+        if patternList :
+            conditionList.append( '( %s )' %' OR '.join( [ clause ] * len( patternList ) ) )
+            parameters += [ pattern for pattern in patternList for index in range( clause.count( '?' ) ) ]
+    for valueList , column in ( ( args.EncoderName , 'e.Encoder' ) , ( args.CtcType , 'e.CtcType' ) , ( args.QP , 's.Qp' ) ) :
+        if valueList :
+            conditionList.append( '%s IN ( %s )' %( column , ' , '.join( [ '?' ] * len( valueList ) ) ) )
+            parameters += valueList
+    return ' AND '.join( conditionList ) , parameters
+
+def query_information( args ) :
+    '''
+    Rows of the Results Database Selected by args , in the Order they were Stored
+    :return ( header , rowList )
+    '''
+    connection = open_database( args.Database )
+    condition , parameters = query_condition( args )
+    if args.Frames :
+        header = [ 'Experiment' , 'Encoder' , 'CtcType' , 'Sequence' , 'Qp' , 'Frame' , 'SliceType' ] + queryFrameValueList
+        select = ( 'SELECT e.Experiment , e.Encoder , e.CtcType , s.Sequence , s.Qp , f.Frame , f.SliceType , %s '
+                   'FROM frame f JOIN sequence s ON f.sequence = s.id JOIN experiment e ON s.experiment = e.id WHERE %s ORDER BY e.id , s.id , f.Frame'
+                   %( ' , '.join( 'f.' + column for column in queryFrameValueList ) , condition ) )
+    else :
+        header = [ 'Experiment' , 'Encoder' , 'CtcType' , 'Sequence' , 'Qp' ] + queryValueList
+        select = ( 'SELECT e.Experiment , e.Encoder , e.CtcType , s.Sequence , s.Qp , %s FROM sequence s JOIN experiment e ON s.experiment = e.id WHERE %s ORDER BY e.id , s.id'
+                   %( ' , '.join( 's.' + column for column in queryValueList ) , condition ) )
+    rowList = connection.execute( select , parameters ).fetchall()
+    connection.close()
+    if args.Pivot :
+        return pivot_information( rowList , header , args.Pivot )
+    return header , rowList
+
+def pivot_information( RowList , Header , Pivot ) :
+    '''
+    Pivot RowList to One Row per Sequence and Qp ( and Frame for Per-Frame Rows ) , with the Pivot Column of Each Experiment ( and Encoder if Several ) as Columns
+    :return ( header , rowList )
+    '''
+    valueIndex  = Header.index( Pivot )
+    keyIndexList = [ Header.index( column ) for column in ( 'Sequence' , 'Qp' , 'Frame' ) if column in Header ]
+    encoderSet  = set( row[1] for row in RowList )
+    columnDict  , pivotDict = {} , {}
+    for row in RowList :
+        column = row[0] if len( encoderSet ) < 2 else '%s:%s' %( row[0] , row[1] )
+        columnDict.setdefault( column , len( columnDict ) )
+        pivotDict.setdefault( tuple( row[index] for index in keyIndexList ) , {} )[column] = row[valueIndex]
+    header = [ Header[index] for index in keyIndexList ] + list( columnDict )
+    return header , [ list( key ) + [ valueDict.get( column ) for column in columnDict ] for key , valueDict in pivotDict.items() ]
+
+def write_query( Header , RowList , WriteFile ) :
+    '''
+    Write Header and RowList to WriteFile as CSV if its Type is .csv , Otherwise as Tab-Separated Text , to stdout if WriteFile is Empty
+    '''
+    with ( open( WriteFile , 'w' , newline='' ) if WriteFile else contextlib.nullcontext( sys.stdout ) ) as fileHandle :
+        if WriteFile.endswith( '.csv' ) :
+            writer = csv.writer( fileHandle )
+            writer.writerow( Header )
+            writer.writerows( RowList )
+            return
+        for row in [ Header ] + RowList :
+            fileHandle.write( ''.join( '%-13s \t' %( '' if value is None else value ) for value in row ) + '\n' )
+
+def main_query( Argv ) :
+    args = parse_args_query( Argv )
+    header , rowList = query_information( args )
+    write_query( header , rowList , args.WriteFile )
+
+def parse_args_merge( Argv ) :
+    '''
+    Parsing Command-Line Arguments of merge Command
+    :return args : Dict < ArgName : ArgValue >
+    '''
+    parser = argparse.ArgumentParser( prog='GetInfo.py merge' )
+    parser.add_argument('--PartialFile',
+                        type=str,
+                        nargs='+',
+                        help='Partial Files Written by GetInfo.py --Shard, One per Shard of the Run',
+                        required=True
+                        )
+    parser.add_argument('--WriteFilePath',
+                        type=str,
+                        default='./',
+                        help='Path of GetInfo.py to Write Result File',
+                        required=False
+                        )
+    parser.add_argument('--WriteFileType',
+                        type=str,
+                        nargs='+',
+                        default=[ '.log' ],
+                        choices=list( write_information_filetype ),
+                        help='Types of Result Files for GetInfo.py to Write',
+                        required=False
+                        )
+    parser.add_argument('--WriteFileName',
+                        type=str,
+                        default='result',
+                        help='Name of Result File of GetInfo.py',
+                        required=False,
+                        )
+    parser.add_argument('--CtcType',
+                        type=str,
+                        default='HEVC',
+                        help='CTC Type Used',
+                        required=False,
+                        )
+    parser.add_argument('--CtcFile',
+                        type=str,
+                        default='',
+                        help='File of Video List Used as CtcType, One "[Class] VideoName" per Line',
+                        required=False,
+                        )
+    parser.add_argument('--Rollup',
+                        action='store_true',
+                        help='Also Write Statistics of Frames by Slice Type, QP Offset and GOP Window to WriteFileName_rollup',
+                        required=False,
+                        )
+    parser.add_argument('--RollupGop',
+                        type=int,
+                        default=32,
+                        help='Number of Frames in Each GOP Window of Rollup Tables',
+                        required=False,
+                        )
+    parser.add_argument('--MaxMemory',
+                        type=float,
+                        default=0,
+                        help='MB of Per-Frame Data Held in Memory, Frames beyond are Spilled to a Temporary File under WriteFilePath, 0 for no Limit',
+                        required=False,
+                        )
+    parser.add_argument('--Database',
+                        type=str,
+                        default='',
+                        help='SQLite Results Database to Store Information into, Queried by GetInfo.py query',
+                        required=False,
+                        )
+    parser.add_argument('--Experiment',
+                        type=str,
+                        default='',
+                        help='Label of this Run in Database, Name of ReadFilePath of the Shards by Default',
+                        required=False,
+                        )
+    return parser.parse_args( Argv )
+
+def main_merge( Argv ) :
+    '''
+    Write the Result Files of a Run Sharded by --Shard from its Partial Files , the Same as a Single-Process Run Writes them
+    '''
+    args = parse_args_merge( Argv )
+    if args.CtcFile :
+        load_ctc_file( args.CtcFile , args.CtcType )
+    header , encInfoIter = merge_partials( args.PartialFile )
+    args.EncoderName , args.LogLevel , args.ReadFilePath = header['EncoderName'] , header['LogLevel'] , header['ReadFilePath']
+    if args.MaxMemory > 0 and not os.path.exists( args.WriteFilePath ) :
+        os.makedirs( args.WriteFilePath )
+    frameSpill  = FrameSpill( int( args.MaxMemory * ( 1 << 20 ) ) , args.WriteFilePath ) if args.MaxMemory > 0 else None
+    encInfoList = list( frameSpill.spill( encInfoIter ) if frameSpill is not None else encInfoIter )
+    write_results( encInfoList , args , frameSpill )
+    if frameSpill is not None :
+        frameSpill.close()
+
+main_command = {
+    'bdrate' : main_bdrate ,
+    'query'  : main_query  ,
+    'merge'  : main_merge  ,
+}
 
 def main():
+    if len( sys.argv ) > 1 and sys.argv[1] in main_command :
+        main_command.get( sys.argv[1] )( sys.argv[2:] )
+        return
     args = parse_args()
-    targetFileList = traverse_files( args.ReadFilePath , args.ReadFileType )
-    encInfoList = read_information( targetFileList , args.EncoderName , args.LogLevel )
-    encInfoList = delete_nonsequence( encInfoList )
-    encInfoList = sort_sequence_ctc.get( args.CtcType )( encInfoList )
-    write_information( encInfoList , args.WriteFilePath , args.WriteFileType , args.WriteFileName , args.LogLevel )
+    if args.CtcFile :
+        load_ctc_file( args.CtcFile , args.CtcType )
+    archive = is_archive( args.ReadFilePath )
+    if args.Watch :
+        assert not archive , "Watch Mode Polls a Directory, not an Archive T T"
+        watch_information( args )
+        return
+    profileFile = args.ProfileFile or args.WriteFilePath + args.WriteFileName + '.profile.json'
+    if args.Profile :
+        if not os.path.exists( os.path.dirname( profileFile ) or '.' ) :
+            os.makedirs( os.path.dirname( profileFile ) )
+        start_profile()
+    shard = parse_shard( args.Shard ) if args.Shard else None
+    assert not ( shard and archive ) , "Shard Partitions Files of a Directory, not an Archive T T"
+    # members of an archive , and files in pipeline mode , are listed while they are read
+    pipeline = args.Pipeline and not archive and not args.Cache and not shard
+    with profile_stage( 'traverse' ) :
+        listCache = load_list_cache( args.FileListCache ) if args.FileListCache and not archive else None
+        targetFileList = traverse_args_files( args , listCache ) if not archive and not pipeline else None
+        if shard :
+            traverseIndexDict = shard_files( targetFileList , args.ReadFilePath , *shard )
+            targetFileList    = list( traverseIndexDict )
+    # per-frame columns beyond MaxMemory are spilled as files are read , and read back one encInfo at a time by every later stage
+    if args.MaxMemory > 0 and not shard and not os.path.exists( args.WriteFilePath ) :
+        os.makedirs( args.WriteFilePath )
+    frameSpill = FrameSpill( int( args.MaxMemory * ( 1 << 20 ) ) , args.WriteFilePath ) if args.MaxMemory > 0 and not shard else None
+    with profile_stage( 'read' ) , profile_dump( args.ProfileDump , profileFile ) :
+        if archive :
+            targetPairIter = read_archive_pairs( args.ReadFilePath , args.ReadFileType , args.EncoderName , args.LogLevel ,
+                                                 args.Include , args.Exclude , args.Prune , args.MaxDepth , args.Jobs )
+        elif pipeline :
+            targetPairIter = read_pipeline_pairs( args.ReadFilePath , args.ReadFileType , args.EncoderName , args.LogLevel ,
+                                                  args.Include , args.Exclude , args.Prune , args.MaxDepth , args.Jobs ,
+                                                  args.PrefetchJobs , args.QueueSize , listCache )
+        elif args.Cache :
+            cacheFile = args.CacheFile or args.WriteFilePath + args.WriteFileName + '.cache'
+            if not os.path.exists( os.path.dirname( cacheFile ) or '.' ) :
+                os.makedirs( os.path.dirname( cacheFile ) )
+            targetPairIter = read_information_cached_pairs( targetFileList , args.EncoderName , args.LogLevel , args.Jobs , cacheFile , args.CacheClear , args.CachePrune )
+        else :
+            targetPairIter = read_information_pairs( targetFileList , args.EncoderName , args.LogLevel , args.Jobs )
+        if shard :
+            # the partial is written as files are read , merge puts the shards back into traverse order
+            partialFile = args.WriteFilePath + args.WriteFileName + '_shard%dof%d.partial' %shard
+            if not os.path.exists( os.path.dirname( partialFile ) or '.' ) :
+                os.makedirs( os.path.dirname( partialFile ) )
+            header = { 'Version' : cacheVersion , 'Shard' : shard[0] , 'ShardCount' : shard[1] ,
+                       'EncoderName' : args.EncoderName , 'LogLevel' : args.LogLevel , 'ReadFilePath' : args.ReadFilePath }
+            count = write_partial( targetPairIter , traverseIndexDict , partialFile , header )
+        else :
+            encInfoIter = ( encInfo for targetFile , encInfo in targetPairIter )
+            encInfoList = list( frameSpill.spill( encInfoIter ) if frameSpill is not None else encInfoIter )
+    if listCache is not None :
+        save_list_cache( args.FileListCache , listCache )
+    if shard :
+        print( 'GetInfo.py: Shard %d/%d of %d Files Written to %s' %( shard[0] , shard[1] , count , partialFile ) , file=sys.stderr )
+    else :
+        write_results( encInfoList , args , frameSpill )
+    if frameSpill is not None :
+        frameSpill.close()
+    if args.Profile :
+        write_profile( profileFile , args.ProfileTop )
+
+def write_results( EncInfoList , args , Spill = None ) :
+    '''
+    Sort encInfo of a Run and Write them to the Result Files , the Rollup and the Database args Asks for
+    Per-Frame Columns Spilled to FrameSpill Spill are Read back One encInfo at a Time by Each Stage
+    '''
+    with profile_stage( 'sort' ) :
+        encInfoList = delete_nonsequence( EncInfoList )
+        encInfoList = sort_sequence( encInfoList , args.CtcType )
+    with profile_stage( 'write' ) :
+        write_information( iter_frame_data( encInfoList , Spill ) if Spill is not None else encInfoList ,
+                           args.WriteFilePath , args.WriteFileType , args.WriteFileName , args.LogLevel , args.EncoderName == 'auto' )
+    if args.Rollup :
+        with profile_stage( 'rollup' ) :
+            write_rollup( rollup_information( iter_frame_data( encInfoList , Spill ) , args.RollupGop ) , args.WriteFilePath , args.WriteFileName , args.WriteFileType )
+    if args.Database :
+        with profile_stage( 'store' ) :
+            experiment = args.Experiment or os.path.basename( os.path.normpath( args.ReadFilePath ) )
+            if args.EncoderName != 'auto' :
+                store_information( iter_frame_data( encInfoList , Spill ) , args.Database , experiment , args.EncoderName , args.CtcType , args.LogLevel , args.ReadFilePath )
+            else :
+                # One Experiment Run per Identified Encoder , sort_sequence Keeps encInfo of an Encoder Together
+                for encName , encInfoGroup in itertools.groupby( iter_frame_data( encInfoList , Spill ) , key=lambda encInfo : encInfo.EncName ) :
+                    if encName :
+                        store_information( encInfoGroup , args.Database , experiment , encName , args.CtcType , args.LogLevel , args.ReadFilePath )
+
+def start_profile() :
+    '''
+    Turn on Profiling of Stages and Files for the Rest of the Run
+    '''
+    global profileReport
+    profileReport = { 'stages' : [] , 'files' : [] }
+
+@contextlib.contextmanager
+def profile_stage( Stage ) :
+    '''
+    Record Wall and CPU Time of Stage , with Totals of the Files Read during it , if Profiling is On
+    '''
+    if profileReport is None :
+        yield
+        return
+    fileIndex = len( profileReport['files'] )
+    wallTime , cpuTime = time.perf_counter() , time.process_time()
+    yield
+    stageStats = { 'stage' : Stage , 'wall' : time.perf_counter() - wallTime , 'cpu' : time.process_time() - cpuTime }
+    fileList = profileReport['files'][fileIndex:]
+    if fileList :
+        stageStats['files'] = len( fileList )
+        for key in ( 'bytes' , 'lines' , 'frames' ) :
+            stageStats[key] = sum( fileStats[key] for fileStats in fileList )
+        # CPU Time Spent in Worker Processes is only Seen through their Files
+        stageStats['fileCpu'] = sum( fileStats['cpu'] for fileStats in fileList )
+    profileReport['stages'].append( stageStats )
+
+@contextlib.contextmanager
+def profile_dump( ProfileDump , DumpFile ) :
+    '''
+    Dump cProfile Stats to DumpFile.prof or tracemalloc Top Lines to DumpFile.tracemalloc.txt of the Enclosed Code , if Profiling is On
+    '''
+    if profileReport is None or not ProfileDump :
+        yield
+        return
+    if ProfileDump == 'cProfile' :
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try :
+            yield
+        finally :
+            profiler.disable()
+            profiler.dump_stats( DumpFile + '.prof' )
+        return
+    import tracemalloc
+    tracemalloc.start()
+    try :
+        yield
+    finally :
+        snapshot = tracemalloc.take_snapshot()
+        peakSize = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        with open( DumpFile + '.tracemalloc.txt' , 'w' ) as fileHandle :
+            fileHandle.write( 'Peak Traced Memory: %d Bytes\n' %peakSize )
+            for statistic in snapshot.statistics( 'lineno' )[:50] :
+                fileHandle.write( '%s\n' %statistic )
+
+def write_profile( ProfileFile , ProfileTop ) :
+    '''
+    Write Profile Report to ProfileFile as JSON and a Short Summary to stderr
+    '''
+    import json
+    profileReport['slowest'] = sorted( profileReport['files'] , key=lambda fileStats : fileStats['wall'] , reverse=True )[:ProfileTop]
+    with open( ProfileFile , 'w' ) as fileHandle :
+        json.dump( profileReport , fileHandle , indent=1 )
+    print( 'GetInfo.py: Profile Written to %s' %ProfileFile , file=sys.stderr )
+    for stageStats in profileReport['stages'] :
+        print( '  %-9s wall %9.3fs  cpu %9.3fs' %( stageStats['stage'] , stageStats['wall'] , stageStats['cpu'] ) , end='' , file=sys.stderr )
+        if 'files' in stageStats :
+            print( '  files %d  MB %.1f  lines %d  frames %d  file cpu %.3fs' %( stageStats['files'] , stageStats['bytes'] / ( 1 << 20 ) ,
+                                                                               stageStats['lines'] , stageStats['frames'] , stageStats['fileCpu'] ) , end='' , file=sys.stderr )
+        print( file=sys.stderr )
+    for fileStats in profileReport['slowest'] :
+        print( '  %9.3fs  %s' %( fileStats['wall'] , fileStats['file'] ) , file=sys.stderr )
 
 
 if __name__ == '__main__':
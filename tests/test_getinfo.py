@@ -0,0 +1,83 @@
+'''
+Regression Tests of GetInfo.py : Every Run Mode Writes the Same Result Files as a Default Run on Logs from GenLogs.py
+'''
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+rootPath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+# Encoders Tested , with the Type of their Logs
+encoderFileTypeDict = { 'HM' : '.log' , 'VTM' : '.log' , 'VVENC' : '.txt' , 'X265' : '.csv' }
+# Result Files Compared between Runs
+writeFileTypeList = [ '.log' , '.txt' , '.csv' ]
+
+def run_script( *Argv ) :
+    '''
+    Run a Script of the Repository in a Fresh Interpreter , Failing the Test on a Nonzero Exit
+    '''
+    result = subprocess.run( [ sys.executable ] + list( Argv ) , cwd=rootPath , capture_output=True , text=True )
+    assert result.returncode == 0 , result.stderr
+
+def run_getinfo( EncType , ReadFilePath , WriteFilePath , *Argv ) :
+    '''
+    Run GetInfo.py on Logs of EncType under ReadFilePath , Writing result.* to WriteFilePath
+    '''
+    run_script( 'GetInfo.py' , '--EncoderName' , EncType , '--ReadFilePath' , os.path.join( ReadFilePath , EncType ) ,
+                '--ReadFileType' , encoderFileTypeDict[EncType] , '--WriteFilePath' , WriteFilePath , '--WriteFileName' , 'result' ,
+                '--WriteFileType' , *writeFileTypeList , '--LogLevel' , '2' , '--CtcType' , 'VVC' , *Argv )
+
+def read_results( WriteFilePath ) :
+    '''
+    :return resultDict : Dict < File Name : Content > of the Result Files under WriteFilePath
+    '''
+    return { fileName : open( os.path.join( WriteFilePath , fileName ) ).read() for fileName in sorted( os.listdir( WriteFilePath ) )
+             if os.path.splitext( fileName )[1] in writeFileTypeList }
+
+@pytest.fixture( scope='module' )
+def logPath( tmp_path_factory ) :
+    logPath = str( tmp_path_factory.mktemp( 'logs' ) )
+    run_script( 'GenLogs.py' , '--EncoderName' , *encoderFileTypeDict , '--WriteFilePath' , logPath + os.sep , '--FrameCount' , '9' , '--SubDirectoryCount' , '2' )
+    return logPath
+
+@pytest.fixture( params=list( encoderFileTypeDict ) )
+def baseline( request , logPath , tmp_path ) :
+    writeFilePath = str( tmp_path / 'default' ) + os.sep
+    run_getinfo( request.param , logPath , writeFilePath )
+    resultDict = read_results( writeFilePath )
+    assert set( resultDict ) == { 'result' + writeFileType for writeFileType in writeFileTypeList } | { 'result_frames.csv' }
+    return request.param , resultDict
+
+@pytest.mark.parametrize( 'Argv' , [ [ '--Jobs' , '2' ] , [ '--Pipeline' ] , [ '--Pipeline' , '--Jobs' , '2' ] , [ '--MaxMemory' , '0.001' ] ] )
+def test_mode( baseline , logPath , tmp_path , Argv ) :
+    encType , resultDict = baseline
+    writeFilePath = str( tmp_path / 'mode' ) + os.sep
+    run_getinfo( encType , logPath , writeFilePath , *Argv )
+    assert read_results( writeFilePath ) == resultDict
+
+def test_cache( baseline , logPath , tmp_path ) :
+    encType , resultDict = baseline
+    cacheFile = str( tmp_path / 'parse.cache' )
+    # the first run fills the cache , the second reads every file from it
+    for run in [ 'cold' , 'warm' ] :
+        writeFilePath = str( tmp_path / run ) + os.sep
+        run_getinfo( encType , logPath , writeFilePath , '--Cache' , '--CacheFile' , cacheFile )
+        assert read_results( writeFilePath ) == resultDict
+
+def test_shard_merge( baseline , logPath , tmp_path ) :
+    encType , resultDict = baseline
+    shardPath     = str( tmp_path / 'shard' ) + os.sep
+    writeFilePath = str( tmp_path / 'merge' ) + os.sep
+    for shardIndex in range( 3 ) :
+        run_getinfo( encType , logPath , shardPath , '--Shard' , '%d/3' %shardIndex )
+    run_script( 'GetInfo.py' , 'merge' , '--PartialFile' , *[ shardPath + 'result_shard%dof3.partial' %shardIndex for shardIndex in range( 3 ) ] ,
+                '--WriteFilePath' , writeFilePath , '--WriteFileName' , 'result' , '--WriteFileType' , *writeFileTypeList , '--CtcType' , 'VVC' )
+    assert read_results( writeFilePath ) == resultDict
+
+def test_missing_write_path( baseline , logPath , tmp_path ) :
+    encType , resultDict = baseline
+    writeFilePath = str( tmp_path / 'missing' / 'nested' ) + os.sep
+    run_getinfo( encType , logPath , writeFilePath , '--MaxMemory' , '0.001' )
+    assert read_results( writeFilePath ) == resultDict